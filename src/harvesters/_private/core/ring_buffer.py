@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------
+#
+# Copyright 2018 EMVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ----------------------------------------------------------------------------
+
+
+# Standard library imports
+from typing import Any, List, Optional
+
+# Related third party imports
+
+# Local application/library specific imports
+
+
+class RingBuffer:
+    """
+    Is a fixed-capacity FIFO that hands the filled buffers over from an
+    image acquisition worker to the consumer.
+
+    It holds a pre-allocated list of slots and two index counters that
+    grow monotonically; the occupancy is their difference so it can be
+    queried in constant time without taking any lock.
+
+    It does not lock anything by itself. If it does not drop the oldest
+    item, a single producer and a single consumer can put and get without
+    a lock because each of them moves only its own counter and storing a
+    list item or an attribute is atomic under the GIL. A :meth:`put` that
+    drops the oldest item moves the head counter from the producer side,
+    and :meth:`resize` and :meth:`clear` move both counters; the owner
+    must serialize them with :meth:`get`.
+    """
+    def __init__(self, capacity: int = 1, *, drop_oldest: bool = True):
+        """
+        :param capacity: Set the number of items that it can hold.
+        :param drop_oldest: Set :const:`True` if it should drop the oldest
+            item to make room for a new one when it is full; otherwise it
+            rejects the new item.
+        """
+        #
+        super().__init__()
+
+        #
+        if capacity < 1:
+            raise ValueError('The capacity must be > 0.')
+
+        #
+        self._slots = [None] * capacity
+        self._capacity = capacity
+        self._head = 0
+        self._tail = 0
+        self._drop_oldest = drop_oldest
+
+    def __len__(self):
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of items that it can hold.
+
+        :getter: Returns itself.
+        :type: int
+        """
+        return self._capacity
+
+    @property
+    def drop_oldest(self) -> bool:
+        """
+        :const:`True` if it drops the oldest item when a new item comes in
+        while it is full; otherwise it rejects the new item.
+
+        :getter: Returns itself.
+        :setter: Overwrites itself with the given value.
+        :type: bool
+        """
+        return self._drop_oldest
+
+    @drop_oldest.setter
+    def drop_oldest(self, value: bool):
+        self._drop_oldest = value
+
+    def full(self) -> bool:
+        return self._tail - self._head >= self._capacity
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+    def put(self, item: Any) -> Optional[Any]:
+        """
+        Appends the given item.
+
+        :param item: Set an item to append; it must not be :const:`None`.
+
+        :return: The item that has been dropped to keep the capacity,
+            i.e., the oldest one or the given one depending on the policy;
+            :const:`None` if it has not dropped anything.
+        """
+        dropped = None
+        if self.full():
+            if not self._drop_oldest:
+                return item
+            dropped = self.get()
+
+        #
+        tail = self._tail
+        self._slots[tail % self._capacity] = item
+        # Publish the item only after it has been stored:
+        self._tail = tail + 1
+
+        return dropped
+
+    def get(self) -> Optional[Any]:
+        """
+        Removes the oldest item.
+
+        :return: The oldest item; :const:`None` if it is empty.
+        """
+        head = self._head
+        if head == self._tail:
+            return None
+
+        #
+        index = head % self._capacity
+        item = self._slots[index]
+        self._slots[index] = None
+        # Release the slot only after it has been read:
+        self._head = head + 1
+
+        return item
+
+    def resize(self, capacity: int) -> List[Any]:
+        """
+        Changes the capacity keeping the stored items in order.
+
+        :param capacity: Set the number of items that it can hold.
+
+        :return: The items that have been dropped because they did not fit
+            in the new capacity; which ones are dropped follows the policy.
+        """
+        if capacity < 1:
+            raise ValueError('The capacity must be > 0.')
+
+        #
+        items = self.clear()
+        nr_overflows = max(len(items) - capacity, 0)
+        if self._drop_oldest:
+            dropped = items[:nr_overflows]
+            items = items[nr_overflows:]
+        else:
+            dropped = items[len(items) - nr_overflows:]
+            items = items[:len(items) - nr_overflows]
+
+        #
+        self._slots = items + [None] * (capacity - len(items))
+        self._capacity = capacity
+        self._head = 0
+        self._tail = len(items)
+
+        return dropped
+
+    def clear(self) -> List[Any]:
+        """
+        Removes all the stored items.
+
+        :return: The removed items, the oldest first.
+        """
+        items = []
+        while True:
+            item = self.get()
+            if item is None:
+                break
+            items.append(item)
+        return items
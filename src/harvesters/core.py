@@ -25,15 +25,13 @@ from datetime import datetime
 from enum import IntEnum
 import io
 from logging import Logger
-from math import ceil
+from functools import partial
 import ntpath
 import os
 import pathlib
-from queue import Queue
-from queue import Full, Empty
 import signal
 import sys
-from threading import Lock, Thread, Event
+from threading import Condition, Lock, Thread, Event
 from threading import current_thread, main_thread
 import time
 from typing import Union, List, Optional
@@ -50,7 +48,7 @@ from genicam.genapi import LogicalErrorException, RuntimeException
 from genicam.genapi import ChunkAdapterGeneric, ChunkAdapterU3V, \
     ChunkAdapterGEV
 
-from genicam.gentl import TimeoutException, \
+from genicam.gentl import TimeoutException, AbortException, \
     NotImplementedException, ParsingChunkDataException, NoDataException, \
     ErrorException, InvalidBufferException, InvalidParameterException, \
     NotAvailableException
@@ -64,15 +62,25 @@ from genicam.gentl import Buffer as Buffer_
 
 # Local application/library specific imports
 from harvesters._private.core.port import ConcretePort
+from harvesters._private.core.ring_buffer import RingBuffer
 from harvesters._private.core.statistics import Statistics
 from harvesters.util.logging import get_logger
 from harvesters.util.pfnc import dict_by_names, dict_by_ints
 from harvesters.util.pfnc import Dictionary, _PixelFormat
-from harvesters.util.pfnc import component_2d_formats
+from harvesters.util.pfnc import ArrayPool, expand_and_demosaic
+from harvesters.util.pfnc import DecodePlan, get_decode_plan, get_nr_bytes
+from harvesters.util.pfnc import get_pixel_format_info
 
 
+# The logger of the objects that are created for every delivered buffer:
+_logger = get_logger(name=__name__)
+
 _is_logging_buffer_manipulation = True if 'HARVESTERS_LOG_BUFFER_MANIPULATION' in os.environ else False
-_sleep_duration_default = 0.000001  # s
+_sleep_duration_default = 0.  # s
+# The period that the image acquisition worker waits for a new buffer; the
+# wait is cancelled when the image acquisition is stopped so that it can be
+# long:
+_timeout_for_event_wait = 1000  # ms
 
 
 def _deprecated(deprecated: object, alternative: object) -> None:
@@ -575,11 +583,13 @@ class MutexLocker:
 class _ImageAcquisitionThread(ThreadBase):
     def __init__(
             self, *,
-            image_acquire=None, logger: Optional[Logger] = None):
+            image_acquire=None, logger: Optional[Logger] = None,
+            worker=None):
         """
 
         :param image_acquire:
         :param logger:
+        :param worker: Set the worker method; the worker of the image acquirer is used if it is :const:`None`.
         """
         #
         assert image_acquire
@@ -590,7 +600,8 @@ class _ImageAcquisitionThread(ThreadBase):
 
         #
         self._ia = image_acquire
-        self._worker = self._ia.worker_image_acquisition
+        self._worker = worker if worker else \
+            self._ia.worker_image_acquisition
         self._sleep_duration = self._ia.sleep_duration
         self._thread = None
 
@@ -711,8 +722,11 @@ class _NativeThread(Thread):
         """
         while self._thread_owner.is_running():
             if self._worker:
+                # The worker blocks until a buffer is delivered so that it
+                # does not have to sleep unless it is asked to:
                 self._worker()
-                time.sleep(self._sleep_duration)
+                if self._sleep_duration:
+                    time.sleep(self._sleep_duration)
 
     def acquire(self):
         return self._thread_owner.mutex.acquire()
@@ -741,6 +755,8 @@ class ComponentBase:
     """
     Is a base class of various data component types.
     """
+    __slots__ = ('_buffer', '_data')
+
     def __init__(self, *, buffer=None):
         """
         :param buffer:
@@ -801,6 +817,8 @@ class ComponentUnknown(ComponentBase):
     Represents a data component that is classified as
     :const:`PART_DATATYPE_UNKNOWN` by the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(self):
         #
         super().__init__()
@@ -811,6 +829,11 @@ class Component2DImage(ComponentBase):
     Represents a data component that is classified as
     :const:`PART_DATATYPE_2D_IMAGE` by the GenTL Standard.
     """
+    __slots__ = (
+        '_logger', '_part', '_node_map', '_proxy', '_nr_components', '_raw',
+        '_plan'
+    )
+
     def __init__(
             self, *,
             buffer=None, part=None, node_map: Optional[NodeMap] = None,
@@ -827,64 +850,187 @@ class Component2DImage(ComponentBase):
         #
         super().__init__(buffer=buffer)
 
-        self._logger = logger or get_logger(name=__name__)
+        self._logger = logger or _logger
 
         #
         self._part = part
         self._node_map = node_map
-        proxy = Dictionary.get_proxy(symbolic=self.data_format)
-        self._nr_components = proxy.nr_components
-        self._data = self._to_np_array(proxy)
+        self._proxy = Dictionary.get_proxy_by_value(self.data_format_value)
+        self._nr_components = self._proxy.nr_components
+        # Note that the pixels will be decoded once they are requested:
+        self._raw = None
+        self._plan = None
 
     @staticmethod
     def _get_nr_bytes(pf_proxy: _PixelFormat, width: int, height: int) -> int:
+        return get_nr_bytes(pf_proxy, width, height)
+
+    def _recycle(self, buffer) -> bool:
+        # It can take over the next delivery only if the pixel format is
+        # the same:
+        if self.has_part():
+            return False
+        self._buffer = buffer
+        if Dictionary.get_proxy_by_value(self.data_format_value) \
+                is not self._proxy:
+            return False
+        # The decoded data of the previous delivery is not touched anymore;
+        # let the next one be decoded to it:
+        if self._data is not None and self._plan is not None:
+            self._plan.release(self._data)
         #
-        nr_bytes = height * width
+        self._data = None
+        self._raw = None
+        self._plan = None
+        return True
+
+    def _to_np_array(self):
+        return self.decode_plan.decode(self.raw)
+
+    def _get_plan(self) -> DecodePlan:
         #
-        if pf_proxy.alignment.is_packed():
-            nr_bytes *= pf_proxy.depth_in_byte
-            nr_bytes = ceil(nr_bytes)
-        else:
-            nr_bytes *= pf_proxy.alignment.unpacked_size
-            nr_bytes *= pf_proxy.nr_components
+        if self.has_part():
+            return get_decode_plan(
+                self._proxy, self._part.width, self._part.height,
+                self._part.x_padding, self._part.y_padding
+            )
+
+        return get_decode_plan(
+            self._proxy, *self._get_geometry(self._buffer, self._node_map)
+        )
+
+    @staticmethod
+    def _get_geometry(buffer, node_map: NodeMap):
         #
-        return int(nr_bytes)
+        exceptions = (
+            NotAvailableException, NotImplementedException,
+            InvalidParameterException
+        )
 
-    def _to_np_array(self, pf_proxy):
+        #
+        try:
+            w = buffer.width
+        except exceptions:
+            w = node_map.Width.value
+        try:
+            h = buffer.height
+        except exceptions:
+            h = node_map.Height.value
+        try:
+            padding_x = buffer.padding_x
+        except exceptions:
+            padding_x = 0
+        try:
+            padding_y = buffer.padding_y
+        except exceptions:
+            padding_y = 0
+
+        return w, h, padding_x, padding_y
+
+    @property
+    def decode_plan(self) -> DecodePlan:
+        """
+        The decode plan of the pixel format and the geometry of the image;
+        it is shared by the images of the same geometry.
+
+        :getter: Returns itself.
+        :type: :class:`DecodePlan`
+        """
+        if self._plan is None:
+            self._plan = self._get_plan()
+        return self._plan
+
+    def _get_raw(self):
         #
         if self.has_part():
             nr_bytes = self._part.data_size
         else:
-            #
-            exceptions = (
-                NotAvailableException, NotImplementedException,
-                InvalidParameterException
-            )
+            nr_bytes = self.decode_plan.nr_bytes
 
-            #
-            try:
-                w = self._buffer.width
-            except exceptions:
-                w = self._node_map.Width.value
-            try:
-                h = self._buffer.height
-            except exceptions:
-                h = self._node_map.Height.value
+        return numpy.frombuffer(
+            self._buffer.raw_buffer, count=int(nr_bytes),
+            dtype='uint8',
+            offset=self.data_offset
+        )
 
-            nr_bytes = self._get_nr_bytes(pf_proxy=pf_proxy, width=w, height=h)
+    @property
+    def raw(self) -> numpy.ndarray:
+        """
+        The undecoded image data as it is delivered; it is a 1D uint8 view
+        of the buffer and nothing is copied.
 
-            try:
-                padding_y = self._buffer.padding_y
-            except exceptions:
-                padding_y = 0
-            nr_bytes += padding_y
+        :getter: Returns itself.
+        :type: :class:`numpy.ndarray`
+        """
+        if self._raw is None:
+            self._raw = self._get_raw()
+        return self._raw
+
+    @property
+    def data(self) -> Optional[numpy.ndarray]:
+        """
+        The image data. The pixels are decoded at the first time it is
+        requested and then the decoded data is kept; you do not pay for
+        the decoding if you do not touch it. Note that you have to request
+        it before you queue the buffer.
 
+        :getter: Returns itself.
+        :type: :class:`numpy.ndarray`
+        """
+        if self._data is None:
+            self._data = self._to_np_array()
+        return self._data
+
+    def demosaic(
+            self, method: str = 'bilinear',
+            out: Optional[numpy.ndarray] = None, order: str = 'RGB',
+            pool: Optional[ArrayPool] = None) -> numpy.ndarray:
+        """
+        Returns the color image that is demosaiced from the Bayer data.
+        The data is expanded and demosaiced in a single call so that the
+        expanded mosaic does not have to be kept.
+
+        :param method: Set 'bilinear', 'nearest', or 'superpixel'.
+        :param out: Set an array to write the color image.
+        :param order: Set 'RGB' or 'BGR'.
+        :param pool: Set an :class:`ArrayPool` object to take the scratch array from that is used to expand packed data. The pool of the decode plan is used if it is :const:`None`.
+
+        :return: The color image.
+        :rtype: numpy.ndarray
+        """
+        return expand_and_demosaic(
+            self._proxy, self.raw, self.width, self.height, method=method,
+            out=out, order=order, pool=pool if pool else self.decode_plan.pool,
+            x_padding=self.decode_plan.x_padding
+        )
+
+    def decode_roi(
+            self, x: int, y: int, width: int, height: int,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Returns the given region of the image; only the lines and the
+        columns that the region covers are decoded. The X padding at the
+        end of every line is taken into account.
+
+        :param x: Set the X coordinate of the top left corner of the region.
+        :param y: Set the Y coordinate of the top left corner of the region.
+        :param width: Set the width of the region.
+        :param height: Set the height of the region.
+        :param out: Set an array to write the region.
+
+        :return: The region shaped as (height, width, components); the components axis is dropped if there is only one.
+        :rtype: numpy.ndarray
+        """
+        # Note that the raw data does not cover the X padding:
+        count = self._part.data_size if self.has_part() else -1
         array = numpy.frombuffer(
-            self._buffer.raw_buffer, count=int(nr_bytes),
-            dtype='uint8',
+            self._buffer.raw_buffer, count=int(count), dtype='uint8',
             offset=self.data_offset
         )
-        return pf_proxy.expand(array)
+        return self._proxy.expand_roi(
+            array, self.width, self.height, x, y, width, height,
+            x_padding=self.x_padding, out=out
+        )
 
     def represent_pixel_location(self) -> Optional[numpy.ndarray]:
         """
@@ -892,7 +1038,8 @@ class Component2DImage(ComponentBase):
         which is defined by PFNC, of the original image data.
 
         You may use the returned NumPy array for a calculation to map the
-        original image to another format.
+        original image to another format. The array of a planar format is
+        shaped as (components, height, width).
 
         :return: A NumPy array that represents the 2D pixel location.
         :rtype: numpy.ndarray
@@ -901,10 +1048,17 @@ class Component2DImage(ComponentBase):
             return None
 
         #
-        return self._data.reshape(
-            self.height + self.y_padding,
-            int(self.width * self._nr_components + self.x_padding)
-        )
+        if self._proxy.is_planar:
+            nr_planes = int(self._nr_components)
+            return self.data[:nr_planes * self.height * self.width].reshape(
+                nr_planes, self.height, self.width
+            )
+
+        # Note that a bit packed format can be expanded to a few more
+        # values than the pixels because of the last byte:
+        nr_rows = self.height + self.y_padding
+        nr_columns = int(self.width * self._nr_components + self.x_padding)
+        return self.data[:nr_rows * nr_columns].reshape(nr_rows, nr_columns)
 
     @property
     def num_components_per_pixel(self) -> float:
@@ -1102,6 +1256,8 @@ class Buffer:
     Note that it will never be necessary to create this object by yourself
     in general.
     """
+    __slots__ = ('_logger', '_buffer', '_node_map', '_payload')
+
     def __init__(
             self, *,
             buffer=None, node_map: Optional[NodeMap] = None,
@@ -1117,7 +1273,7 @@ class Buffer:
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
+        self._logger = logger or _logger
 
         #
         super().__init__()
@@ -1194,6 +1350,16 @@ class Buffer:
 
         return frequency
 
+    @property
+    def data_stream_id(self) -> str:
+        """
+        The ID of the data stream that delivered the buffer.
+
+        :getter: Returns itself.
+        :type: str
+        """
+        return self._buffer.parent.id_
+
     @property
     def payload_type(self):
         """
@@ -1243,6 +1409,15 @@ class Buffer:
 
         self._buffer.parent.queue_buffer(self._buffer)
 
+    def _recycle(self, buffer) -> None:
+        # Takes over the next delivery of the same GenTL buffer; the payload
+        # is built again only if it can't be reused:
+        self._buffer = buffer
+        if self._payload is None or not self._payload._recycle(buffer):
+            self._payload = self._build_payload(
+                buffer=buffer, node_map=self._node_map, logger=self._logger
+            )
+
     @staticmethod
     def _build_payload(
             *,
@@ -1298,12 +1473,73 @@ class Buffer:
         return payload
 
 
+class Frame:
+    """
+    Is provided by an :class:`ImageAcquirer` object when you call its
+    :meth:`~harvesters.core.ImageAcquirer.fetch_frame` method. It holds a
+    decoded image and the metadata of the buffer that delivered it as plain
+    attributes; no payload or component object is built.
+
+    Note that the image can be a view of the buffer; queue the frame once
+    you have done with it, or give an output array to
+    :meth:`~harvesters.core.ImageAcquirer.fetch_frame` so that you can
+    queue it right away.
+    """
+    __slots__ = (
+        'data', 'frame_id', 'timestamp', 'width', 'height', 'data_format',
+        'buffer'
+    )
+
+    def __init__(
+            self, data: numpy.ndarray, frame_id: int, timestamp: int,
+            width: int, height: int, data_format: str, buffer: Buffer_):
+        """
+        :param data: The image shaped as (height, width, components), or (components, height, width) if it is a planar format; the components axis is dropped if there is only one.
+        :param frame_id: The frame ID.
+        :param timestamp: The timestamp. The unit is GenTL Producer dependent.
+        :param width: The width of the image.
+        :param height: The height of the image.
+        :param data_format: The pixel format as string.
+        :param buffer: The GenTL Buffer module that delivered the image; it is used to queue the buffer.
+        """
+        self.data = data
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self.width = width
+        self.height = height
+        self.data_format = data_format
+        self.buffer = buffer
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.queue()
+
+    def __repr__(self):
+        return 'Frame #{0}: {1} x {2}, {3}'.format(
+            self.frame_id, self.width, self.height, self.data_format
+        )
+
+    def queue(self) -> None:
+        """
+        Queues the buffer to prepare for the upcoming image acquisition. The
+        image is obsolete once the buffer is queued unless it has been
+        written to an output array.
+
+        :return: None.
+        """
+        self.buffer.parent.queue_buffer(self.buffer)
+
+
 class PayloadBase:
     """
     Is a base class of various payload types. The types are defined by the
     GenTL Standard. In general, you should not have to design a class that
     derives from this base class.
     """
+    __slots__ = ('_logger', '_buffer', '_components')
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1316,7 +1552,7 @@ class PayloadBase:
         assert buffer
 
         #
-        self._logger = logger or get_logger(name=__name__)
+        self._logger = logger or _logger
 
         #
         super().__init__()
@@ -1357,8 +1593,8 @@ class PayloadBase:
             else:
                 raise
 
-        symbolic = dict_by_ints[data_format]
-        if symbolic in component_2d_formats:
+        info = get_pixel_format_info(data_format)
+        if info is not None and info.is_2d:
             return Component2DImage(
                 buffer=buffer, part=part, node_map=node_map,
                 logger=self._logger
@@ -1366,6 +1602,11 @@ class PayloadBase:
 
         return None
 
+    def _recycle(self, buffer) -> bool:
+        # A sub-class reimplements it if it can take over the next delivery
+        # of the same GenTL buffer:
+        return False
+
     @property
     def components(self):
         """
@@ -1384,6 +1625,8 @@ class PayloadUnknown(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_UNKNOWN`
     by the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1401,10 +1644,7 @@ class PayloadUnknown(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
 
 class PayloadImage(PayloadBase):
@@ -1413,6 +1653,8 @@ class PayloadImage(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_IMAGE` by
     the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1430,10 +1672,7 @@ class PayloadImage(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
         # Build data components.
         self._components.append(
@@ -1442,6 +1681,19 @@ class PayloadImage(PayloadBase):
             )
         )
 
+    def _recycle(self, buffer) -> bool:
+        #
+        if buffer.payload_type not in (
+                PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_IMAGE,
+                PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_CHUNK_DATA):
+            return False
+        component = self._components[0]
+        if component is None or not component._recycle(buffer):
+            return False
+        #
+        self._buffer = buffer
+        return True
+
     def __repr__(self):
         return '{0}'.format(self.components[0].__repr__())
 
@@ -1452,6 +1704,8 @@ class PayloadRawData(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_RAW_DATA`
     by the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1469,10 +1723,7 @@ class PayloadRawData(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
 
 class PayloadFile(PayloadBase):
@@ -1481,6 +1732,8 @@ class PayloadFile(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_FILE` by
     the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1491,10 +1744,7 @@ class PayloadFile(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
 
 class PayloadJPEG(PayloadBase):
@@ -1503,6 +1753,8 @@ class PayloadJPEG(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_JPEG` by
     the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1520,10 +1772,7 @@ class PayloadJPEG(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
 
 class PayloadJPEG2000(PayloadBase):
@@ -1532,6 +1781,8 @@ class PayloadJPEG2000(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_JPEG2000`
     by the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1549,10 +1800,7 @@ class PayloadJPEG2000(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
 
 class PayloadH264(PayloadBase):
@@ -1561,6 +1809,8 @@ class PayloadH264(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_H264` by
     the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1578,10 +1828,7 @@ class PayloadH264(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
 
 class PayloadChunkOnly(PayloadBase):
@@ -1590,6 +1837,8 @@ class PayloadChunkOnly(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_CHUNK_ONLY`
     by the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer: Optional[Buffer] = None,
@@ -1600,10 +1849,7 @@ class PayloadChunkOnly(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
 
 
 class PayloadMultiPart(PayloadBase):
@@ -1612,6 +1858,8 @@ class PayloadMultiPart(PayloadBase):
     :const:`genicam.gentl.PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_MULTI_PART`
     by the GenTL Standard.
     """
+    __slots__ = ()
+
     def __init__(
             self, *,
             buffer=None, node_map: Optional[NodeMap] = None,
@@ -1628,10 +1876,7 @@ class PayloadMultiPart(PayloadBase):
         assert node_map
 
         #
-        self._logger = logger or get_logger(name=__name__)
-
-        #
-        super().__init__(buffer=buffer, logger=self._logger)
+        super().__init__(buffer=buffer, logger=logger)
         #
 
         # Build data components.
@@ -1652,9 +1897,97 @@ class PayloadMultiPart(PayloadBase):
         return ret
 
 
+class BufferPool:
+    """
+    Keeps raw buffers that are not announced to any data stream so that
+    an :class:`ImageAcquirer` object can reuse them instead of allocating
+    and zero-filling new ones every time it arms its data streams. An
+    :class:`ImageAcquirer` object that has a pool also keeps its buffers
+    announced over stop/start cycles; see
+    :attr:`~harvesters.core.ImageAcquirer.buffer_pool`.
+
+    A pool can be shared by :class:`ImageAcquirer` objects. It keeps the
+    buffers of every size that has been returned to it; call
+    :meth:`clear` to let them go.
+    """
+    def __init__(self):
+        #
+        super().__init__()
+
+        #
+        self._raw_buffers = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(buffers) for buffers in self._raw_buffers.values())
+
+    def acquire(self, num_buffers: int, size: int) -> List[bytes]:
+        """
+        Provides raw buffers; the pooled ones are provided first and the
+        rest are newly allocated.
+
+        :param num_buffers: Set the number of buffers.
+        :param size: Set the size of each buffer in bytes.
+
+        :return: The raw buffers.
+        :rtype: List[bytes]
+        """
+        if num_buffers < 0 or size < 0:
+            raise ValueError(
+                'The number of buffers and the size must be >= 0.'
+            )
+
+        #
+        with self._lock:
+            pooled = self._raw_buffers.get(size, [])
+            raw_buffers = [
+                pooled.pop() for _ in range(min(num_buffers, len(pooled)))
+            ]
+            if not pooled:
+                self._raw_buffers.pop(size, None)
+
+        #
+        raw_buffers.extend(
+            ImageAcquirer._create_raw_buffers(
+                num_buffers - len(raw_buffers), size
+            )
+        )
+        return raw_buffers
+
+    def release(self, raw_buffers: List[bytes]) -> None:
+        """
+        Takes raw buffers back so that they can be provided again; they
+        must not be announced to any data stream.
+
+        :param raw_buffers: Set the raw buffers.
+
+        :return: None.
+        """
+        with self._lock:
+            for raw_buffer in raw_buffers:
+                self._raw_buffers.setdefault(
+                    len(raw_buffer), []
+                ).append(raw_buffer)
+
+    def clear(self) -> None:
+        """
+        Lets all the pooled buffers go.
+
+        :return: None.
+        """
+        with self._lock:
+            self._raw_buffers.clear()
+
+
 class Callback:
     """
     Is used as a base class to implement user defined callback behavior.
+
+    Note that :meth:`emit` can be called from several threads at the same
+    time; the callback for
+    :attr:`ImageAcquirer.Events.NEW_BUFFER_AVAILABLE` is called by the
+    thread of every data stream when there are multiple data streams.
     """
     def emit(self, context: Optional[object] = None) -> None:
         """
@@ -1770,6 +2103,18 @@ class ImageAcquirer:
         self._data_streams = []
         self._event_new_buffer_managers = []
 
+        # Every data stream has its own queue of the filled buffers:
+        self._num_filled_buffers_to_hold = 1
+        self._queues = []
+        # Guards the queues and wakes up the consumers when a buffer arrives
+        # or the image acquisition is stopped; it is independent from the
+        # mutex of the image acquisition thread:
+        self._buffer_available = Condition(Lock())
+        # The index of the data stream that fetch_any looks at first:
+        self._next_stream_index = 0
+        # Decides which buffer a full queue drops:
+        self._buffer_handling_mode = 'OldestFirstOverwrite'
+
         self._create_ds_at_connection = True
         if self._create_ds_at_connection:
             self._setup_data_streams()
@@ -1777,14 +2122,13 @@ class ImageAcquirer:
         #
         self._profiler = profiler
 
-        #
-        self._num_filled_buffers_to_hold = 1
-        self._queue = Queue(maxsize=self._num_filled_buffers_to_hold)
-
         #
         self._sleep_duration = sleep_duration
         self._thread_image_acquisition = self._create_acquisition_thread()
 
+        # The threads that serve the data streams other than the first one:
+        self._stream_threads = []
+
         # Prepare handling the SIGINT event:
         self._threads = []
         self._threads.append(self._thread_image_acquisition)
@@ -1806,14 +2150,25 @@ class ImageAcquirer:
 
         #
         self._statistics = Statistics()
+        # The workers of the data streams count the images concurrently:
+        self._statistics_lock = Lock()
 
-        #
+        # The announced buffers of each data stream and the raw buffers
+        # that back them:
         self._announced_buffers = []
+        self._raw_buffers = []
+        self._buffer_pool = None
+        # The Buffer objects that are recycled; they are looked up by the
+        # GenTL buffer that they wrap:
+        self._recycles_buffer_objects = False
+        self._buffer_objects = {}
+        # The GenTL buffers that have been handed over to the client; they
+        # are looked up by the data stream and the context:
+        self._borrowed_buffers = {}
 
         #
         self._has_acquired_1st_image = False
         self._is_acquiring = False
-        self._buffer_handling_mode = 'OldestFirstOverwrite'
 
         # Determine the default value:
         num_buffers_default = 16
@@ -1969,6 +2324,61 @@ class ImageAcquirer:
     @buffer_handling_mode.setter
     def buffer_handling_mode(self, value):
         self._buffer_handling_mode = value
+        with self._buffer_available:
+            for ring_buffer in self._queues:
+                ring_buffer.drop_oldest = self._drops_oldest_buffer()
+
+    def _drops_oldest_buffer(self) -> bool:
+        # We want to keep the latest ones in the overwrite mode:
+        return self._buffer_handling_mode == 'OldestFirstOverwrite'
+
+    @property
+    def recycles_buffer_objects(self) -> bool:
+        """
+        :const:`True` if a :class:`Buffer` object is recycled when the GenTL
+        buffer that it wraps is delivered again; it saves creating the
+        objects for every image and the decoded image data is reused too.
+        Note that a :class:`Buffer` object and its image data must not be
+        touched once it has been queued if it is :const:`True`.
+
+        :getter: Returns itself.
+        :setter: Overwrites itself with the given value.
+        :type: bool
+        """
+        return self._recycles_buffer_objects
+
+    @recycles_buffer_objects.setter
+    def recycles_buffer_objects(self, value: bool):
+        self._recycles_buffer_objects = value
+        if not value:
+            self._buffer_objects.clear()
+
+    @property
+    def buffer_pool(self) -> Optional[BufferPool]:
+        """
+        The pool of the raw buffers that are announced to the data streams.
+        If it is set, the buffers stay announced when image acquisition
+        stops and they are reused in the next session: only the shortfall
+        or the surplus is announced or revoked if the number of buffers
+        has changed, and all of them are replaced if the payload size has
+        changed. The revoked buffers go back to the pool. If it is
+        :const:`None`, the buffers are newly allocated every time image
+        acquisition starts and revoked when it stops.
+
+        Note that the fetched buffers must be queued before image
+        acquisition stops if it is set because they stay announced; if
+        any of them has not been queued, a warning is logged and all the
+        buffers are revoked instead of being kept.
+
+        :getter: Returns itself.
+        :setter: Overwrites itself with the given value.
+        :type: BufferPool
+        """
+        return self._buffer_pool
+
+    @buffer_pool.setter
+    def buffer_pool(self, value: Optional[BufferPool]):
+        self._buffer_pool = value
 
     @property
     def num_buffers(self) -> int:
@@ -1999,7 +2409,8 @@ class ImageAcquirer:
     def sleep_duration(self) -> float:
         """
         The duration that lets the image acquisition thread sleeps at
-        every execution. The unit is [ms].
+        every execution; 0 by default because the worker blocks until a
+        buffer is delivered. The unit is [ms].
 
         :getter: Returns itself.
         :type: float
@@ -2039,26 +2450,12 @@ class ImageAcquirer:
             # Update the value:
             self._num_filled_buffers_to_hold = value
 
-            # Move the stored buffers to the temporary list object:
-            buffers = []
-            while not self._queue.empty():
-                buffers.append(
-                    self._queue.get_nowait()
-                )
-
-            # Newly create a Queue object:
-            self._queue = Queue(maxsize=self._num_filled_buffers_to_hold)
-
-            # Move the buffers back to the newly created Queue object:
-            while len(buffers) > 0:
-                try:
-                    self._queue.put(buffers.pop(0))
-                except Full as e:
-                    # Can't put it because the queue is full.
-                    # Discard the buffer:
-                    self._logger.debug(e, exc_info=True)
-                    buffer = buffers.pop(0)
-                    buffer.parent.queue_buffer(buffer)
+            with self._buffer_available:
+                for ring_buffer in self._queues:
+                    # Resize it in place; discard/queue the buffers that
+                    # do not fit in it anymore:
+                    for buffer in ring_buffer.resize(value):
+                        buffer.parent.queue_buffer(buffer)
 
         else:
             raise ValueError(
@@ -2074,7 +2471,7 @@ class ImageAcquirer:
         :getter: Returns itself.
         :type: int
         """
-        return self._queue.qsize()
+        return sum(len(ring_buffer) for ring_buffer in self._queues)
 
     @property
     def data_streams(self) -> List[DataStream]:
@@ -2236,6 +2633,13 @@ class ImageAcquirer:
             self._event_new_buffer_managers.append(
                 EventManagerNewBuffer(event_token)
             )
+            with self._buffer_available:
+                self._queues.append(
+                    RingBuffer(
+                        self._num_filled_buffers_to_hold,
+                        drop_oldest=self._drops_oldest_buffer()
+                    )
+                )
 
     def _get_port_connected_node_map(
             self, *,
@@ -2417,7 +2821,7 @@ class ImageAcquirer:
                 self._setup_data_streams()
 
             #
-            for ds in self._data_streams:
+            for i, ds in enumerate(self._data_streams):
                 if ds.defines_payload_size():
                     buffer_size = ds.payload_size
                 else:
@@ -2437,20 +2841,14 @@ class ImageAcquirer:
                 # the number of images to acquire:
                 num_buffers = max(num_buffers, self._num_images_to_acquire)
 
-                raw_buffers = self._create_raw_buffers(
-                    num_buffers, buffer_size
-                )
-
-                buffer_tokens = self._create_buffer_tokens(
-                    raw_buffers
-                )
-
-                self._announced_buffers = self._announce_buffers(
-                    data_stream=ds, _buffer_tokens=buffer_tokens
+                # Every data stream has its own buffers:
+                announced_buffers = self._prepare_buffers(
+                    data_stream=ds, index=i, num_buffers=num_buffers,
+                    buffer_size=buffer_size
                 )
 
                 self._queue_announced_buffers(
-                    data_stream=ds, buffers=self._announced_buffers
+                    data_stream=ds, buffers=announced_buffers
                 )
 
                 # We're ready to start image acquisition. Lock the device's
@@ -2473,6 +2871,16 @@ class ImageAcquirer:
             if run_in_background:
                 if self.thread_image_acquisition:
                     self.thread_image_acquisition.start()
+                # Every other data stream has a thread of its own so that
+                # a busy stream does not have to wait for idle ones:
+                for i in range(1, len(self._event_new_buffer_managers)):
+                    thread = _ImageAcquisitionThread(
+                        image_acquire=self, logger=self._logger,
+                        worker=partial(self._acquire_buffer, i)
+                    )
+                    thread.start()
+                    self._stream_threads.append(thread)
+                    self._threads.append(thread)
 
         # Start image acquisition on the device side:
         self.remote_device.node_map.AcquisitionStart.execute()
@@ -2486,123 +2894,114 @@ class ImageAcquirer:
 
     def worker_image_acquisition(self) -> None:
         """
-        The worker method of the image acquisition task.
+        The worker method of the image acquisition task. It serves the first
+        data stream; the other data streams are served by threads of their
+        own.
 
         :return: None
         """
-        #
-        queue = self._queue
+        self._acquire_buffer(0)
+
+    def _acquire_buffer(self, index: int) -> None:
+        # The event can be waited for as long as a buffer is not delivered
+        # because the wait is cancelled on stop:
+        timeout = max(
+            self._timeout_for_image_acquisition, _timeout_for_event_wait
+        )
+        event_manager = self._event_new_buffer_managers[index]
 
         #
-        for event_manager in self._event_new_buffer_managers:
-            try:
-                if self.is_acquiring():
-                    event_manager.update_event_data(
-                        self._timeout_for_image_acquisition
-                    )
-                else:
-                    return
-            except TimeoutException:
-                continue
+        try:
+            if self.is_acquiring():
+                event_manager.update_event_data(timeout)
             else:
-                # Check if the delivered buffer is complete:
-                if event_manager.buffer.is_complete():
-                    #
+                return
+        except (TimeoutException, AbortException):
+            # It has been cancelled if it's been aborted:
+            return
+        else:
+            # The client has queued it if it's been delivered again:
+            self._take_back_buffer(event_manager.buffer)
+
+            # Check if the delivered buffer is complete:
+            if event_manager.buffer.is_complete():
+                #
+                if _is_logging_buffer_manipulation:
+                    self._logger.debug(
+                        'Acquired Buffer module #{0}'
+                        ' containing frame #{1}'
+                        ' from DataStream module {2}'
+                        ' of Device module {3}'
+                        '.'.format(
+                            event_manager.buffer.context,
+                            event_manager.buffer.frame_id,
+                            event_manager.parent.id_,
+                            event_manager.parent.parent.id_
+                        )
+                    )
+                #
+                # Get the latest buffer:
+                _buffer = event_manager.buffer
+
+                # Then update the statistics using the buffer:
+                self._update_statistics(_buffer)
+
+                # The hand-off is serialized with the consumers by the lock
+                # that they wait on; we don't need the mutex of the thread
+                # here:
+                with self._buffer_available:
+                    if not self._is_acquiring:
+                        return
+
+                    # Then append it to the ring buffer which the user
+                    # fetches later; it drops either the oldest one or the
+                    # latest one to keep its capacity. Note that dropping
+                    # the oldest one takes it from the consumer side so it
+                    # must not be done without the lock:
+                    dropped = self._queues[index].put(_buffer)
+                    if dropped is not _buffer:
+                        self._buffer_available.notify_all()
+
+                if dropped is not None:
                     if _is_logging_buffer_manipulation:
                         self._logger.debug(
-                            'Acquired Buffer module #{0}'
+                            'Queued Buffer module #{0}'
                             ' containing frame #{1}'
-                            ' from DataStream module {2}'
+                            ' to DataStream module {2}'
                             ' of Device module {3}'
                             '.'.format(
-                                event_manager.buffer.context,
-                                event_manager.buffer.frame_id,
-                                event_manager.parent.id_,
-                                event_manager.parent.parent.id_
+                                dropped.context,
+                                dropped.frame_id,
+                                dropped.parent.id_,
+                                dropped.parent.parent.id_
                             )
                         )
-                    #
-                    if self.buffer_handling_mode == 'OldestFirstOverwrite':
-                        # We want to keep the latest ones:
-                        with MutexLocker(self.thread_image_acquisition):
-                            if not self._is_acquiring:
-                                return
-
-                            if queue.full():
-                                # Pick up the oldest one:
-                                _buffer = queue.get()
-
-                                if _is_logging_buffer_manipulation:
-                                    self._logger.debug(
-                                        'Queued Buffer module #{0}'
-                                        ' containing frame #{1}'
-                                        ' to DataStream module {2}'
-                                        ' of Device module {3}'
-                                        '.'.format(
-                                            _buffer.context,
-                                            _buffer.frame_id,
-                                            _buffer.parent.id_,
-                                            _buffer.parent.parent.id_
-                                        )
-                                    )
-                                # Then discard/queue it:
-                                _buffer.parent.queue_buffer(_buffer)
-
-                            # Get the latest buffer:
-                            _buffer = event_manager.buffer
-
-                            # Then append it to the list which the user
-                            # fetches later:
-                            queue.put(_buffer)
-
-                            # Then update the statistics using the buffer:
-                            self._update_statistics(_buffer)
-                    else:
-                        # Get the latest buffer:
-                        _buffer = event_manager.buffer
-
-                        # Then update the statistics using the buffer:
-                        self._update_statistics(_buffer)
-
-                        # We want to keep the oldest ones:
-                        with MutexLocker(self.thread_image_acquisition):
-                            #
-                            if not self._is_acquiring:
-                                return
-
-                            #
-                            if queue.full():
-                                # We have not space to keep the latest one.
-                                # Discard/queue the latest buffer:
-                                _buffer.parent.queue_buffer(_buffer)
-                            else:
-                                # Just append it to the list:
-                                if queue:
-                                    queue.put(_buffer)
-
-                    # Call the registered callback:
-                    self._emit_callbacks(self.Events.NEW_BUFFER_AVAILABLE)
+                    # Then discard/queue it:
+                    dropped.parent.queue_buffer(dropped)
 
-                    #
-                    self._update_num_images_to_acquire()
+                # Call the registered callback:
+                self._emit_callbacks(self.Events.NEW_BUFFER_AVAILABLE)
 
-                else:
-                    # Discard/queue the latest buffer when incomplete
-                    self._logger.debug(
-                        'Acquired buffer is complete: {0}'.format(
-                            event_manager.buffer.is_complete()
-                        )
+                #
+                self._update_num_images_to_acquire()
+
+            else:
+                # Discard/queue the latest buffer when incomplete
+                self._logger.debug(
+                    'Acquired buffer is complete: {0}'.format(
+                        event_manager.buffer.is_complete()
                     )
+                )
 
-                    # Queue the incomplete buffer; we have nothing to do
-                    # with it:
-                    data_stream = event_manager.buffer.parent
-                    data_stream.queue_buffer(event_manager.buffer)
+                # Queue the incomplete buffer; we have nothing to do
+                # with it:
+                data_stream = event_manager.buffer.parent
+                data_stream.queue_buffer(event_manager.buffer)
 
-                    #
-                    with MutexLocker(self.thread_image_acquisition):
-                        if not self._is_acquiring:
-                            return
+                #
+                with MutexLocker(self.thread_image_acquisition):
+                    if not self._is_acquiring:
+                        return
 
     def _update_chunk_data(self, buffer: Optional[Buffer] = None):
         try:
@@ -2657,14 +3056,15 @@ class ImageAcquirer:
     def fetch_buffer(
             self, *,
             timeout: float = 0, is_raw: bool = False,
-            cycle_s: float = None) -> Optional[Buffer]:
+            cycle_s: float = None, stream: int = 0) -> Optional[Buffer]:
         """
         Fetches an available :class:`Buffer` object that has been filled up
         with a single image and returns it.
 
         :param timeout: Set the period that defines the expiration for an available buffer delivery; if no buffer is fetched within the period then TimeoutException will be raised. The unit is [s].
         :param is_raw: Set :const:`True` if you need a raw GenTL Buffer module; note that you'll have to manipulate the object by yourself.
-        :param cycle_s: Set the cycle that defines how frequently check if a buffer is available. The unit is [s].
+        :param cycle_s: Not used anymore; a buffer is handed over as soon as it is available.
+        :param stream: Set the index of the data stream to fetch the buffer from.
 
         :return: A :class:`Buffer` object.
         :rtype: Buffer
@@ -2675,98 +3075,269 @@ class ImageAcquirer:
             raise TimeoutException
 
         #
-        _buffer = None
-
-        watch_timeout = True if timeout > 0 else False
-        base = time.time()
+        if not 0 <= stream < len(self._event_new_buffer_managers):
+            raise ValueError(
+                '{0} is not an index of the data streams.'.format(stream)
+            )
 
+        #
         if self.thread_image_acquisition and \
                 self.thread_image_acquisition.is_running():
             # Case #1:
-            if cycle_s:
-                # Use the specified cycle:
-                _cycle_s = cycle_s
-            else:
-                # Use the library default value:
-                _cycle_s = 0.0001
+            _buffer = self._wait_for_buffer(timeout, [stream])
+        else:
+            # Case #2:
+            _buffer = self._wait_for_event(timeout, [stream])
 
-            while _buffer is None:
-                # Expired the suggested period; give it up:
-                """
-                if watch_timeout and (time.time() - base) > timeout:
-                    raise TimeoutException
-                """
+        return self._hand_over_buffer(_buffer, is_raw)
 
-                with MutexLocker(self.thread_image_acquisition):
-                    try:
-                        _buffer = self._queue.get(
-                            block=True, timeout=_cycle_s
-                        )
-                    except Empty:
-                        continue
+    def fetch_any(
+            self, *,
+            timeout: float = 0, is_raw: bool = False) -> Optional[Buffer]:
+        """
+        Fetches an available :class:`Buffer` object from any of the data
+        streams and returns it; the data streams are looked at in turn so
+        that none of them is left behind. See
+        :attr:`Buffer.data_stream_id` to know where it comes from.
+
+        Note that every data stream is served by a thread of its own if
+        image acquisition runs in the background; a callback for
+        :attr:`Events.NEW_BUFFER_AVAILABLE` can then be called from several
+        threads at the same time.
+
+        :param timeout: Set the period that defines the expiration for an available buffer delivery; if no buffer is fetched within the period then TimeoutException will be raised. The unit is [s].
+        :param is_raw: Set :const:`True` if you need a raw GenTL Buffer module; note that you'll have to manipulate the object by yourself.
+
+        :return: A :class:`Buffer` object.
+        :rtype: Buffer
+        """
+        #
+        if not self.is_acquiring():
+            raise TimeoutException
+
+        # Start from the data stream next to the one that was served last:
+        nr_streams = len(self._event_new_buffer_managers)
+        first = self._next_stream_index % nr_streams
+        indices = [(first + i) % nr_streams for i in range(nr_streams)]
+
+        #
+        if self.thread_image_acquisition and \
+                self.thread_image_acquisition.is_running():
+            _buffer = self._wait_for_buffer(timeout, indices)
         else:
-            # Case #2:
-            #
-            event_manager = self._event_new_buffer_managers[0]
-            while _buffer is None:
-                # Expired the suggested period; give it up:
-                if watch_timeout and (time.time() - base) > timeout:
+            # Note that the data streams are polled in turn then:
+            _buffer = self._wait_for_event(timeout, indices)
+
+        return self._hand_over_buffer(_buffer, is_raw)
+
+    def _hand_over_buffer(self, _buffer, is_raw: bool):
+        #
+        self._borrowed_buffers[_buffer.parent.id_, _buffer.context] = _buffer
+
+        #
+        self._update_chunk_data(buffer=_buffer)
+
+        # Then update the statistics using the buffer:
+        self._update_statistics(_buffer)
+
+        #
+        if not is_raw:
+            _buffer = self._create_buffer_object(_buffer)
+
+        #
+        self._update_num_images_to_acquire()
+
+        return _buffer
+
+    def _take_back_buffer(self, _buffer) -> None:
+        self._borrowed_buffers.pop((_buffer.parent.id_, _buffer.context), None)
+
+    def _wait_for_buffer(self, timeout: float, indices):
+        # Waits until a worker hands over a buffer of any of the given data
+        # streams; note that it does not hold the mutex of the worker while
+        # it's waiting:
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        with self._buffer_available:
+            while True:
+                for i in indices:
+                    # The worker may drop the oldest one at the same time
+                    # so it's taken under the lock:
+                    _buffer = self._queues[i].get()
+                    if _buffer is None:
+                        continue
+                    self._next_stream_index = i + 1
+                    return _buffer
+                #
+                if not self.is_acquiring():
                     raise TimeoutException
                 #
+                if deadline is None:
+                    self._buffer_available.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutException
+                    self._buffer_available.wait(remaining)
+
+    def _wait_for_event(self, timeout: float, indices):
+        # Waits until the GenTL Producer delivers a buffer to any of the
+        # given data streams:
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+
+        while True:
+            for i in indices:
+                event_manager = self._event_new_buffer_managers[i]
+                # Expired the suggested period; give it up:
+                timeout_ms = self._timeout_for_image_acquisition
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutException
+                    # Don't let a wait go beyond the period:
+                    timeout_ms = min(timeout_ms, int(remaining * 1000))
+                #
                 try:
-                    event_manager.update_event_data(
-                        self._timeout_for_image_acquisition
-                    )
+                    event_manager.update_event_data(timeout_ms)
                 except TimeoutException:
                     continue
-                else:
-                    # Check if the delivered buffer is complete:
-                    if event_manager.buffer.is_complete():
-                        #
-                        if _is_logging_buffer_manipulation:
-                            self._logger.debug(
-                                'Acquired Buffer module #{0}'
-                                ' containing frame #{1}'
-                                ' from DataStream module {2}'
-                                ' of Device module {3}'
-                                '.'.format(
-                                    event_manager.buffer.context,
-                                    event_manager.buffer.frame_id,
-                                    event_manager.parent.id_,
-                                    event_manager.parent.parent.id_
-                                )
+
+                # The client has queued it if it's been delivered again:
+                self._take_back_buffer(event_manager.buffer)
+
+                # Check if the delivered buffer is complete:
+                if event_manager.buffer.is_complete():
+                    #
+                    if _is_logging_buffer_manipulation:
+                        self._logger.debug(
+                            'Acquired Buffer module #{0}'
+                            ' containing frame #{1}'
+                            ' from DataStream module {2}'
+                            ' of Device module {3}'
+                            '.'.format(
+                                event_manager.buffer.context,
+                                event_manager.buffer.frame_id,
+                                event_manager.parent.id_,
+                                event_manager.parent.parent.id_
                             )
+                        )
 
-                    # Get the latest buffer:
-                    _buffer = event_manager.buffer
+                # Get the latest buffer:
+                self._next_stream_index = i + 1
+                return event_manager.buffer
 
-        if _buffer:
-            #
-            self._update_chunk_data(buffer=_buffer)
+    def fetch_frame(
+            self, *,
+            timeout: float = 0, out: Optional[numpy.ndarray] = None,
+            cycle_s: float = None, stream: int = 0) -> Frame:
+        """
+        Fetches an available buffer that has been filled up with a single
+        image and returns the decoded image as a :class:`Frame` object.
+        It is a lean alternative to :meth:`fetch_buffer` for the image
+        payloads; call :meth:`Frame.queue` once you have done with it.
 
-            # Then update the statistics using the buffer:
-            self._update_statistics(_buffer)
+        :param timeout: Set the period that defines the expiration for an available buffer delivery; if no buffer is fetched within the period then TimeoutException will be raised. The unit is [s].
+        :param out: Set a C contiguous array of the unpacked data type and of the image size to write the image; the buffer can be queued right away then.
+        :param cycle_s: Not used anymore; a buffer is handed over as soon as it is available.
+        :param stream: Set the index of the data stream to fetch the buffer from.
 
-            #
-            if not is_raw:
-                _buffer = Buffer(
-                    buffer=_buffer,
-                    node_map=self.remote_device.node_map,
-                    logger=self._logger
-                )
+        :return: A :class:`Frame` object.
+        :rtype: Frame
+        """
+        buffer = self.fetch_buffer(
+            timeout=timeout, is_raw=True, cycle_s=cycle_s, stream=stream
+        )
+        try:
+            return self._build_frame(
+                buffer, self.remote_device.node_map, out=out
+            )
+        except Exception:
+            # Nobody else can give it back:
+            buffer.parent.queue_buffer(buffer)
+            raise
 
+    @staticmethod
+    def _build_frame(
+            buffer, node_map: NodeMap,
+            out: Optional[numpy.ndarray] = None) -> Frame:
         #
-        self._update_num_images_to_acquire()
+        if buffer.payload_type not in (
+                PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_IMAGE,
+                PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_CHUNK_DATA):
+            raise ValueError(
+                'The payload is not an image; use fetch_buffer instead.'
+            )
 
-        return _buffer
+        #
+        try:
+            data_format = buffer.pixel_format
+        except GenericException:
+            data_format = node_map.PixelFormat.get_int_value()
+        proxy = Dictionary.get_proxy_by_value(data_format)
+        if proxy is None:
+            raise ValueError(
+                '0x{0:08x} is not a known pixel format.'.format(data_format)
+            )
+        w, h, padding_x, padding_y = Component2DImage._get_geometry(
+            buffer, node_map
+        )
+
+        #
+        if padding_x:
+            # Note that the decode plan does not cover the X padding:
+            array = numpy.frombuffer(buffer.raw_buffer, dtype='uint8')
+            data = proxy.expand_roi(
+                array, w, h, 0, 0, w, h, x_padding=padding_x, out=out
+            )
+        else:
+            plan = get_decode_plan(proxy, w, h, padding_x, padding_y)
+            array = numpy.frombuffer(
+                buffer.raw_buffer, count=int(plan.nr_bytes), dtype='uint8'
+            )
+            data = proxy.expand_image(array, w, h, out=out)
+
+        #
+        try:
+            timestamp = buffer.timestamp_ns
+        except GenericException:
+            try:
+                timestamp = buffer.timestamp
+            except GenericException:
+                timestamp = 0
+
+        return Frame(
+            data, buffer.frame_id, timestamp, w, h, proxy.symbolic, buffer
+        )
+
+    def _create_buffer_object(self, buffer) -> Buffer:
+        #
+        if not self._recycles_buffer_objects:
+            return Buffer(
+                buffer=buffer, node_map=self.remote_device.node_map,
+                logger=self._logger
+            )
+
+        #
+        key = buffer.parent.id_, buffer.context
+        buffer_object = self._buffer_objects.get(key)
+        if buffer_object is None:
+            buffer_object = Buffer(
+                buffer=buffer, node_map=self.remote_device.node_map,
+                logger=self._logger
+            )
+            self._buffer_objects[key] = buffer_object
+        else:
+            buffer_object._recycle(buffer)
+        return buffer_object
 
     def _update_num_images_to_acquire(self) -> None:
         #
-        if self._num_images_to_acquire >= 1:
-            self._num_images_to_acquire -= 1
+        with self._statistics_lock:
+            if self._num_images_to_acquire >= 1:
+                self._num_images_to_acquire -= 1
+            is_ready_to_stop = self._num_images_to_acquire == 0
 
         #
-        if self._num_images_to_acquire == 0:
+        if is_ready_to_stop:
             #
             self._emit_callbacks(self.Events.READY_TO_STOP_ACQUISITION)
 
@@ -2775,8 +3346,9 @@ class ImageAcquirer:
         assert buffer
 
         #
-        self._statistics.increment_num_images()
-        self._statistics.update_timestamp(buffer)
+        with self._statistics_lock:
+            self._statistics.increment_num_images()
+            self._statistics.update_timestamp(buffer)
 
     @staticmethod
     def _create_raw_buffers(
@@ -2798,7 +3370,8 @@ class ImageAcquirer:
         return raw_buffers
 
     @staticmethod
-    def _create_buffer_tokens(raw_buffers: List[bytes] = None):
+    def _create_buffer_tokens(
+            raw_buffers: List[bytes] = None, context_base: int = 0):
         #
         assert raw_buffers
 
@@ -2806,7 +3379,7 @@ class ImageAcquirer:
         _buffer_tokens = []
 
         # Append Buffer Token object to the list.
-        for i, buffer in enumerate(raw_buffers):
+        for i, buffer in enumerate(raw_buffers, context_base):
             _buffer_tokens.append(
                 BufferToken(buffer, i)
             )
@@ -2843,6 +3416,76 @@ class ImageAcquirer:
         # Then return the list of announced Buffer objects.
         return announced_buffers
 
+    def _prepare_buffers(
+            self, data_stream: DataStream, index: int, num_buffers: int,
+            buffer_size: int) -> List[Buffer_]:
+        # The buffers may have been kept announced since the last session:
+        if index == len(self._announced_buffers):
+            self._announced_buffers.append([])
+            self._raw_buffers.append([])
+        announced_buffers = self._announced_buffers[index]
+        raw_buffers = self._raw_buffers[index]
+
+        # Revoke all of them if they are not for the current payload size;
+        # otherwise revoke only the surplus:
+        if raw_buffers and len(raw_buffers[0]) != buffer_size:
+            num_surplus = len(raw_buffers)
+        else:
+            num_surplus = len(raw_buffers) - num_buffers
+        if num_surplus > 0:
+            self._revoke_buffers(data_stream, index, num_surplus)
+
+        # Then announce the shortfall:
+        num_shortfall = num_buffers - len(raw_buffers)
+        if num_shortfall > 0:
+            if self._buffer_pool is not None:
+                new_raw_buffers = self._buffer_pool.acquire(
+                    num_shortfall, buffer_size
+                )
+            else:
+                new_raw_buffers = self._create_raw_buffers(
+                    num_shortfall, buffer_size
+                )
+            # The contexts stay unique because the buffers are always
+            # revoked from the tail:
+            buffer_tokens = self._create_buffer_tokens(
+                new_raw_buffers, context_base=len(raw_buffers)
+            )
+            announced_buffers.extend(
+                self._announce_buffers(
+                    data_stream=data_stream, _buffer_tokens=buffer_tokens
+                )
+            )
+            raw_buffers.extend(new_raw_buffers)
+
+        return announced_buffers
+
+    def _revoke_buffers(
+            self, data_stream: DataStream, index: int,
+            num_buffers: int, pools_raw_buffers: bool = True) -> None:
+        #
+        announced_buffers = self._announced_buffers[index]
+        raw_buffers = self._raw_buffers[index]
+
+        #
+        for _ in range(num_buffers):
+            buffer = announced_buffers.pop()
+            if data_stream.is_open():
+                self._logger.debug(
+                    'Revoked Buffer module #{0}.'.format(
+                        buffer.context,
+                        data_stream.id_,
+                        data_stream.parent.id_
+                    )
+                )
+                _ = data_stream.revoke_buffer(buffer)
+
+        # Give the raw buffers back to the pool once they are revoked:
+        revoked_raw_buffers = raw_buffers[len(raw_buffers) - num_buffers:]
+        del raw_buffers[len(raw_buffers) - num_buffers:]
+        if self._buffer_pool is not None and pools_raw_buffers:
+            self._buffer_pool.release(revoked_raw_buffers)
+
     def _queue_announced_buffers(
             self,
             data_stream: Optional[DataStream] = None,
@@ -2878,13 +3521,27 @@ class ImageAcquirer:
         :return: None.
         """
         if self.is_acquiring():
-            #
-            self._is_acquiring = False
+            # Wake the consumers up; they will find that it's stopped:
+            with self._buffer_available:
+                self._is_acquiring = False
+                self._buffer_available.notify_all()
 
             #
-            if self.thread_image_acquisition.is_running():
-                self.thread_image_acquisition.stop()
-                self.thread_image_acquisition.join()
+            threads = [
+                thread for thread in
+                [self.thread_image_acquisition] + self._stream_threads
+                if thread and thread.is_running()
+            ]
+            for thread in threads:
+                thread.stop()
+            if threads:
+                # Wake the workers up if they're waiting for a buffer:
+                self._cancel_event_waits()
+            for thread in threads:
+                thread.join()
+            for thread in self._stream_threads:
+                self._threads.remove(thread)
+            self._stream_threads.clear()
 
             with MutexLocker(self.thread_image_acquisition):
                 #
@@ -2898,6 +3555,7 @@ class ImageAcquirer:
                     # SFNC < 2.0
                     pass
 
+                nr_borrowed_buffers = 0
                 for data_stream in self._data_streams:
                     # Stop image acquisition.
                     try:
@@ -2908,13 +3566,13 @@ class ImageAcquirer:
                         self._logger.error(e, exc_info=True)
 
                     # Flash the queue for image acquisition process.
-                    self._flush_buffers(data_stream)
+                    nr_borrowed_buffers += self._flush_buffers(data_stream)
 
                 for event_manager in self._event_new_buffer_managers:
                     event_manager.flush_event_queue()
 
                 if self._create_ds_at_connection:
-                    self._release_buffers()
+                    self._release_or_keep_buffers(nr_borrowed_buffers)
                 else:
                     self._release_data_streams()
 
@@ -2932,14 +3590,61 @@ class ImageAcquirer:
         if self._profiler:
             self._profiler.print_diff()
 
-    def _flush_buffers(self, data_stream: DataStream) -> None:
+    def _cancel_event_waits(self) -> None:
+        for event_manager in self._event_new_buffer_managers:
+            try:
+                event_manager.kill()
+            except GenericException as e:
+                # The worker will wake up when the wait expires:
+                self._logger.debug(e, exc_info=True)
+
+    def _flush_buffers(self, data_stream: DataStream) -> int:
         # Notify the client that he has to return/queue buffers back:
         self._emit_callbacks(
             self.Events.RETURN_ALL_BORROWED_BUFFERS
         )
+
+        # Count the buffers that the client still holds; it must be done
+        # before the queued ones are discarded:
+        nr_borrowed_buffers = self._count_borrowed_buffers(data_stream)
+
         data_stream.flush_buffer_queue(
             ACQ_QUEUE_TYPE_LIST.ACQ_QUEUE_ALL_DISCARD
         )
+        return nr_borrowed_buffers
+
+    def _count_borrowed_buffers(self, data_stream: DataStream) -> int:
+        nr_borrowed_buffers = 0
+        for key in [key for key in self._borrowed_buffers
+                    if key[0] == data_stream.id_]:
+            _buffer = self._borrowed_buffers.pop(key)
+            try:
+                is_queued = _buffer.has_been_queued
+            except GenericException as e:
+                # We can't tell it; assume the client holds it:
+                self._logger.debug(e, exc_info=True)
+                is_queued = False
+            if not is_queued:
+                nr_borrowed_buffers += 1
+        return nr_borrowed_buffers
+
+    def _release_or_keep_buffers(self, nr_borrowed_buffers: int) -> None:
+        #
+        if self._buffer_pool is None:
+            self._release_buffers()
+        elif nr_borrowed_buffers > 0:
+            # They would be queued again at the next start while the client
+            # still holds them; revoke all of them instead of keeping them.
+            # Their raw buffers must not go back to the pool either:
+            self._logger.warning(
+                '{0} buffer(s) had not been queued when image acquisition '
+                'stopped; the buffers are revoked instead of being kept '
+                'announced.'.format(nr_borrowed_buffers)
+            )
+            self._release_buffers(pools_raw_buffers=False)
+        else:
+            # Keep the buffers announced for the next session:
+            self._clear_filled_buffers()
 
     def _release_data_streams(self) -> None:
         #
@@ -2960,27 +3665,33 @@ class ImageAcquirer:
         #
         self._data_streams.clear()
         self._event_new_buffer_managers.clear()
+        with self._buffer_available:
+            self._queues.clear()
 
-    def _release_buffers(self) -> None:
+    def _release_buffers(self, pools_raw_buffers: bool = True) -> None:
         #
-        for data_stream in self._data_streams:
-            if data_stream.is_open():
-                #
-                for buffer in self._announced_buffers:
-                    self._logger.debug(
-                        'Revoked Buffer module #{0}.'.format(
-                            buffer.context,
-                            data_stream.id_,
-                            data_stream.parent.id_
-                        )
-                    )
-                    _ = data_stream.revoke_buffer(buffer)
+        for i, data_stream in enumerate(
+                self._data_streams[:len(self._announced_buffers)]):
+            self._revoke_buffers(
+                data_stream, i, len(self._announced_buffers[i]),
+                pools_raw_buffers=pools_raw_buffers
+            )
 
         self._announced_buffers.clear()
+        self._raw_buffers.clear()
+
+        #
+        self._clear_filled_buffers()
+
+    def _clear_filled_buffers(self) -> None:
+        #
+        self._buffer_objects.clear()
+        self._borrowed_buffers.clear()
 
         # Flush the queue; we don't need the buffers anymore:
-        while not self._queue.empty():
-            _ = self._queue.get_nowait()
+        with self._buffer_available:
+            for ring_buffer in self._queues:
+                _ = ring_buffer.clear()
 
 
 
@@ -3202,7 +3913,7 @@ class Harvester:
         :param user_defined_name: Set a user defined name string of the target device.
         :param serial_number: Set a serial number string of the target device.
         :param version: Set a version number string of the target device.
-        :param sleep_duration: Set a sleep duration in second that is inserted after the image acquisition worker is executed.
+        :param sleep_duration: Set a sleep duration in second that is inserted after the image acquisition worker is executed; it is not needed in general because the worker blocks until a buffer is delivered.
         :param file_path: Set a path to camera description file which you want to load on the target node map instead of the one which the device declares.
         :param privilege: Set an access privilege. `exclusive`, `contorl`, and `read_only` are supported. The default is `exclusive`.
 
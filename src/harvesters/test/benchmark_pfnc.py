@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------
+#
+# Copyright 2018 EMVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ----------------------------------------------------------------------------
+
+
+# Standard library imports
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from harvesters.util.pfnc import Dictionary, get_nr_bytes
+from harvesters.util.pfnc import get_decoder_backend, set_decoder_backend
+from harvesters.util.pfnc import get_num_workers, set_num_workers
+
+
+# Measures the throughput of the pixel format decoders. It expands synthetic
+# data of every pixel format that Harvester knows so that it doesn't need
+# any GenTL Producer; run it as follows to write the result in JSON:
+#
+#   $ python -m harvesters.test.benchmark_pfnc --output result.json
+
+
+default_resolutions = [(640, 480), (1920, 1080), (4096, 2160)]
+
+
+def _create_data(pf_proxy, width: int, height: int,
+                 rng: numpy.random.Generator) -> numpy.ndarray:
+    nr_bytes = get_nr_bytes(pf_proxy, width, height)
+    return rng.integers(0, 256, nr_bytes, dtype=numpy.uint8)
+
+
+def _measure(pf_proxy, array: numpy.ndarray, repeat: int):
+    # The output is allocated once so that only the decoder is timed:
+    out = pf_proxy.expand(array)
+    if numpy.may_share_memory(out, array):
+        # It is a view; there's nothing to write:
+        out = None
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if out is None:
+            pf_proxy.expand(array)
+        else:
+            pf_proxy.expand(array, out=out)
+        times.append(time.perf_counter() - start)
+
+    # Allocations are traced separately because tracing slows NumPy down:
+    tracemalloc.start()
+    try:
+        pf_proxy.expand(array)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return times, peak
+
+
+def run_benchmark(symbolics=None, resolutions=None, repeat: int = 5,
+                  seed: int = 0) -> dict:
+    """
+    Expands synthetic data of the given pixel formats and measures the time.
+
+    :param symbolics: Set the symbolic names of the pixel formats. Every pixel format in :class:`Dictionary` is measured if it is :const:`None`.
+    :param resolutions: Set a list of (width, height) tuples.
+    :param repeat: Set the number of times that each case is measured.
+    :param seed: Set the seed of the synthetic data.
+
+    :return: The result that can be dumped to JSON.
+    :rtype: dict
+    """
+    #
+    if repeat < 1:
+        raise ValueError('The number of repeats must be > 0.')
+    resolutions = resolutions if resolutions else default_resolutions
+    rng = numpy.random.default_rng(seed)
+
+    #
+    results = []
+    for pf_proxy in Dictionary._pixel_formats:
+        if symbolics and pf_proxy.symbolic not in symbolics:
+            continue
+        for width, height in resolutions:
+            result = {
+                'symbolic': pf_proxy.symbolic,
+                'width': width,
+                'height': height,
+            }
+            try:
+                array = _create_data(pf_proxy, width, height, rng)
+                times, peak = _measure(pf_proxy, array, repeat)
+            except Exception as e:
+                result['error'] = '{0}: {1}'.format(type(e).__name__, e)
+            else:
+                best = max(min(times), 1e-9)
+                nr_pixels = width * height
+                result.update({
+                    'nr_bytes': array.shape[0],
+                    'best_s': min(times),
+                    'median_s': statistics.median(times),
+                    'mb_per_s': array.shape[0] / best / 1e6,
+                    'pixels_per_s': nr_pixels / best,
+                    'peak_bytes': peak,
+                })
+            results.append(result)
+
+    #
+    return {
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'machine': platform.machine(),
+        'num_workers': get_num_workers(),
+        'decoder_backend': get_decoder_backend(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def _parse_resolution(text: str):
+    try:
+        width, height = (int(v) for v in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            '{0} is not a resolution such as 640x480.'.format(text)
+        )
+    return width, height
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Measures the throughput of the pixel format decoders.'
+    )
+    parser.add_argument(
+        '--format', action='append', dest='symbolics',
+        help='a pixel format to measure; can be repeated'
+    )
+    parser.add_argument(
+        '--resolution', action='append', type=_parse_resolution,
+        dest='resolutions', help='a resolution such as 640x480; can be '
+                                 'repeated'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='the number of times that each case is measured'
+    )
+    parser.add_argument(
+        '--num-workers', type=int,
+        help='the number of worker threads that decode a packed frame'
+    )
+    parser.add_argument(
+        '--backend', help='the decoder backend to use'
+    )
+    parser.add_argument(
+        '--output', help='the file to write the result; stdout by default'
+    )
+    args = parser.parse_args(argv)
+
+    #
+    if args.num_workers:
+        set_num_workers(args.num_workers)
+    if args.backend:
+        set_decoder_backend(args.backend)
+    result = run_benchmark(
+        symbolics=args.symbolics, resolutions=args.resolutions,
+        repeat=args.repeat
+    )
+
+    #
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(result, file, indent=2)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
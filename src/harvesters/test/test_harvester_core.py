@@ -31,21 +31,24 @@ import unittest
 from urllib.parse import quote
 
 # Related third party imports
-from genicam.gentl import TimeoutException
+from genicam.gentl import PAYLOADTYPE_INFO_IDS, TimeoutException
 import numpy as np
 
 # Local application/library specific imports
+from harvesters._private.core.ring_buffer import RingBuffer
 from harvesters.test.base_harvester import TestHarvesterCoreBase
 from harvesters.test.base_harvester import get_cti_file_path
-from harvesters.core import Callback
+from harvesters.core import Buffer, BufferPool, Callback
 from harvesters.core import Harvester
 from harvesters.core import ImageAcquirer
 from harvesters.test.helper import get_package_dir
-from harvesters.util.pfnc import Dictionary
+from harvesters.util.logging import get_logger
+from harvesters.util.pfnc import Dictionary, dict_by_names
 from harvesters.core import Component2DImage
 from harvesters.util.pfnc import Mono8, Mono10, Mono12, Mono14, Mono16
 from harvesters.util.pfnc import Mono10Packed, Mono12Packed
 from harvesters.util.pfnc import Mono10p, Mono12p, Mono14p
+from harvesters.util.pfnc import RGB10V1Packed
 
 
 class TestHarvesterCore(TestHarvesterCoreBase):
@@ -686,7 +689,9 @@ class TestHarvesterCore(TestHarvesterCoreBase):
         unpacked = pf.expand(packed)
         self.assertEqual(0x3ff, unpacked[0])
         self.assertEqual(0x3ff, unpacked[1])
-        self.assertEqual(0x7ff, unpacked[2])
+        # It used to be 0x7ff because the bits were unpacked in a layout
+        # other than the PFNC one, i.e., 4 pixels in 5 bytes:
+        self.assertEqual(0x3ff, unpacked[2])
 
     def _test_issue_146_packed_12(self):
         _1st = 0xff
@@ -862,7 +867,7 @@ class TestIssue188(unittest.TestCase):
         expected_results = [
             [2, 2],  # 1 x 1
             [3, 3],  # 2 x 1
-            [4, 5],  # 3 x 1
+            [5, 5],  # 3 x 1; Mono10Packed takes 3 bytes for 2 pixels.
         ]
         for i in self._range:
             for j, proxy in enumerate(proxies):
@@ -902,5 +907,566 @@ class TestIssue188(unittest.TestCase):
             )
 
 
+class _Buffer:
+    # Represents a GenTL Buffer module that delivers a single image:
+    def __init__(self, raw_buffer, pixel_format, width, height):
+        self.raw_buffer = raw_buffer
+        self.pixel_format = pixel_format
+        self.width = width
+        self.height = height
+        self.padding_x = 0
+        self.padding_y = 0
+        self.payload_type = PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_IMAGE
+        self.frame_id = 0
+        self.timestamp_ns = 0
+        self.queued = False
+        self.parent = self
+
+    def queue_buffer(self, buffer):
+        buffer.queued = True
+
+
+class TestComponent2DImage(unittest.TestCase):
+    def test_lazy_decoding(self):
+        values = np.arange(12, dtype=np.uint16)
+        buffer = _Buffer(
+            raw_buffer=bytearray(values.tobytes()),
+            pixel_format=0x01100007,  # Mono16
+            width=4, height=3
+        )
+        component = Component2DImage(buffer=buffer, node_map=object())
+        self.assertIsNone(component._data)
+        self.assertEqual(np.uint8, component.raw.dtype)
+        self.assertEqual(24, component.raw.size)
+        self.assertIsNone(component._data)
+        self.assertTrue(np.array_equal(values, component.data))
+        self.assertIs(component.data, component.data)
+        self.assertEqual((3, 4), component.represent_pixel_location().shape)
+
+    def test_decode_plan(self):
+        components = []
+        for i in range(2):
+            buffer = _Buffer(
+                raw_buffer=bytearray(range(16)),
+                pixel_format=0x01080001,  # Mono8
+                width=4, height=4
+            )
+            components.append(
+                Component2DImage(buffer=buffer, node_map=object())
+            )
+        plan = components[0].decode_plan
+        self.assertIs(plan, components[1].decode_plan)
+        self.assertEqual((16, (4, 4)), (plan.nr_bytes, plan.shape))
+        self.assertTrue(np.array_equal(np.arange(16), components[1].data))
+
+    def test_decode_roi(self):
+        # Mono12p lines of 6 pixels followed by 3 bytes of padding:
+        image = np.arange(24, dtype=np.uint16).reshape(4, 6) * 100
+        lines = []
+        for line in image:
+            bits = sum(int(v) << (12 * i) for i, v in enumerate(line))
+            lines.append(bits.to_bytes(9, 'little') + bytes(3))
+        buffer = _Buffer(
+            raw_buffer=bytearray(b''.join(lines)),
+            pixel_format=0x010C0047,  # Mono12p
+            width=6, height=4
+        )
+        buffer.padding_x = 3
+        component = Component2DImage(buffer=buffer, node_map=object())
+        self.assertTrue(
+            np.array_equal(image[1:3, 1:4], component.decode_roi(1, 1, 3, 2))
+        )
+        self.assertIsNone(component._data)
+
+    def test_rgb10v1packed(self):
+        # A pixel takes 4 bytes though it carries 30 bits:
+        image = np.random.default_rng(0).integers(
+            0, 1 << 10, (2, 4, 3), dtype=np.uint16
+        )
+        raw = RGB10V1Packed().pack(image.reshape(-1))
+        self.assertEqual(2 * 4 * 4, raw.size)
+        buffer = _Buffer(
+            raw_buffer=bytearray(raw.tobytes()),
+            pixel_format=dict_by_names['RGB10V1Packed'],
+            width=4, height=2
+        )
+        component = Component2DImage(buffer=buffer, node_map=object())
+        self.assertEqual(32, component.raw.size)
+        self.assertTrue(
+            np.array_equal(
+                image.reshape(2, 12), component.represent_pixel_location()
+            )
+        )
+
+    def test_planar(self):
+        planes = np.arange(36, dtype=np.uint8).reshape(3, 3, 4)
+        buffer = _Buffer(
+            raw_buffer=bytearray(planes.tobytes()),
+            pixel_format=0x02180021,  # RGB8_Planar
+            width=4, height=3
+        )
+        component = Component2DImage(buffer=buffer, node_map=object())
+        location = component.represent_pixel_location()
+        self.assertTrue(np.array_equal(planes, location))
+        self.assertTrue(np.shares_memory(component.raw, location))
+
+
+class TestBuffer(unittest.TestCase):
+    def _create_buffer(self, values, pixel_format=0x01080001):  # Mono8
+        return _Buffer(
+            raw_buffer=bytearray(values.tobytes()),
+            pixel_format=pixel_format, width=4, height=2
+        )
+
+    def test_slots(self):
+        buffer = Buffer(
+            buffer=self._create_buffer(np.arange(8, dtype=np.uint8)),
+            node_map=object()
+        )
+        for obj in [buffer, buffer.payload, buffer.payload.components[0]]:
+            self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_recycle(self):
+        buffer = Buffer(
+            buffer=self._create_buffer(np.arange(8, dtype=np.uint8)),
+            node_map=object()
+        )
+        payload = buffer.payload
+        component = payload.components[0]
+        self.assertEqual(0, component.data[0])
+
+        # The objects take over the next delivery of the same format:
+        buffer._recycle(self._create_buffer(np.ones(8, dtype=np.uint8)))
+        self.assertIs(payload, buffer.payload)
+        self.assertIs(component, payload.components[0])
+        self.assertTrue(np.array_equal(np.ones(8), component.data))
+
+        # But not of another format:
+        buffer._recycle(
+            self._create_buffer(
+                np.ones(8, dtype=np.uint16), pixel_format=0x01100007  # Mono16
+            )
+        )
+        self.assertIsNot(payload, buffer.payload)
+        self.assertEqual('Mono16', buffer.payload.components[0].data_format)
+
+        # The decoded data of a packed format is decoded to the same memory:
+        packed = Mono12p().pack(np.arange(8, dtype=np.uint16))
+        buffer = Buffer(
+            buffer=self._create_buffer(packed, pixel_format=0x010C0047),
+            node_map=object()
+        )
+        component = buffer.payload.components[0]
+        data = component.data
+        buffer._recycle(
+            self._create_buffer(packed[::-1].copy(), pixel_format=0x010C0047)
+        )
+        self.assertIs(data, component.data)
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_fifo(self):
+        ring_buffer = RingBuffer(3)
+        self.assertTrue(ring_buffer.empty())
+        for i in range(3):
+            self.assertIsNone(ring_buffer.put(i))
+        self.assertTrue(ring_buffer.full())
+        self.assertEqual(3, len(ring_buffer))
+        self.assertEqual([0, 1, 2], [ring_buffer.get() for _ in range(3)])
+        self.assertIsNone(ring_buffer.get())
+
+    def test_drop_oldest(self):
+        ring_buffer = RingBuffer(2)
+        for i in range(2):
+            ring_buffer.put(i)
+        self.assertEqual(0, ring_buffer.put(2))
+        self.assertEqual([1, 2], ring_buffer.clear())
+
+    def test_drop_newest(self):
+        ring_buffer = RingBuffer(2, drop_oldest=False)
+        for i in range(2):
+            ring_buffer.put(i)
+        self.assertEqual(2, ring_buffer.put(2))
+        self.assertEqual([0, 1], ring_buffer.clear())
+
+    def test_resize(self):
+        for drop_oldest, dropped, kept in [
+                (True, [0, 1], [2, 3]), (False, [2, 3], [0, 1])]:
+            ring_buffer = RingBuffer(4, drop_oldest=drop_oldest)
+            # Wrap the counters around before resizing it:
+            ring_buffer.put(-1)
+            ring_buffer.get()
+            for i in range(4):
+                ring_buffer.put(i)
+            self.assertEqual(dropped, ring_buffer.resize(2))
+            self.assertEqual(2, ring_buffer.capacity)
+            self.assertEqual(kept, ring_buffer.clear())
+        #
+        ring_buffer = RingBuffer(1)
+        ring_buffer.put(0)
+        self.assertEqual([], ring_buffer.resize(3))
+        for i in range(1, 3):
+            ring_buffer.put(i)
+        self.assertEqual([0, 1, 2], ring_buffer.clear())
+        #
+        with self.assertRaises(ValueError):
+            ring_buffer.resize(0)
+
+    def test_spsc(self):
+        ring_buffer = RingBuffer(8, drop_oldest=False)
+        nr_items = 10000
+        received = []
+
+        def consume():
+            while len(received) < nr_items:
+                item = ring_buffer.get()
+                if item is not None:
+                    received.append(item)
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        for i in range(nr_items):
+            while ring_buffer.put(i) is not None:
+                pass
+        thread.join()
+        self.assertEqual(list(range(nr_items)), received)
+
+
+class TestBufferHandoff(unittest.TestCase):
+    def setUp(self):
+        # Only the members that the hand-off touches are set up:
+        self._ia = ImageAcquirer.__new__(ImageAcquirer)
+        self._ia._queues = [RingBuffer(1), RingBuffer(1)]
+        self._ia._buffer_available = threading.Condition(threading.Lock())
+        self._ia._is_acquiring = True
+        self._ia._next_stream_index = 0
+
+    def _hand_over(self, buffer, delay, index=0):
+        def worker():
+            time.sleep(delay)
+            with self._ia._buffer_available:
+                self._ia._queues[index].put(buffer)
+                self._ia._buffer_available.notify_all()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        return thread
+
+    def test_wake_on_arrival(self):
+        buffer = object()
+        thread = self._hand_over(buffer, 0.05)
+        self.assertIs(buffer, self._ia._wait_for_buffer(0, [0]))
+        thread.join()
+
+    def test_streams(self):
+        buffer = object()
+        thread = self._hand_over(buffer, 0.05, index=1)
+        # A buffer of another data stream is not taken:
+        with self.assertRaises(TimeoutException):
+            self._ia._wait_for_buffer(0.1, [0])
+        self.assertIs(buffer, self._ia._wait_for_buffer(0, [0, 1]))
+        self.assertEqual(2, self._ia._next_stream_index)
+        thread.join()
+
+    def test_timeout(self):
+        base = time.monotonic()
+        with self.assertRaises(TimeoutException):
+            self._ia._wait_for_buffer(0.05, [0])
+        self.assertGreaterEqual(time.monotonic() - base, 0.05)
+
+    def test_event_deadline(self):
+        class _EventManager:
+            def update_event_data(self, timeout_ms):
+                time.sleep(timeout_ms / 1000)
+                raise TimeoutException
+
+        # Every wait is cut down to what remains of the period:
+        self._ia._event_new_buffer_managers = [_EventManager()] * 3
+        self._ia._timeout_for_image_acquisition = 1000
+        base = time.monotonic()
+        with self.assertRaises(TimeoutException):
+            self._ia._wait_for_event(0.1, [0, 1, 2])
+        self.assertLess(time.monotonic() - base, 0.5)
+
+    def test_stop(self):
+        def stop():
+            time.sleep(0.05)
+            with self._ia._buffer_available:
+                self._ia._is_acquiring = False
+                self._ia._buffer_available.notify_all()
+
+        thread = threading.Thread(target=stop)
+        thread.start()
+        with self.assertRaises(TimeoutException):
+            self._ia._wait_for_buffer(0, [0, 1])
+        thread.join()
+
+
+class _AnnouncedBuffer:
+    # Imitates a GenTL Buffer module that has been announced:
+    def __init__(self, token, data_stream):
+        self.context = token.context
+        self.raw_buffer = token.raw_buffer
+        self.parent = data_stream
+
+    @property
+    def has_been_queued(self):
+        return self in self.parent.queued
+
+
+class _DataStream:
+    # Imitates the buffer handling part of a GenTL DataStream module:
+    def __init__(self):
+        self.id_ = 'Stream0'
+        self.parent = self
+        self.announced = []
+        self.queued = []
+        self.payload_size = 16
+        self.buffer_announce_min = 1
+        self.nr_announcements = 0
+
+    def is_open(self):
+        return True
+
+    def announce_buffer(self, token):
+        buffer = _AnnouncedBuffer(token, self)
+        self.announced.append(buffer)
+        self.nr_announcements += 1
+        return buffer
+
+    def revoke_buffer(self, buffer):
+        self.announced.remove(buffer)
+
+    def queue_buffer(self, buffer):
+        assert buffer in self.announced and buffer not in self.queued
+        self.queued.append(buffer)
+
+    def flush_buffer_queue(self, _):
+        self.queued.clear()
+
+    def defines_payload_size(self):
+        return True
+
+    def start_acquisition(self, *_):
+        pass
+
+    def stop_acquisition(self, *_):
+        pass
+
+
+class _Node:
+    def __init__(self, value=None):
+        self.value = value
+
+    def execute(self):
+        pass
+
+
+class _Mutex:
+    # Imitates the thread that MutexLocker locks:
+    def acquire(self):
+        pass
+
+    def release(self):
+        pass
+
+    def is_running(self):
+        return False
+
+
+class TestBufferPool(unittest.TestCase):
+    def setUp(self):
+        # Only the members that the buffer preparation touches are set up:
+        self._ia = ImageAcquirer.__new__(ImageAcquirer)
+        self._ia._logger = get_logger(name=__name__)
+        self._ia._announced_buffers = []
+        self._ia._raw_buffers = []
+        self._ia._buffer_pool = BufferPool()
+        self._data_stream = _DataStream()
+
+    def _prepare(self, num_buffers, size):
+        return self._ia._prepare_buffers(
+            data_stream=self._data_stream, index=0,
+            num_buffers=num_buffers, buffer_size=size
+        )
+
+    def test_acquire(self):
+        pool = BufferPool()
+        raw_buffers = pool.acquire(2, 8)
+        self.assertEqual([8, 8], [len(b) for b in raw_buffers])
+        pool.release(raw_buffers)
+        self.assertEqual(2, len(pool))
+        reused = pool.acquire(3, 8)
+        self.assertEqual(2, sum(any(b is r for r in raw_buffers)
+                                for b in reused))
+        self.assertEqual(0, len(pool))
+        # A buffer of another size is not provided:
+        pool.release(reused)
+        self.assertEqual([4], [len(b) for b in pool.acquire(1, 4)])
+        pool.clear()
+        self.assertEqual(0, len(pool))
+
+    def test_keep(self):
+        buffers = self._prepare(3, 16)
+        self.assertEqual([0, 1, 2], [b.context for b in buffers])
+        # The same buffers are reused:
+        tokens = list(buffers)
+        self.assertEqual(tokens, self._prepare(3, 16))
+        self.assertEqual(tokens, self._data_stream.announced)
+
+    def test_resize(self):
+        tokens = list(self._prepare(4, 16))
+        # Only the surplus is revoked and it goes back to the pool:
+        self.assertEqual(tokens[:2], self._prepare(2, 16))
+        self.assertEqual(2, len(self._ia.buffer_pool))
+        # Only the shortfall is announced; it comes from the pool:
+        buffers = self._prepare(3, 16)
+        self.assertEqual(tokens[:2], buffers[:2])
+        self.assertEqual([0, 1, 2], [b.context for b in buffers])
+        self.assertEqual(1, len(self._ia.buffer_pool))
+        # All of them are replaced if the payload size has changed:
+        buffers = self._prepare(2, 32)
+        self.assertEqual([32, 32], [len(b.raw_buffer) for b in buffers])
+        self.assertEqual(buffers, self._data_stream.announced)
+        self.assertEqual(4, len(self._ia.buffer_pool))
+
+    def _create_acquirer(self):
+        # Sets up what start_acquisition and stop_acquisition touch:
+        ia = self._ia
+        ia._data_streams = [self._data_stream]
+        ia._event_new_buffer_managers = []
+        ia._queues = [RingBuffer(1)]
+        ia._buffer_available = threading.Condition(threading.Lock())
+        ia._buffer_objects = {}
+        ia._borrowed_buffers = {}
+        ia._is_acquiring = False
+        ia._num_images_to_acquire = 0
+        ia._num_buffers = 3
+        ia._create_ds_at_connection = True
+        ia._thread_image_acquisition = _Mutex()
+        ia._stream_threads = []
+        ia._threads = []
+        ia._callback_dict = {
+            ImageAcquirer.Events.RETURN_ALL_BORROWED_BUFFERS: None,
+            ImageAcquirer.Events.READY_TO_STOP_ACQUISITION: None,
+        }
+        ia._remote_device = type('RemoteDevice', (), {})()
+        ia._remote_device.node_map = type('NodeMap', (), {})()
+        for name, value in [('AcquisitionMode', 'Continuous'),
+                            ('TLParamsLocked', 0), ('AcquisitionStart', None),
+                            ('AcquisitionStop', None)]:
+            setattr(ia._remote_device.node_map, name, _Node(value))
+        ia._device = self._data_stream
+        ia._chunk_adapter = type('ChunkAdapter', (), {})()
+        ia._chunk_adapter.detach_buffer = lambda: None
+        ia._profiler = None
+        return ia
+
+    def test_stop_start(self):
+        ia = self._create_acquirer()
+        ia.start_acquisition()
+        buffers = list(self._data_stream.announced)
+        self.assertEqual(3, len(buffers))
+        self.assertEqual(buffers, self._data_stream.queued)
+
+        # The buffers stay announced over a stop/start cycle:
+        ia.stop_acquisition()
+        self.assertEqual(buffers, self._data_stream.announced)
+        self.assertEqual([], self._data_stream.queued)
+        ia.start_acquisition()
+        self.assertEqual(3, self._data_stream.nr_announcements)
+        self.assertEqual(buffers, self._data_stream.queued)
+
+        # Then the payload size changes:
+        ia.stop_acquisition()
+        self._data_stream.payload_size = 32
+        ia.start_acquisition()
+        self.assertEqual(6, self._data_stream.nr_announcements)
+        self.assertEqual(
+            [32] * 3, [len(b.raw_buffer) for b in self._data_stream.queued]
+        )
+        self.assertEqual(3, len(ia.buffer_pool))
+        ia.stop_acquisition()
+
+    def test_stop_with_borrowed_buffer(self):
+        ia = self._create_acquirer()
+        ia.start_acquisition()
+        # The client holds a delivered buffer:
+        buffer = self._data_stream.queued.pop()
+        ia._borrowed_buffers[buffer.parent.id_, buffer.context] = buffer
+        with self.assertLogs(ia._logger, level='WARNING'):
+            ia.stop_acquisition()
+        # It must not be queued again so none of them is kept:
+        self.assertEqual([], self._data_stream.announced)
+        self.assertEqual(0, len(ia.buffer_pool))
+        #
+        ia.start_acquisition()
+        self.assertFalse(
+            any(b.raw_buffer is buffer.raw_buffer
+                for b in self._data_stream.queued)
+        )
+
+    def test_release(self):
+        self._prepare(2, 16)
+        self._ia._data_streams = [self._data_stream]
+        self._ia._buffer_objects = {}
+        self._ia._borrowed_buffers = {}
+        self._ia._queues = []
+        self._ia._buffer_available = threading.Condition(threading.Lock())
+        self._ia._release_buffers()
+        self.assertEqual([], self._data_stream.announced)
+        self.assertEqual(2, len(self._ia.buffer_pool))
+
+
+class TestFrame(unittest.TestCase):
+    def test_build_frame(self):
+        image = np.arange(12, dtype=np.uint16).reshape(3, 4) * 100
+        buffer = _Buffer(
+            raw_buffer=bytearray(Mono12p().pack(image).tobytes()),
+            pixel_format=0x010C0047,  # Mono12p
+            width=4, height=3
+        )
+        buffer.frame_id = 7
+        frame = ImageAcquirer._build_frame(buffer, object())
+        self.assertTrue(np.array_equal(image, frame.data))
+        self.assertEqual(
+            (7, 4, 3, 'Mono12p'),
+            (frame.frame_id, frame.width, frame.height, frame.data_format)
+        )
+        self.assertFalse(hasattr(frame, '__dict__'))
+        with frame:
+            pass
+        self.assertTrue(buffer.queued)
+
+    def test_411(self):
+        array = np.arange(24, dtype=np.uint8)
+        buffer = _Buffer(
+            raw_buffer=bytearray(array.tobytes()),
+            pixel_format=dict_by_names['YUV411_8_UYYVYY'],
+            width=8, height=2
+        )
+        frame = ImageAcquirer._build_frame(buffer, object())
+        self.assertTrue(np.array_equal(array.reshape(2, 12), frame.data))
+
+    def test_out(self):
+        image = np.arange(12, dtype=np.uint8).reshape(3, 4)
+        buffer = _Buffer(
+            raw_buffer=bytearray(image.tobytes()),
+            pixel_format=0x01080001,  # Mono8
+            width=4, height=3
+        )
+        frame = ImageAcquirer._build_frame(buffer, object())
+        self.assertTrue(np.shares_memory(frame.data, buffer.raw_buffer))
+        out = np.empty((3, 4), dtype=np.uint8)
+        frame = ImageAcquirer._build_frame(buffer, object(), out=out)
+        self.assertIs(out, frame.data)
+        self.assertTrue(np.array_equal(image, out))
+
+        # Only the image payloads are supported:
+        buffer.payload_type = PAYLOADTYPE_INFO_IDS.PAYLOAD_TYPE_FILE
+        with self.assertRaises(ValueError):
+            ImageAcquirer._build_frame(buffer, object())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,918 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------
+#
+# Copyright 2018 EMVA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ----------------------------------------------------------------------------
+
+
+# Standard library imports
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+# Related third party imports
+import numpy as np
+
+# Local application/library specific imports
+from harvesters.test.benchmark_pfnc import main, run_benchmark
+from harvesters.util.pfnc import Dictionary, dict_by_ints, dict_by_names
+from harvesters.util.pfnc import component_2d_formats
+from harvesters.util.pfnc import get_bits_per_pixel, get_pixel_format_info
+from harvesters.util.pfnc import _MonoUnpackedUint8
+from harvesters.util.pfnc import ArrayPool, create_lut
+from harvesters.util.pfnc import get_decode_plan, clear_decode_plans
+from harvesters.util.pfnc import expand_batch, get_nr_bytes
+from harvesters.util.pfnc import DecoderBackend, register_decoder_backend
+from harvesters.util.pfnc import get_decoder_backend, get_decoder_backends
+from harvesters.util.pfnc import set_decoder_backend
+from harvesters.util.pfnc import _Packed, _decoder_backends
+from harvesters.util.pfnc import _min_num_groups_per_chunk
+from harvesters.util.pfnc import _unpack_lsb_first
+from harvesters.util.pfnc import get_num_workers, set_num_workers
+from harvesters.util.pfnc import demosaic, expand_and_demosaic
+from harvesters.util.pfnc import yuv_to_rgb, yuv_to_planar
+from harvesters.util.pfnc import Mono1p, Mono2p, Mono4p, Mono8, Mono16
+from harvesters.util.pfnc import Mono10Packed, Mono12Packed
+from harvesters.util.pfnc import Mono10p, Mono12p, Mono14p
+from harvesters.util.pfnc import RGB8Packed, RGB10V1Packed, RGB12V1Packed
+from harvesters.util.pfnc import RGB16_Planar, Coord3D_ABC10p_Planar
+from harvesters.util.pfnc import Coord3D_AC10p, Coord3D_AC12p
+from harvesters.util.pfnc import Coord3D_AC12p_Planar
+
+
+def _pack_p(values, nr_bits):
+    # Packs the values LSB first as PFNC defines for the *p formats:
+    packed = bytearray()
+    bits, nr_filled = 0, 0
+    for value in values:
+        bits |= int(value) << nr_filled
+        nr_filled += nr_bits
+        while nr_filled >= 8:
+            packed.append(bits & 0xff)
+            bits >>= 8
+            nr_filled -= 8
+    if nr_filled:
+        packed.append(bits & 0xff)
+    return np.frombuffer(bytes(packed), dtype=np.uint8)
+
+
+def _pack_group(values, nr_bits):
+    # Packs a pair of values to 3 bytes as GigE Vision defines for the
+    # *Packed formats:
+    nr_lsbs = nr_bits - 8
+    mask = (1 << nr_lsbs) - 1
+    packed = bytearray()
+    for i in range(0, len(values), 2):
+        p1st = int(values[i])
+        p2nd = int(values[i + 1]) if i + 1 < len(values) else 0
+        packed += bytes([
+            p1st >> nr_lsbs, (p1st & mask) | ((p2nd & mask) << 4),
+            p2nd >> nr_lsbs
+        ])
+    return np.frombuffer(bytes(packed), dtype=np.uint8)
+
+
+class _CountingBackend(DecoderBackend):
+    name = 'counting'
+
+    def __init__(self, offset=0, available=True):
+        super().__init__()
+        self.nr_calls = 0
+        self._offset = offset
+        self._available = available
+
+    def is_available(self):
+        return self._available
+
+    def get_kernel(self, pf_proxy):
+        if pf_proxy.symbolic != 'Mono12p':
+            return None
+
+        def kernel(packed, unpacked):
+            self.nr_calls += 1
+            _unpack_lsb_first(packed, unpacked, 12)
+            unpacked += self._offset
+
+        return kernel
+
+
+class _VendorMono8(_MonoUnpackedUint8):
+    def __init__(self):
+        #
+        super().__init__(
+            symbolic='VendorMono8',
+            unit_depth_in_bit=8
+        )
+
+
+class TestDictionary(unittest.TestCase):
+    def tearDown(self):
+        # Leave the global tables as they were for the other tests:
+        Dictionary.unregister('VendorMono8')
+
+    def test_get_proxy(self):
+        for pf in Dictionary._pixel_formats:
+            self.assertIs(pf, Dictionary.get_proxy(pf.symbolic))
+        self.assertIsNone(Dictionary.get_proxy('NonExistent'))
+
+    def test_get_proxy_by_value(self):
+        self.assertEqual(
+            'Mono8', Dictionary.get_proxy_by_value(0x01080001).symbolic
+        )
+        self.assertEqual(
+            'BayerRG12p', Dictionary.get_proxy_by_value(0x010C0059).symbolic
+        )
+        self.assertEqual(
+            'Mono1p', Dictionary.get_proxy_by_value(0x01010037).symbolic
+        )
+        self.assertIsNone(Dictionary.get_proxy_by_value(0x7fffffff))
+
+    def test_register(self):
+        value = 0x81080001
+        proxy = _VendorMono8()
+        Dictionary.register(proxy, value=value)
+        self.assertIs(proxy, Dictionary.get_proxy('VendorMono8'))
+        self.assertIs(proxy, Dictionary.get_proxy_by_value(value))
+        self.assertEqual('VendorMono8', dict_by_ints[value])
+        self.assertEqual(value, dict_by_names['VendorMono8'])
+        self.assertIn('VendorMono8', component_2d_formats)
+        info = get_pixel_format_info(value)
+        self.assertIs(info, get_pixel_format_info('VendorMono8'))
+        self.assertTrue(info.is_2d)
+
+        # A value that has been already assigned can't be taken over:
+        with self.assertRaises(ValueError):
+            Dictionary.register(_VendorMono8(), value=0x01080001)
+
+        # Registering it under another value drops the old value:
+        new_value = 0x81080002
+        Dictionary.register(_VendorMono8(), value=new_value, is_2d=False)
+        self.assertEqual('VendorMono8', dict_by_ints[new_value])
+        self.assertNotIn(value, dict_by_ints)
+        self.assertIsNone(Dictionary.get_proxy_by_value(value))
+        self.assertIsNone(get_pixel_format_info(value))
+        self.assertNotIn('VendorMono8', component_2d_formats)
+        self.assertFalse(get_pixel_format_info(new_value).is_2d)
+
+    def test_unregister(self):
+        value = 0x81080001
+        Dictionary.register(_VendorMono8(), value=value)
+        Dictionary.unregister('VendorMono8')
+        self.assertIsNone(Dictionary.get_proxy('VendorMono8'))
+        self.assertIsNone(Dictionary.get_proxy_by_value(value))
+        self.assertNotIn(value, dict_by_ints)
+        self.assertNotIn('VendorMono8', dict_by_names)
+        self.assertNotIn('VendorMono8', component_2d_formats)
+        self.assertIsNone(get_pixel_format_info('VendorMono8'))
+        self.assertNotIn(
+            'VendorMono8', [pf.symbolic for pf in Dictionary._pixel_formats]
+        )
+
+    def test_get_pixel_format_info(self):
+        info = get_pixel_format_info(0x010C0047)
+        self.assertIs(info, get_pixel_format_info('Mono12p'))
+        self.assertEqual(12, info.effective_size)
+        self.assertTrue(info.is_packed)
+        self.assertTrue(info.is_2d)
+        self.assertEqual(np.uint16, info.dtype)
+        self.assertIsNone(get_pixel_format_info(0x7fffffff))
+        self.assertIsNone(get_pixel_format_info('NonExistent'))
+
+        # Formats that only have a name are still known:
+        self.assertEqual(
+            'RGB8Packed', get_pixel_format_info('RGB8Packed').symbolic
+        )
+
+    def test_get_bits_per_pixel(self):
+        self.assertEqual(8, get_bits_per_pixel('Mono8'))
+        self.assertEqual(12, get_bits_per_pixel('Mono12'))
+        self.assertEqual(16, get_bits_per_pixel('RGB16'))
+        self.assertIsNone(get_bits_per_pixel('NonExistent'))
+
+
+class TestExpand(unittest.TestCase):
+    _nr_values = [1, 2, 3, 4, 5, 7, 8, 101, 1003]
+    _cases = [
+        (Mono10p, 10, _pack_p),
+        (Mono12p, 12, _pack_p),
+        (Mono14p, 14, _pack_p),
+        (Mono10Packed, 10, _pack_group),
+        (Mono12Packed, 12, _pack_group),
+    ]
+
+    def setUp(self):
+        self._rng = np.random.default_rng(0)
+
+    def test_packed(self):
+        for proxy, nr_bits, pack in self._cases:
+            for nr_values in self._nr_values:
+                values = self._rng.integers(
+                    0, 1 << nr_bits, nr_values, dtype=np.uint16
+                )
+                array = pack(values, nr_bits)
+                expanded = proxy().expand(array)
+                self.assertEqual(np.uint16, expanded.dtype)
+                self.assertTrue(
+                    np.array_equal(values, expanded[:nr_values])
+                )
+
+    def test_bit_packed(self):
+        for proxy, nr_bits in [(Mono1p, 1), (Mono2p, 2), (Mono4p, 4)]:
+            values = self._rng.integers(0, 1 << nr_bits, 96, dtype=np.uint8)
+            array = _pack_p(values, nr_bits)
+            self.assertEqual(96 * nr_bits // 8, array.size)
+            self.assertTrue(np.array_equal(values, proxy().expand(array)))
+            out = np.empty((8, 12), dtype=np.uint8)
+            self.assertIs(out, proxy().expand(array, out=out))
+            self.assertTrue(np.array_equal(values, out.ravel()))
+            #
+            lines = proxy().get_packed_lines(array, width=16, height=6)
+            self.assertEqual((6, 2 * nr_bits), lines.shape)
+            self.assertTrue(np.shares_memory(array, lines))
+        #
+        array = _pack_p([1, 0, 1], 1)
+        self.assertTrue(
+            np.array_equal(np.unpackbits(array, bitorder='little'),
+                           Mono1p().expand(array))
+        )
+        with self.assertRaises(ValueError):
+            Mono1p().get_packed_lines(array, width=3, height=1)
+
+    def test_rgb_v1_packed(self):
+        rgb = self._rng.integers(0, 1 << 10, (5, 3), dtype=np.uint16)
+        (r, g, b), lsbs = (rgb.T >> 2).astype(np.uint8), rgb.T & 0x3
+        array = np.stack(
+            [lsbs[2] | (lsbs[1] << 2) | (lsbs[0] << 4), b, g, r], axis=1
+        ).astype(np.uint8).ravel()
+        self.assertTrue(
+            np.array_equal(rgb.ravel(), RGB10V1Packed().expand(array))
+        )
+        #
+        rgb = self._rng.integers(0, 1 << 12, (4, 3), dtype=np.uint16)
+        self.assertTrue(
+            np.array_equal(
+                rgb.ravel(),
+                RGB12V1Packed().expand(_pack_group(rgb.ravel(), 12))
+            )
+        )
+        #
+        array = np.arange(12, dtype=np.uint8)
+        self.assertIs(array, RGB8Packed().expand(array))
+        self.assertEqual('RGB8', dict_by_ints[0x02180014])
+
+    def test_lm44_packed(self):
+        pool = ArrayPool()
+        for proxy, nr_bits in [(Coord3D_AC10p, 10), (Coord3D_AC12p, 12)]:
+            image = self._rng.integers(
+                0, 1 << nr_bits, (3, 5, 2), dtype=np.uint16
+            )
+            array = _pack_p(image.ravel(), nr_bits)
+            self.assertTrue(
+                np.array_equal(image, proxy().expand_image(array, 5, 3))
+            )
+            expanded = proxy().expand_image(array, 5, 3, pool=pool)
+            self.assertTrue(np.array_equal(image, expanded))
+            pool.release(expanded)
+            self.assertIs(
+                expanded, proxy().expand_image(array, 5, 3, pool=pool)
+            )
+        #
+        planes = self._rng.integers(0, 1 << 12, (2, 3, 4), dtype=np.uint16)
+        array = np.concatenate([_pack_p(p.ravel(), 12) for p in planes])
+        self.assertTrue(
+            np.array_equal(
+                planes, Coord3D_AC12p_Planar().expand_image(array, 4, 3)
+            )
+        )
+
+    def test_411(self):
+        # A pixel takes 1.5 components; the whole data has to be kept:
+        proxy = Dictionary.get_proxy('YUV411_8_UYYVYY')
+        array = np.arange(24, dtype=np.uint8)
+        image = proxy.expand_image(array, 8, 2)
+        self.assertEqual((2, 12), image.shape)
+        self.assertTrue(np.array_equal(array, image.ravel()))
+        self.assertEqual((2, 12), get_decode_plan(proxy, 8, 2).shape)
+        batch = expand_batch(proxy, [array] * 2, 8, 2)
+        self.assertTrue(np.array_equal(np.stack([image, image]), batch))
+        with self.assertRaises(ValueError):
+            proxy.expand_roi(array, 8, 2, 0, 0, 4, 1)
+
+    def test_roi(self):
+        image = self._rng.integers(0, 1 << 12, (5, 7), dtype=np.uint16)
+        # The lines straddle the groups:
+        array = _pack_p(image.ravel(), 12)
+        for x, y, w, h in [(0, 0, 7, 5), (1, 1, 3, 3), (6, 4, 1, 1)]:
+            self.assertTrue(
+                np.array_equal(
+                    image[y:y + h, x:x + w],
+                    Mono12p().expand_roi(array, 7, 5, x, y, w, h)
+                )
+            )
+        # The lines are padded:
+        padding = np.zeros(2, dtype=np.uint8)
+        array = np.concatenate(
+            [np.append(_pack_group(line, 12), padding)
+             for line in image[:, :6]]
+        )
+        region = Mono12Packed().expand_roi(
+            array, 6, 5, 1, 2, 3, 2, x_padding=2
+        )
+        self.assertTrue(np.array_equal(image[2:4, 1:4], region))
+        # An unpacked region is a view:
+        array = image.view(np.uint8).ravel()
+        region = Mono16().expand_roi(array, 7, 5, 2, 1, 4, 3)
+        self.assertTrue(np.array_equal(image[1:4, 2:6], region))
+        self.assertTrue(np.shares_memory(array, region))
+        with self.assertRaises(ValueError):
+            Mono16().expand_roi(array, 7, 5, 4, 1, 4, 3)
+
+    def test_packed_out(self):
+        for proxy, nr_bits, pack in self._cases:
+            values = self._rng.integers(
+                0, 1 << nr_bits, 120, dtype=np.uint16
+            )
+            out = np.empty((10, 12), dtype=np.uint16)
+            self.assertIs(out, proxy().expand(pack(values, nr_bits), out=out))
+            self.assertTrue(np.array_equal(values, out.ravel()))
+
+    def test_unpacked_out(self):
+        array = np.arange(8, dtype=np.uint8)
+        self.assertIs(array, Mono8().expand(array))
+        out = np.empty(4, dtype=np.uint16)
+        self.assertIs(out, Mono16().expand(array, out=out))
+        self.assertTrue(np.array_equal(array.view(np.uint16), out))
+
+    def test_invalid_out(self):
+        array = _pack_p(range(4), 12)
+        for out in [np.empty(3, dtype=np.uint16),
+                    np.empty(4, dtype=np.uint8),
+                    np.empty((4, 2), dtype=np.uint16)[:, 0]]:
+            with self.assertRaises(ValueError):
+                Mono12p().expand(array, out=out)
+
+    def test_pack(self):
+        cases = self._cases + [(Mono1p, 1, _pack_p), (Mono2p, 2, _pack_p),
+                               (Mono4p, 4, _pack_p)]
+        for proxy, nr_bits, pack in cases:
+            for nr_values in self._nr_values:
+                values = self._rng.integers(
+                    0, 1 << nr_bits, nr_values, dtype=np.uint16
+                ).astype(proxy().alignment.unpacked_dtype)
+                packed = proxy().pack(values)
+                self.assertEqual(
+                    proxy().packed_size(nr_values), packed.size
+                )
+                self.assertTrue(
+                    np.array_equal(pack(values, nr_bits)[:packed.size],
+                                   packed)
+                )
+                self.assertTrue(
+                    np.array_equal(
+                        values, proxy().expand(packed)[:nr_values]
+                    )
+                )
+        #
+        values = self._rng.integers(0, 1 << 10, (4, 6), dtype=np.uint16)
+        out = np.empty(30, dtype=np.uint8)
+        self.assertIs(out, Mono10p().pack(values, out=out))
+        self.assertTrue(np.array_equal(values.ravel(), Mono10p().expand(out)))
+        self.assertTrue(
+            np.array_equal(values.view(np.uint8).ravel(),
+                           Mono16().pack(values))
+        )
+
+    def test_expand_to_uint8(self):
+        for proxy, nr_bits, pack in self._cases:
+            for nr_values in self._nr_values:
+                values = self._rng.integers(
+                    0, 1 << nr_bits, nr_values, dtype=np.uint16
+                )
+                array = pack(values, nr_bits)
+                expanded = proxy().expand_to_uint8(array)
+                self.assertEqual(np.uint8, expanded.dtype)
+                self.assertTrue(
+                    np.array_equal(
+                        values >> (nr_bits - 8), expanded[:nr_values]
+                    )
+                )
+                # A smaller shift saturates:
+                expanded = proxy().expand_to_uint8(array, shift=1)
+                self.assertTrue(
+                    np.array_equal(
+                        np.minimum(values >> 1, 255), expanded[:nr_values]
+                    )
+                )
+
+    def test_expand_to_uint8_with_lut(self):
+        lut = create_lut(12, gamma=2.2)
+        self.assertEqual((4096,), lut.shape)
+        self.assertEqual((0, 255), (lut[0], lut[-1]))
+        values = self._rng.integers(0, 4096, 1000, dtype=np.uint16)
+        out = np.empty(1000, dtype=np.uint8)
+        for proxy, array in [(Mono12p, _pack_p(values, 12)),
+                             (Mono12Packed, _pack_group(values, 12))]:
+            self.assertIs(
+                out, proxy().expand_to_uint8(array, out=out, lut=lut)
+            )
+            self.assertTrue(np.array_equal(lut[values], out))
+        # The table must cover the whole depth:
+        with self.assertRaises(ValueError):
+            Mono12p().expand_to_uint8(_pack_p(values, 12), lut=lut[:256])
+
+    def test_unpacked_to_uint8(self):
+        values = self._rng.integers(0, 1 << 16, 100, dtype=np.uint16)
+        array = values.view(np.uint8)
+        self.assertTrue(
+            np.array_equal(values >> 8, Mono16().expand_to_uint8(array))
+        )
+        self.assertTrue(
+            np.array_equal(array, Mono8().expand_to_uint8(array))
+        )
+
+    def test_array_pool(self):
+        pool = ArrayPool()
+        array = pool.acquire((2, 3), np.uint16)
+        pool.release(array)
+        self.assertIs(array, pool.acquire((2, 3), 'uint16'))
+        self.assertIsNot(array, pool.acquire((2, 3), np.uint16))
+
+
+class TestDecodePlan(unittest.TestCase):
+    def tearDown(self):
+        clear_decode_plans()
+
+    def test_get_decode_plan(self):
+        proxy = Mono12p()
+        plan = get_decode_plan(proxy, 3, 2, y_padding=1)
+        self.assertIs(plan, get_decode_plan(proxy, 3, 2, y_padding=1))
+        self.assertIsNot(plan, get_decode_plan(proxy, 4, 2, y_padding=1))
+        self.assertEqual(10, plan.nr_bytes)
+        self.assertEqual((2, 3), plan.shape)
+        self.assertEqual(np.uint16, plan.dtype)
+        #
+        values = np.arange(6, dtype=np.uint16)
+        self.assertTrue(
+            np.array_equal(values, plan.decode(_pack_p(values, 12)))
+        )
+        clear_decode_plans()
+        self.assertIsNot(plan, get_decode_plan(proxy, 3, 2, y_padding=1))
+
+    def test_pool(self):
+        plan = get_decode_plan(Mono12p(), 3, 2)
+        values = np.arange(6, dtype=np.uint16)
+        data = plan.decode(_pack_p(values, 12))
+        self.assertTrue(np.array_equal(values, data))
+        # The released output is reused by the next image:
+        plan.release(data)
+        self.assertIs(data, plan.decode(_pack_p(values[::-1], 12)))
+        self.assertTrue(np.array_equal(values[::-1], data))
+        # A view of the given data is not taken:
+        plan = get_decode_plan(Mono16(), 3, 2)
+        view = plan.decode(values.view(np.uint8))
+        plan.release(view)
+        self.assertIsNot(view, plan.decode(values.view(np.uint8)))
+
+    def test_group_packed(self):
+        # Mono10Packed takes 3 bytes for every pair of pixels:
+        plan = get_decode_plan(Mono10Packed(), 8, 2)
+        self.assertEqual(24, plan.nr_bytes)
+        values = np.arange(16, dtype=np.uint16) * 60
+        self.assertTrue(
+            np.array_equal(values, plan.decode(_pack_group(values, 10)))
+        )
+
+    def test_planar(self):
+        plan = get_decode_plan(RGB16_Planar(), 3, 2)
+        self.assertEqual((3, 2, 3), plan.shape)
+        planes = np.arange(18, dtype=np.uint16)
+        self.assertTrue(
+            np.array_equal(planes, plan.decode(planes.view(np.uint8)))
+        )
+
+
+class TestDecoderBackend(unittest.TestCase):
+    def setUp(self):
+        self._values = np.arange(4096, dtype=np.uint16)
+
+    def tearDown(self):
+        set_decoder_backend('numpy')
+        for symbolic in ['Mono10p', 'Mono12p']:
+            set_decoder_backend(None, symbolic)
+        _decoder_backends.pop(_CountingBackend.name, None)
+
+    def _expand(self, proxy, nr_bits):
+        values = self._values & ((1 << nr_bits) - 1)
+        return proxy.expand(_pack_p(values, nr_bits))
+
+    def test_default(self):
+        self.assertEqual('numpy', get_decoder_backend())
+        self.assertIn('numpy', get_decoder_backends())
+        with self.assertRaises(ValueError):
+            set_decoder_backend('NonExistent')
+
+    def test_select(self):
+        backend = _CountingBackend()
+        register_decoder_backend(backend)
+        set_decoder_backend(backend.name, 'Mono12p')
+        self.assertEqual(backend.name, get_decoder_backend('Mono12p'))
+        self.assertEqual('numpy', get_decoder_backend('Mono10p'))
+        self.assertTrue(
+            np.array_equal(self._values, self._expand(Mono12p(), 12))
+        )
+        # The check and the expansion:
+        self.assertEqual(2, backend.nr_calls)
+
+        # A format that the backend doesn't support takes the reference:
+        set_decoder_backend(backend.name)
+        self.assertTrue(
+            np.array_equal(
+                self._values & 0x3ff, self._expand(Mono10p(), 10)
+            )
+        )
+
+    def test_fallback(self):
+        # A backend that doesn't match the reference is not used:
+        backend = _CountingBackend(offset=1)
+        register_decoder_backend(backend)
+        set_decoder_backend(backend.name)
+        self.assertTrue(
+            np.array_equal(self._values, self._expand(Mono12p(), 12))
+        )
+        self.assertEqual(1, backend.nr_calls)
+
+        # Neither is a backend that is not available:
+        backend = _CountingBackend(available=False)
+        register_decoder_backend(backend)
+        self.assertNotIn(backend.name, get_decoder_backends())
+        self.assertTrue(
+            np.array_equal(self._values, self._expand(Mono12p(), 12))
+        )
+        self.assertEqual(0, backend.nr_calls)
+
+    @unittest.skipUnless('numba' in get_decoder_backends(), 'needs Numba')
+    def test_numba(self):
+        rng = np.random.default_rng(0)
+        array = rng.integers(0, 256, 3 * 5 * 7 * 100 + 2, dtype=np.uint8)
+        for proxy in Dictionary._pixel_formats:
+            if not isinstance(proxy, _Packed):
+                continue
+            expected = proxy.expand(array)
+            set_decoder_backend('numba', proxy.symbolic)
+            self.assertTrue(np.array_equal(expected, proxy.expand(array)))
+            set_decoder_backend(None, proxy.symbolic)
+
+
+class TestExpandBatch(unittest.TestCase):
+    def setUp(self):
+        self._rng = np.random.default_rng(0)
+
+    def test_packed(self):
+        # 4 x 2 pixels are whole groups; 3 x 3 pixels are not:
+        for width, height in [(4, 2), (3, 3)]:
+            images = self._rng.integers(
+                0, 1 << 12, (5, height, width), dtype=np.uint16
+            )
+            arrays = [_pack_p(image.ravel(), 12) for image in images]
+            self.assertTrue(
+                np.array_equal(
+                    images, expand_batch(Mono12p(), arrays, width, height)
+                )
+            )
+            out = np.empty((5, height, width), dtype=np.uint16)
+            self.assertIs(
+                out, expand_batch(
+                    Mono12p(), np.stack(arrays), width, height, out=out
+                )
+            )
+            self.assertTrue(np.array_equal(images, out))
+
+    def test_group_packed(self):
+        # 8 x 2 pixels are whole pairs; 3 x 3 pixels are not:
+        for width, height in [(8, 2), (3, 3)]:
+            for proxy in [Mono10Packed(), Dictionary.get_proxy(
+                    'BayerRG10Packed')]:
+                images = self._rng.integers(
+                    0, 1 << 10, (4, height, width), dtype=np.uint16
+                )
+                arrays = [_pack_group(image.ravel(), 10) for image in images]
+                self.assertTrue(
+                    np.array_equal(
+                        images, expand_batch(proxy, arrays, width, height)
+                    )
+                )
+
+    def test_every_pixel_format(self):
+        # 5 x 3 pixels are not whole groups of any packed format:
+        for width, height in [(8, 2), (4, 3), (5, 3)]:
+            for proxy in Dictionary._pixel_formats:
+                with self.subTest(
+                        symbolic=proxy.symbolic, width=width, height=height):
+                    nr_bytes = get_nr_bytes(proxy, width, height)
+                    arrays = [
+                        self._rng.integers(0, 256, nr_bytes, dtype=np.uint8)
+                        for _ in range(3)
+                    ]
+                    expected = np.stack(
+                        [proxy.expand_image(a, width, height) for a in arrays]
+                    )
+                    images = expand_batch(proxy, arrays, width, height)
+                    self.assertEqual(expected.shape, images.shape)
+                    self.assertEqual(expected.dtype, images.dtype)
+                    # Compare the bytes; random floats can be NaN:
+                    self.assertEqual(expected.tobytes(), images.tobytes())
+
+    def test_unpacked(self):
+        images = self._rng.integers(0, 256, (3, 2, 4, 3), dtype=np.uint8)
+        arrays = [image.ravel() for image in images]
+        stacked = expand_batch(Dictionary.get_proxy('RGB8'), arrays, 4, 2)
+        self.assertTrue(np.array_equal(images, stacked))
+        with self.assertRaises(ValueError):
+            expand_batch(Mono16(), arrays, 4, 4)
+
+
+class TestParallelExpand(unittest.TestCase):
+    def setUp(self):
+        self._num_workers = get_num_workers()
+
+    def tearDown(self):
+        set_num_workers(self._num_workers)
+
+    def test_parallel_expand(self):
+        rng = np.random.default_rng(0)
+        array = rng.integers(0, 256, 3 * 7 * 5 * 12345 + 4, dtype=np.uint8)
+        for proxy in [Mono10p, Mono12p, Mono14p, Mono10Packed, Mono12Packed]:
+            expected = proxy().expand(array, num_workers=1)
+            self.assertTrue(
+                np.array_equal(
+                    expected, proxy().expand(array, num_workers=4)
+                )
+            )
+            set_num_workers(3)
+            self.assertTrue(np.array_equal(expected, proxy().expand(array)))
+            set_num_workers(1)
+
+    def test_planar(self):
+        rng = np.random.default_rng(0)
+        planes = rng.integers(0, 1 << 10, (3, 5, 7), dtype=np.uint16)
+        # Every plane starts at a byte boundary:
+        array = np.concatenate([_pack_p(p.ravel(), 10) for p in planes])
+        proxy = Coord3D_ABC10p_Planar()
+        self.assertTrue(proxy.is_planar)
+        for num_workers in [1, 3]:
+            self.assertTrue(
+                np.array_equal(
+                    planes, proxy.expand_planar(
+                        array, 7, 5, num_workers=num_workers
+                    )
+                )
+            )
+        #
+        array = planes.view(np.uint8).ravel()
+        view = RGB16_Planar().expand_planar(array, 7, 5)
+        self.assertTrue(np.array_equal(planes, view))
+        self.assertTrue(np.shares_memory(array, view))
+        out = np.empty((3, 5, 7), dtype=np.uint16)
+        self.assertIs(out, RGB16_Planar().expand_planar(array, 7, 5, out=out))
+        self.assertTrue(np.array_equal(planes, out))
+        with self.assertRaises(ValueError):
+            Mono16().expand_planar(array, 7, 5)
+
+    def test_concurrent_chunks(self):
+        # The workers must not be capped by set_num_workers:
+        set_num_workers(1)
+        num_workers = 4
+        barrier = threading.Barrier(num_workers, timeout=5)
+
+        def unpack(packed, unpacked):
+            # Every chunk waits for the others; it fails unless all of
+            # them run at the same time:
+            barrier.wait()
+            unpacked[:] = 0
+
+        proxy = Mono12p()
+        nr_groups = num_workers * _min_num_groups_per_chunk
+        packed = np.zeros((nr_groups, 3), dtype=np.uint8)
+        unpacked = np.ones((nr_groups, 2), dtype=np.uint16)
+        proxy._unpack_in_chunks(packed, unpacked, num_workers, unpack=unpack)
+        self.assertFalse(unpacked.any())
+
+    def test_invalid_num_workers(self):
+        with self.assertRaises(ValueError):
+            set_num_workers(0)
+
+
+class TestDemosaic(unittest.TestCase):
+    _patterns = {
+        # The pattern and the channels of the 2x2 unit cell:
+        'RG': ((0, 1), (1, 2)),
+        'GR': ((1, 0), (2, 1)),
+        'GB': ((1, 2), (0, 1)),
+        'BG': ((2, 1), (1, 0)),
+    }
+
+    def _create_mosaic(self, pattern, rgb, shape=(6, 8), dtype=np.uint16):
+        # Returns a mosaic of a uniformly colored image:
+        mosaic = np.empty(shape, dtype=dtype)
+        for dy, row in enumerate(self._patterns[pattern]):
+            for dx, channel in enumerate(row):
+                mosaic[dy::2, dx::2] = rgb[channel]
+        return mosaic
+
+    def test_uniform_color(self):
+        rgb = (100, 2000, 4000)
+        for pattern in self._patterns:
+            mosaic = self._create_mosaic(pattern, rgb)
+            for method in ['bilinear', 'nearest']:
+                image = demosaic(mosaic, pattern, method=method)
+                self.assertEqual((6, 8, 3), image.shape)
+                self.assertTrue(np.all(image == rgb))
+            image = demosaic(mosaic, pattern, method='superpixel')
+            self.assertEqual((3, 4, 3), image.shape)
+            self.assertTrue(np.all(image == rgb))
+            image = demosaic(mosaic, pattern, order='BGR')
+            self.assertTrue(np.all(image == rgb[::-1]))
+
+    def test_bilinear(self):
+        mosaic = np.arange(48, dtype=np.uint8).reshape(6, 8)
+        image = demosaic(mosaic, 'RG')
+        # R site at (2, 2); G is of the 4 neighbors and B is of the 4
+        # diagonal neighbors:
+        self.assertEqual((18, 18, 18), tuple(image[2, 2]))
+        # G site at (2, 3) in an R row:
+        self.assertEqual((19, 19, 19), tuple(image[2, 3]))
+        # B site at (1, 1), R is of the diagonal neighbors:
+        self.assertEqual((9, 9, 9), tuple(image[1, 1]))
+
+    def test_out(self):
+        mosaic = self._create_mosaic('BG', (1, 2, 3), dtype=np.uint8)
+        out = np.empty((6, 8, 3), dtype=np.uint8)
+        self.assertIs(out, demosaic(mosaic, 'BG', out=out))
+        with self.assertRaises(ValueError):
+            demosaic(mosaic, 'BG', out=np.empty((6, 8, 3), np.uint16))
+        with self.assertRaises(ValueError):
+            demosaic(mosaic[:5], 'BG')
+
+    def test_expand_and_demosaic(self):
+        mosaic = self._create_mosaic('GR', (10, 20, 30))
+        pool = ArrayPool()
+        for symbolic, array in [
+                ('BayerGR12p', _pack_p(mosaic.ravel(), 12)),
+                ('BayerGR12Packed', _pack_group(mosaic.ravel(), 12)),
+                ('BayerGR16', mosaic.view(np.uint8).ravel())]:
+            image = expand_and_demosaic(
+                Dictionary.get_proxy(symbolic), array, 8, 6, pool=pool
+            )
+            self.assertTrue(np.all(image == (10, 20, 30)))
+        with self.assertRaises(ValueError):
+            expand_and_demosaic(
+                Dictionary.get_proxy('Mono8'), np.zeros(48, np.uint8), 8, 6
+            )
+
+    def test_expand_and_demosaic_padding(self):
+        mosaic = np.random.default_rng(0).integers(
+            0, 1 << 12, (6, 8), dtype=np.uint16
+        )
+        for symbolic, lines in [
+                ('BayerRG8', mosaic.astype(np.uint8)),
+                ('BayerRG12p', [_pack_p(line, 12) for line in mosaic])]:
+            proxy = Dictionary.get_proxy(symbolic)
+            lines = [np.asarray(line, np.uint8).ravel() for line in lines]
+            array = np.concatenate(lines)
+            expected = expand_and_demosaic(proxy, array, 8, 6)
+            # The bytes that follow the image don't shear it:
+            trailing = np.concatenate([array, np.full(8, 0xff, np.uint8)])
+            self.assertTrue(
+                np.array_equal(
+                    expected, expand_and_demosaic(proxy, trailing, 8, 6)
+                )
+            )
+            # Nor does the padding at the end of every line:
+            padded = np.concatenate(
+                [np.concatenate([line, np.full(3, 0xff, np.uint8)])
+                 for line in lines]
+            )
+            self.assertTrue(
+                np.array_equal(
+                    expected, expand_and_demosaic(
+                        proxy, padded, 8, 6, pool=ArrayPool(), x_padding=3
+                    )
+                )
+            )
+
+
+class TestYUV(unittest.TestCase):
+    _width = 8
+    _height = 2
+
+    def _create_uyvy(self, y, u, v):
+        array = np.empty(y.size * 2, dtype=np.uint8)
+        groups = array.reshape(-1, 4)
+        groups[:, 0], groups[:, 1] = u, y[0::2]
+        groups[:, 2], groups[:, 3] = v, y[1::2]
+        return array
+
+    def test_gray(self):
+        # A neutral chroma gives a gray of the luma in the full range and
+        # stretches the luma in the limited range:
+        y = np.full(16, 100, dtype=np.uint8)
+        c = np.full(8, 128, dtype=np.uint8)
+        for symbolic, expected in [('YUV422_8_UYVY', 100),
+                                   ('YCbCr709_422_8_CbYCrY', 98)]:
+            image = yuv_to_rgb(
+                Dictionary.get_proxy(symbolic), self._create_uyvy(y, c, c),
+                self._width, self._height
+            )
+            self.assertEqual((2, 8, 3), image.shape)
+            self.assertEqual(np.uint8, image.dtype)
+            self.assertTrue(np.all(image == expected))
+
+    def test_bt601_full_range(self):
+        y = np.array([76, 76, 150, 150, 29, 29, 255, 255] * 2, np.uint8)
+        u = np.array([85, 44, 255, 128] * 2, dtype=np.uint8)
+        v = np.array([255, 21, 107, 128] * 2, dtype=np.uint8)
+        image = yuv_to_rgb(
+            Dictionary.get_proxy('YUV422_8_UYVY'),
+            self._create_uyvy(y, u, v), self._width, self._height
+        )
+        # Red, green, blue, and white:
+        self.assertTrue(np.allclose((254, 0, 0), image[0, 0], atol=1))
+        self.assertTrue(np.allclose((0, 255, 1), image[0, 2], atol=1))
+        self.assertTrue(np.allclose((0, 0, 255), image[0, 4], atol=1))
+        self.assertTrue(np.all(image[0, 7] == 255))
+        bgr = yuv_to_rgb(
+            Dictionary.get_proxy('YUV422_8_UYVY'),
+            self._create_uyvy(y, u, v), self._width, self._height,
+            order='BGR'
+        )
+        self.assertTrue(np.array_equal(image, bgr[..., ::-1]))
+
+    def test_planar(self):
+        y = np.arange(16, dtype=np.uint8)
+        u = np.arange(100, 104, dtype=np.uint8)
+        v = np.arange(200, 204, dtype=np.uint8)
+        array = np.empty(24, dtype=np.uint8)
+        groups = array.reshape(-1, 6)
+        groups[:, 0], groups[:, 3] = u, v
+        groups[:, 1], groups[:, 2] = y[0::4], y[1::4]
+        groups[:, 4], groups[:, 5] = y[2::4], y[3::4]
+        y_plane, u_plane, v_plane = yuv_to_planar(
+            Dictionary.get_proxy('YUV411_8_UYYVYY'), array,
+            self._width, self._height
+        )
+        self.assertTrue(np.array_equal(y.reshape(2, 8), y_plane))
+        self.assertTrue(np.array_equal(u.reshape(2, 2), u_plane))
+        self.assertTrue(np.array_equal(v.reshape(2, 2), v_plane))
+
+    def test_not_yuv(self):
+        with self.assertRaises(ValueError):
+            yuv_to_rgb(
+                Dictionary.get_proxy('Mono8'), np.zeros(16, np.uint8), 4, 4
+            )
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_benchmark(self):
+        result = run_benchmark(
+            symbolics=['Mono8', 'Mono12p', 'RGB10V1Packed'],
+            resolutions=[(8, 4), (4, 2)], repeat=1
+        )
+        self.assertEqual(6, len(result['results']))
+        for case in result['results']:
+            self.assertNotIn('error', case)
+            self.assertGreater(case['mb_per_s'], 0)
+            self.assertGreater(case['pixels_per_s'], 0)
+        with self.assertRaises(ValueError):
+            run_benchmark(repeat=0)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as dir_name:
+            file_path = os.path.join(dir_name, 'result.json')
+            self.assertEqual(0, main([
+                '--format', 'Mono10p', '--resolution', '16x2',
+                '--repeat', '1', '--output', file_path
+            ]))
+            with open(file_path) as file:
+                result = json.load(file)
+        self.assertEqual(
+            ['Mono10p'], [case['symbolic'] for case in result['results']]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
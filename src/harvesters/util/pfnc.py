@@ -19,20 +19,28 @@
 
 
 # Standard library imports
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
-from typing import Optional
+from math import ceil
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, NamedTuple, Optional, Union
 
 # Related third party imports
 import numpy
+from numpy.lib.stride_tricks import as_strided
 
 # Local application/library specific imports
 from harvesters.util._pfnc import symbolics as _symbolics
+from harvesters.util.logging import get_logger
 
 #
 symbolics = _symbolics
 dict_by_ints = symbolics
 dict_by_names = {n: i for i, n in symbolics.items()}
 
+_logger = get_logger(name=__name__)
+
 # 32-bit value layout
 # |31            24|23            16|15            08|07            00|
 # | C| Comp. Layout| Effective Size |            Pixel ID             |
@@ -77,18 +85,8 @@ def get_bits_per_pixel(data_format):
     So without padding.
     Returns None if format is not known.
     """
-    if data_format in component_8bit_formats:
-        return 8
-    elif data_format in component_10bit_formats:
-        return 10
-    elif data_format in component_12bit_formats:
-        return 12
-    elif data_format in component_14bit_formats:
-        return 14
-    elif data_format in component_16bit_formats:
-        return 16
-    # format not known
-    return None
+    info = get_pixel_format_info(data_format)
+    return info.bits_per_pixel if info else None
 
 
 mono_location_formats = [
@@ -153,6 +151,11 @@ lmn_444_location_formats = [
     'RGB14',
     'RGB16',
     #
+    'RGB8_Planar',
+    'RGB10_Planar',
+    'RGB12_Planar',
+    'RGB16_Planar',
+    #
     'BGR8',
     'BGR10',
     'BGR12',
@@ -170,6 +173,8 @@ lmn_444_location_formats = [
 lmn_444_packed_location_formats = [
     #
     'RGB8Packed',
+    'RGB10V1Packed',
+    'RGB12V1Packed',
     #
     'Coord3D_ABC10p',
     'Coord3D_ABC10p_Planar',
@@ -313,6 +318,7 @@ uint8_formats = [
     'Mono8',
     #
     'RGB8',
+    'RGB8_Planar',
     'RGB8Packed',
     'RGBa8',
     #
@@ -348,6 +354,10 @@ uint16_formats = [
     'RGB14',
     'RGB16',
     #
+    'RGB10_Planar',
+    'RGB12_Planar',
+    'RGB16_Planar',
+    #
     'BGR10',
     'BGR12',
     'BGR14',
@@ -521,6 +531,10 @@ component_32bit_formats = [
 ]
 
 component_2d_formats = [
+    #
+    'Mono1p',
+    'Mono2p',
+    'Mono4p',
     #
     'Mono8',
     'Mono10',
@@ -537,6 +551,15 @@ component_2d_formats = [
     'RGB14',
     'RGB16',
     #
+    'RGB8Packed',
+    'RGB10V1Packed',
+    'RGB12V1Packed',
+    #
+    'RGB8_Planar',
+    'RGB10_Planar',
+    'RGB12_Planar',
+    'RGB16_Planar',
+    #
     'BGR8',
     'BGR10',
     'BGR12',
@@ -698,6 +721,8 @@ class _DataSize(IntEnum):
     UINT16 = 3
     UINT32 = 4
     FLOAT32 = 5
+    # Values that are narrower than a byte and are packed to bytes:
+    BITS = 6
 
 
 class _Location(IntEnum):
@@ -740,6 +765,10 @@ class _Alignment:
     def unpacked_size(self):
         return self._get_size(self.unpacked) / 8
 
+    @property
+    def unpacked_dtype(self):
+        return self._get_dtype(self.unpacked)
+
     @property
     def packed(self):
         return self._packed
@@ -749,7 +778,7 @@ class _Alignment:
 
     @staticmethod
     def _get_size(index: IntEnum):
-        if (index == _DataSize.INT8) or (index == _DataSize.UINT8):
+        if index in (_DataSize.INT8, _DataSize.UINT8, _DataSize.BITS):
             return 8
         elif index == _DataSize.UINT16:
             return 16
@@ -758,6 +787,120 @@ class _Alignment:
         else:
             raise ValueError
 
+    @staticmethod
+    def _get_dtype(index: IntEnum):
+        return {
+            _DataSize.INT8: numpy.int8,
+            _DataSize.UINT8: numpy.uint8,
+            _DataSize.BITS: numpy.uint8,
+            _DataSize.UINT16: numpy.uint16,
+            _DataSize.UINT32: numpy.uint32,
+            _DataSize.FLOAT32: numpy.float32,
+        }[index]
+
+
+def create_lut(
+        nr_bits: int, shift: Optional[int] = None,
+        gamma: float = 1.0) -> numpy.ndarray:
+    """
+    Creates a look-up table that maps the values of the given depth to
+    uint8; it can be given to :meth:`expand_to_uint8` of a pixel format.
+
+    :param nr_bits: Set the depth of the values in bits.
+    :param shift: Set the number of bits to shift each value to the right; the result is saturated at 255. The depth minus 8 is used if it is :const:`None`.
+    :param gamma: Set the gamma; the normalized value is raised to 1 / gamma. It is applied after the shift.
+
+    :return: A uint8 array of 2 ** nr_bits elements.
+    :rtype: numpy.ndarray
+    """
+    #
+    if shift is None:
+        shift = max(nr_bits - 8, 0)
+    if gamma <= 0:
+        raise ValueError('The gamma must be positive.')
+
+    #
+    values = numpy.minimum(
+        numpy.arange(1 << nr_bits, dtype=numpy.uint32) >> shift, 255
+    )
+    if gamma != 1.0:
+        values = numpy.rint(
+            255. * numpy.power(values / 255., 1. / gamma)
+        )
+    return values.astype(numpy.uint8)
+
+
+def _to_uint8(
+        values: numpy.ndarray, out: numpy.ndarray, shift: int,
+        lut: Optional[numpy.ndarray]) -> None:
+    """
+    Writes the given uint8 or uint16 values to the given uint8 array through
+    the look-up table if there is, otherwise shifting them to the right.
+    """
+    if lut is not None:
+        # Clipping spares the temporary copy that 'raise' makes for out:
+        numpy.take(lut, values, out=out, mode='clip')
+    elif shift or values.dtype != numpy.uint8:
+        numpy.right_shift(values, shift, out=out, casting='unsafe')
+    else:
+        numpy.copyto(out, values)
+
+
+class ArrayPool:
+    """
+    Keeps released NumPy arrays so that the following frames can be
+    expanded to the memory that has been already touched instead of newly
+    allocated one.
+    """
+    def __init__(self, max_num_arrays: int = 4):
+        """
+        :param max_num_arrays: Set the maximum number of the released arrays that it keeps per shape and data type.
+        """
+        #
+        super().__init__()
+        #
+        self._max_num_arrays = max_num_arrays
+        self._arrays = {}
+        self._lock = Lock()
+
+    def acquire(self, shape, dtype) -> numpy.ndarray:
+        """
+        Returns an array of the given shape and data type; it is taken
+        from the released ones if there is.
+
+        :param shape: Set the shape of the array.
+        :param dtype: Set the data type of the array.
+
+        :return: An array; note that its content is undefined.
+        :rtype: numpy.ndarray
+        """
+        key = (shape if isinstance(shape, tuple) else (shape,),
+               numpy.dtype(dtype))
+        with self._lock:
+            arrays = self._arrays.get(key)
+            if arrays:
+                return arrays.pop()
+        return numpy.empty(key[0], dtype=key[1])
+
+    def release(self, array: numpy.ndarray) -> None:
+        """
+        Gives back the given array so that it can be reused. You must not
+        touch the array once it has been released.
+
+        :param array: Set the array to give back.
+
+        :return: None.
+        """
+        key = (array.shape, array.dtype)
+        with self._lock:
+            arrays = self._arrays.setdefault(key, [])
+            if len(arrays) < self._max_num_arrays:
+                arrays.append(array)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._arrays.clear()
+
 
 class _PixelFormat:
     def __init__(
@@ -775,9 +918,398 @@ class _PixelFormat:
         #
         self._check_validity()
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Expands the given packed data to an array of the unpacked data type.
+
+        This method is abstract and should be reimplemented in any sub-class.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param out: Set an array to write the expanded data; it must be C contiguous and must have the unpacked data type and the expanded size. A newly allocated one is used if it is :const:`None`.
+
+        :return: The expanded data; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
         raise NotImplementedError
 
+    def pack(
+            self, values: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Packs the given values to the bytes that :meth:`expand` takes; it is
+        the inverse of :meth:`expand`.
+
+        :param values: Set an array of the unpacked data type; it is packed in the C order.
+        :param out: Set a C contiguous uint8 array of the packed size to write the packed data. A newly allocated one is used if it is :const:`None`.
+
+        :return: The packed data; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        if self.alignment.is_packed():
+            raise NotImplementedError
+        values = numpy.ascontiguousarray(
+            values, dtype=self.alignment.unpacked_dtype
+        )
+        return self._fill(values.reshape(-1).view(numpy.uint8), out)
+
+    def packed_size(self, nr_values: int) -> int:
+        """
+        Returns the number of bytes that :meth:`pack` produces from the
+        given number of values.
+
+        :param nr_values: Set the number of values.
+
+        :return: The number of bytes.
+        :rtype: int
+        """
+        return nr_values * int(self.alignment.unpacked_size)
+
+    def expanded_size(self, nr_bytes: int) -> int:
+        """
+        Returns the number of values that :meth:`expand` produces from the
+        given number of bytes.
+
+        :param nr_bytes: Set the number of bytes.
+
+        :return: The number of values.
+        :rtype: int
+        """
+        return nr_bytes // int(self.alignment.unpacked_size)
+
+    @staticmethod
+    def _get_output(
+            out: Optional[numpy.ndarray], size: int,
+            dtype) -> numpy.ndarray:
+        #
+        if out is None:
+            return numpy.empty(size, dtype=dtype)
+
+        #
+        if out.dtype != dtype or out.size != size or \
+                not out.flags.c_contiguous:
+            raise ValueError(
+                'The output must be a C contiguous {0} array of '
+                '{1} elements.'.format(numpy.dtype(dtype).name, size)
+            )
+        return out.reshape(size)
+
+    def _fill(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray]) -> numpy.ndarray:
+        #
+        if out is None:
+            return array
+
+        #
+        numpy.copyto(self._get_output(out, array.size, array.dtype), array)
+        return out
+
+    def expand_to_uint8(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None, shift: Optional[int] = None,
+            lut: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Expands the given data to a uint8 array. Every value is mapped
+        through the given look-up table if there is, otherwise it is shifted
+        to the right and is saturated at 255.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param out: Set a C contiguous uint8 array of the expanded size to write the data. A newly allocated one is used if it is :const:`None`.
+        :param shift: Set the number of bits to shift each value to the right. The unit depth minus 8 is used if it is :const:`None`.
+        :param lut: Set a 1D uint8 array that maps each value to the output; it must have 2 ** unit depth elements at least. See :func:`create_lut`.
+
+        :return: The expanded data; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        #
+        shift, lut = self._get_uint8_mapping(shift, lut)
+        values = self.expand(array)
+        unpacked = self._get_output(out, values.size, numpy.uint8)
+        _to_uint8(values, unpacked, shift, lut)
+        return unpacked if out is None else out
+
+    def _get_uint8_mapping(
+            self, shift: Optional[int], lut: Optional[numpy.ndarray]):
+        #
+        dtype = self.alignment.unpacked_dtype
+        if dtype not in (numpy.uint8, numpy.uint16):
+            raise ValueError(
+                '{0} can not be converted to uint8.'.format(self.symbolic)
+            )
+
+        #
+        nr_bits = min(self.unit_depth_in_bit, 16)
+        if lut is not None:
+            if lut.dtype != numpy.uint8 or lut.ndim != 1 or \
+                    lut.size < (1 << nr_bits):
+                raise ValueError(
+                    'The look-up table must be a 1D uint8 array of '
+                    '{0} elements at least.'.format(1 << nr_bits)
+                )
+            return 0, lut
+
+        #
+        if shift is None:
+            shift = max(nr_bits - 8, 0)
+        if shift < 0:
+            raise ValueError('The shift must not be negative.')
+        if shift + 8 >= nr_bits:
+            # Nothing can exceed 255 so a plain shift does the job:
+            return shift, None
+        return 0, create_lut(nr_bits, shift=shift)
+
+    def expand_planar(
+            self, array: numpy.ndarray, width: int, height: int,
+            out: Optional[numpy.ndarray] = None,
+            num_workers: Optional[int] = None) -> numpy.ndarray:
+        """
+        Expands the given data of a planar format to a (components, height,
+        width) array. Unpacked planes are not copied unless :data:`out` is
+        given; packed planes are unpacked one by one, in parallel if there
+        are worker threads.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param width: Set the width of the image.
+        :param height: Set the height of the image.
+        :param out: Set a C contiguous array of the unpacked data type and of (components, height, width) elements to write the planes. The returned array is a view of the given data if it is :const:`None` and the planes are not packed.
+        :param num_workers: Set the number of worker threads that unpack the planes in parallel. The value given to :func:`set_num_workers` is used if it is :const:`None`.
+
+        :return: The planes; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        #
+        shape = self._get_planar_shape(width, height)
+        size = shape[0] * shape[1] * shape[2]
+        planes = self.expand(array)[:size].reshape(shape)
+        if out is None:
+            return planes
+
+        #
+        numpy.copyto(
+            self._get_output(out, size, planes.dtype).reshape(shape), planes
+        )
+        return out
+
+    def expand_image(
+            self, array: numpy.ndarray, width: int, height: int,
+            out: Optional[numpy.ndarray] = None,
+            pool: Optional[ArrayPool] = None) -> numpy.ndarray:
+        """
+        Expands the given data to an image; it is shaped as (height, width,
+        components), or (components, height, width) if it is a planar
+        format. The components axis is dropped if there is only one; see
+        :meth:`get_image_shape` for a format that has a fractional number
+        of components per pixel. Unpacked data is not copied unless
+        :data:`out` is given.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param width: Set the width of the image.
+        :param height: Set the height of the image.
+        :param out: Set a C contiguous array of the unpacked data type and of the image size to write the image.
+        :param pool: Set an :class:`ArrayPool` object to take the output from if the data is packed and :data:`out` is :const:`None`; you can give it back to the pool once you have done with it.
+
+        :return: The image; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        #
+        shape = self.get_image_shape(width, height)
+        size = int(numpy.prod(shape))
+        dtype = self.alignment.unpacked_dtype
+        if out is None and pool is not None and self.alignment.is_packed():
+            out = pool.acquire(shape, dtype)
+
+        #
+        if self.is_planar:
+            return self.expand_planar(array, width, height, out=out)
+        if out is None:
+            return self.expand(array)[:size].reshape(shape)
+
+        #
+        image = self._get_output(out, size, dtype)
+        if self.expanded_size(array.shape[0]) == size:
+            self.expand(array, out=image)
+        else:
+            # There are trailing bytes such as padding:
+            numpy.copyto(image, self.expand(array)[:size])
+        return out
+
+    def expand_roi(
+            self, array: numpy.ndarray, width: int, height: int, x: int,
+            y: int, roi_width: int, roi_height: int, x_padding: int = 0,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Expands only the given region of the image; the bytes outside of
+        the region are not touched unless they share a packed group with
+        the region.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param width: Set the width of the image.
+        :param height: Set the height of the image.
+        :param x: Set the X coordinate of the top left corner of the region.
+        :param y: Set the Y coordinate of the top left corner of the region.
+        :param roi_width: Set the width of the region.
+        :param roi_height: Set the height of the region.
+        :param x_padding: Set the number of bytes that pad every line.
+        :param out: Set a C contiguous array of the unpacked data type and of the region size to write the region.
+
+        :return: The region shaped as (height, width, components); the components axis is dropped if there is only one. It is a view of the given data if the data is not packed and :data:`out` is :const:`None`.
+        :rtype: numpy.ndarray
+        """
+        #
+        if self.is_planar:
+            raise ValueError(
+                '{0} is a planar format.'.format(self.symbolic)
+            )
+        if int(self._nr_components) != self._nr_components:
+            raise ValueError(
+                'The components of {0} can\'t be split into pixels.'.format(
+                    self.symbolic
+                )
+            )
+        if x < 0 or y < 0 or roi_width < 1 or roi_height < 1 or \
+                x + roi_width > width or y + roi_height > height:
+            raise ValueError('The region is out of the image.')
+
+        #
+        nr_components = int(self._nr_components)
+        if self.alignment.is_packed():
+            region = self._expand_packed_roi(
+                array, width, x, y, roi_width, roi_height, x_padding
+            )
+        else:
+            region = self._get_unpacked_roi(
+                array, width, x, y, roi_width, roi_height, x_padding
+            )
+        if nr_components > 1:
+            region = region.reshape(roi_height, roi_width, nr_components)
+        if out is None:
+            return region
+
+        #
+        numpy.copyto(
+            self._get_output(out, region.size, region.dtype).reshape(
+                region.shape
+            ), region
+        )
+        return out
+
+    def _get_unpacked_roi(
+            self, array: numpy.ndarray, width: int, x: int, y: int,
+            roi_width: int, roi_height: int,
+            x_padding: int) -> numpy.ndarray:
+        #
+        nr_components = int(self._nr_components)
+        item_size = int(self.alignment.unpacked_size)
+        stride = width * nr_components * item_size + x_padding
+        offset = y * stride + x * nr_components * item_size
+        nr_bytes = roi_width * nr_components * item_size
+        self._check_nr_bytes(
+            array, offset + (roi_height - 1) * stride + nr_bytes
+        )
+        return numpy.ndarray(
+            shape=(roi_height, roi_width * nr_components),
+            dtype=self.alignment.unpacked_dtype, buffer=array,
+            offset=offset, strides=(stride, item_size)
+        )
+
+    def _expand_packed_roi(
+            self, array: numpy.ndarray, width: int, x: int, y: int,
+            roi_width: int, roi_height: int,
+            x_padding: int) -> numpy.ndarray:
+        #
+        nr_components = int(self._nr_components)
+        nr_packed, nr_unpacked = self._nr_packed, self._nr_unpacked
+        nr_values = width * nr_components
+        nr_roi_values = roi_width * nr_components
+        if nr_values % nr_unpacked == 0:
+            # Every line starts at a group boundary so that only the groups
+            # that the region covers have to be taken from each line:
+            stride = nr_values // nr_unpacked * nr_packed + x_padding
+            first = x * nr_components // nr_unpacked
+            last = ceil((x + roi_width) * nr_components / nr_unpacked)
+            offset = y * stride + first * nr_packed
+            nr_bytes = (last - first) * nr_packed
+            self._check_nr_bytes(
+                array, offset + (roi_height - 1) * stride + nr_bytes
+            )
+            packed = as_strided(
+                array[offset:], shape=(roi_height, nr_bytes),
+                strides=(stride, 1)
+            )
+            values = self.expand(numpy.ascontiguousarray(packed).ravel())
+            start = x * nr_components - first * nr_unpacked
+            return values.reshape(roi_height, -1)[
+                :, start:start + nr_roi_values
+            ]
+
+        # Otherwise a group can straddle two lines; it is possible only if
+        # there is no padding because the lines are a single stream:
+        if x_padding:
+            raise ValueError(
+                'The lines of {0} pixels do not start at a boundary of '
+                'the packed data.'.format(width)
+            )
+        first_value = (y * width + x) * nr_components
+        last_value = first_value + (roi_height - 1) * nr_values + \
+            nr_roi_values
+        first = first_value // nr_unpacked
+        last = ceil(last_value / nr_unpacked)
+        values = self.expand(array[first * nr_packed:last * nr_packed])
+        start = first_value - first * nr_unpacked
+        if values.shape[0] < last_value - first * nr_unpacked:
+            raise ValueError('The data is shorter than the image.')
+        return as_strided(
+            values[start:], shape=(roi_height, nr_roi_values),
+            strides=(nr_values * values.itemsize, values.itemsize)
+        )
+
+    @staticmethod
+    def _check_nr_bytes(array: numpy.ndarray, nr_bytes: int) -> None:
+        if array.shape[0] < nr_bytes:
+            raise ValueError('The data is shorter than the image.')
+
+    def get_image_shape(self, width: int, height: int) -> tuple:
+        """
+        Returns the shape of the image that :meth:`expand_image` returns.
+        A format that has a fractional number of components per pixel,
+        such as YUV411_8_UYYVYY, is shaped as (height, width * components)
+        as :meth:`~harvesters.core.Component2DImage.represent_pixel_location`
+        does because its components can't be split into pixels.
+
+        :param width: Set the width of the image.
+        :param height: Set the height of the image.
+
+        :return: The shape.
+        :rtype: tuple
+        """
+        nr_components = int(self._nr_components)
+        if nr_components != self._nr_components:
+            return height, int(width * self._nr_components)
+        if self.is_planar:
+            return nr_components, height, width
+        if nr_components > 1:
+            return height, width, nr_components
+        return height, width
+
+    def _get_planar_shape(self, width: int, height: int):
+        if not self.is_planar:
+            raise ValueError(
+                '{0} is not a planar format.'.format(self.symbolic)
+            )
+        return int(self._nr_components), height, width
+
+    @property
+    def is_planar(self) -> bool:
+        """
+        :const:`True` if the components are stored as separate planes.
+
+        :getter: Returns itself.
+        :type: bool
+        """
+        return self._symbolic.endswith('_Planar')
+
     @property
     def alignment(self):
         return self._alignment
@@ -790,6 +1322,10 @@ class _PixelFormat:
     def nr_components(self):
         return self._nr_components
 
+    @property
+    def unit_depth_in_bit(self):
+        return self._unit_depth_in_bit
+
     @property
     def depth_in_bit(self):
         return self._nr_components * self._unit_depth_in_bit
@@ -802,6 +1338,19 @@ class _PixelFormat:
     def location(self):
         return self._location
 
+    @property
+    def bayer_pattern(self) -> Optional[str]:
+        """
+        The Bayer pattern, i.e., the first two pixels of the first row such
+        as 'RG'. :const:`None` if it is not a Bayer format.
+
+        :getter: Returns itself.
+        :type: str
+        """
+        if self._location != _Location.BAYER:
+            return None
+        return self._symbolic[5:7]
+
     def _check_validity(self):
         assert self._alignment
         assert self._symbolic
@@ -836,7 +1385,9 @@ class _Unpacked(_PixelFormat):
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         raise NotImplementedError
 
 # ----
@@ -855,8 +1406,10 @@ class _UnpackedUint8(_Unpacked):
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array, out)
 
 
 class _UnpackedInt8(_Unpacked):
@@ -872,8 +1425,10 @@ class _UnpackedInt8(_Unpacked):
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.int8)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.int8), out)
 
 
 class _UnpackedUint16(_Unpacked):
@@ -889,8 +1444,10 @@ class _UnpackedUint16(_Unpacked):
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.uint16)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.uint16), out)
 
 
 class _UnpackedFloat32(_Unpacked):
@@ -906,8 +1463,10 @@ class _UnpackedFloat32(_Unpacked):
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.float32)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.float32), out)
 
 
 # ----
@@ -1236,7 +1795,71 @@ class Confidence32f(_MonoUnpackedFloat32):
 # ----
 
 
+# The number of worker threads that decode a packed frame; NumPy releases
+# the GIL in the kernels so that the chunks can be decoded in parallel:
+_num_workers = 1
+# The minimum number of groups that is worth dispatching to a worker:
+_min_num_groups_per_chunk = 1 << 16
+# The number of uint16 values that a packed frame is unpacked to at a time
+# when it is converted to uint8; the scratch should stay in the cache:
+_nr_values_per_scratch = 1 << 17
+_executor = None
+_executor_size = 0
+_executor_lock = Lock()
+
+
+def get_num_workers() -> int:
+    """
+    Returns the number of worker threads that decode a packed frame.
+
+    :return: The number of worker threads.
+    :rtype: int
+    """
+    return _num_workers
+
+
+def set_num_workers(num_workers: int) -> None:
+    """
+    Sets the number of worker threads that decode a packed frame. The
+    workers belong to a thread pool that is shared by every pixel format;
+    1 means that a frame is decoded in the calling thread. The pool grows
+    on demand if a call asks for more workers than this.
+
+    :param num_workers: Set the number of worker threads.
+
+    :return: None.
+    """
+    global _num_workers
+    #
+    if num_workers < 1:
+        raise ValueError('The number of workers must be > 0.')
+    #
+    with _executor_lock:
+        _num_workers = num_workers
+
+
+def _get_executor(num_workers: int) -> ThreadPoolExecutor:
+    global _executor, _executor_size
+    #
+    with _executor_lock:
+        if _executor is None or _executor_size < num_workers:
+            # The pool can't grow; let a larger one take over. The old one
+            # is not shut down because another thread may still be
+            # submitting to it; its workers exit once it's collected:
+            _executor_size = max(num_workers, _num_workers)
+            _executor = ThreadPoolExecutor(
+                max_workers=_executor_size,
+                thread_name_prefix='harvesters_pfnc'
+            )
+        return _executor
+
+
 class _Packed(_PixelFormat):
+    # The number of bytes that form a group and the number of values that
+    # the group carries; a concrete class must define them:
+    _nr_packed = None
+    _nr_unpacked = None
+
     def __init__(
             self, symbolic: str = None, nr_components=None,
             unit_depth_in_bit: int = None, location: _Location = None):
@@ -1251,25 +1874,289 @@ class _Packed(_PixelFormat):
             location=location
         )
 
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None,
+            num_workers: Optional[int] = None) -> numpy.ndarray:
+        """
+        Expands the given packed data to a uint16 array.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param out: Set a C contiguous uint16 array of the expanded size to write the expanded data. A newly allocated one is used if it is :const:`None`.
+        :param num_workers: Set the number of worker threads that decode the data in parallel. The value given to :func:`set_num_workers` is used if it is :const:`None`.
+
+        :return: The expanded data; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        #
+        size = self.expanded_size(array.shape[0])
+        unpacked = self._get_output(out, size, numpy.uint16)
+
+        # Unpack the complete groups straight into the output:
+        nr_groups = array.shape[0] // self._nr_packed
+        nr_values = nr_groups * self._nr_unpacked
+        packed_groups = array[:nr_groups * self._nr_packed].reshape(
+            nr_groups, self._nr_packed
+        )
+        unpacked_groups = unpacked[:nr_values].reshape(
+            nr_groups, self._nr_unpacked
+        )
+        self._unpack_in_chunks(
+            packed_groups, unpacked_groups,
+            num_workers if num_workers else _num_workers
+        )
+
+        # Then unpack the incomplete group at the tail if there is:
+        if nr_values < size:
+            self._unpack_tail(
+                array[nr_groups * self._nr_packed:], unpacked[nr_values:]
+            )
+        #
+        return unpacked if out is None else out
+
+    def expand_to_uint8(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None, shift: Optional[int] = None,
+            lut: Optional[numpy.ndarray] = None,
+            num_workers: Optional[int] = None) -> numpy.ndarray:
+        """
+        Expands the given packed data to a uint8 array without creating the
+        whole uint16 array; every group is unpacked to a small scratch that
+        stays in the cache and is then written to the output.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param out: Set a C contiguous uint8 array of the expanded size to write the data. A newly allocated one is used if it is :const:`None`.
+        :param shift: Set the number of bits to shift each value to the right. The unit depth minus 8 is used if it is :const:`None`.
+        :param lut: Set a 1D uint8 array that maps each value to the output; it must have 2 ** unit depth elements at least. See :func:`create_lut`.
+        :param num_workers: Set the number of worker threads that decode the data in parallel. The value given to :func:`set_num_workers` is used if it is :const:`None`.
+
+        :return: The expanded data; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        #
+        shift, lut = self._get_uint8_mapping(shift, lut)
+        size = self.expanded_size(array.shape[0])
+        unpacked = self._get_output(out, size, numpy.uint8)
+
+        #
+        nr_groups = array.shape[0] // self._nr_packed
+        nr_values = nr_groups * self._nr_unpacked
+        packed_groups = array[:nr_groups * self._nr_packed].reshape(
+            nr_groups, self._nr_packed
+        )
+        unpacked_groups = unpacked[:nr_values].reshape(
+            nr_groups, self._nr_unpacked
+        )
+
+        def unpack(packed, values):
+            self._unpack_to_uint8(packed, values, shift, lut)
+
+        self._unpack_in_chunks(
+            packed_groups, unpacked_groups,
+            num_workers if num_workers else _num_workers, unpack=unpack
+        )
+
+        #
+        if nr_values < size:
+            values = numpy.empty(size - nr_values, dtype=numpy.uint16)
+            self._unpack_tail(array[nr_groups * self._nr_packed:], values)
+            _to_uint8(values, unpacked[nr_values:], shift, lut)
+        #
+        return unpacked if out is None else out
+
+    def _unpack_to_uint8(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray,
+            shift: int, lut: Optional[numpy.ndarray]) -> None:
+        #
+        kernel = _get_kernel(self)
+        step = max(_nr_values_per_scratch // self._nr_unpacked, 1)
+        scratch = numpy.empty(
+            (min(step, packed.shape[0]), self._nr_unpacked),
+            dtype=numpy.uint16
+        )
+        for i in range(0, packed.shape[0], step):
+            values = scratch[:packed[i:i + step].shape[0]]
+            kernel(packed[i:i + step], values)
+            _to_uint8(values, unpacked[i:i + step], shift, lut)
+
+    def expand_planar(
+            self, array: numpy.ndarray, width: int, height: int,
+            out: Optional[numpy.ndarray] = None,
+            num_workers: Optional[int] = None) -> numpy.ndarray:
+        #
+        shape = self._get_planar_shape(width, height)
+        nr_planes, nr_values = shape[0], width * height
+        planes = self._get_output(
+            out, nr_planes * nr_values, numpy.uint16
+        ).reshape(shape)
+
+        # Every plane starts at a byte boundary:
+        nr_bytes = ceil(nr_values * self._unit_depth_in_bit / 8)
+        tasks = [
+            (array[i * nr_bytes:(i + 1) * nr_bytes],
+             planes[i].reshape(nr_values)) for i in range(nr_planes)
+        ]
+        num_workers = num_workers if num_workers else _num_workers
+        if num_workers > 1:
+            # Each plane is unpacked by a worker; a plane must not be split
+            # any further because the workers would wait for each other:
+            executor = _get_executor(min(num_workers, nr_planes))
+            futures = [
+                executor.submit(self.expand, packed, unpacked, 1)
+                for packed, unpacked in tasks
+            ]
+            for future in futures:
+                future.result()
+        else:
+            for packed, unpacked in tasks:
+                self.expand(packed, out=unpacked, num_workers=1)
+        #
+        return planes if out is None else out
+
+    def expanded_size(self, nr_bytes: int) -> int:
+        nr_groups, nr_remainder = divmod(nr_bytes, self._nr_packed)
+        return nr_groups * self._nr_unpacked + \
+            (nr_remainder * 8) // self._unit_depth_in_bit
+
+    def _unpack(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        """
+        Unpacks the given groups into the given output.
+
+        This method is abstract and should be reimplemented in any sub-class.
+
+        :param packed: A (N, nr_packed) uint8 array of the groups.
+        :param unpacked: A (N, nr_unpacked) uint16 array to write the values.
+        :return: None.
+        """
+        raise NotImplementedError
+
+    def _unpack_in_chunks(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray,
+            num_workers: int, unpack=None) -> None:
+        #
+        unpack = unpack if unpack else _get_kernel(self)
+        nr_groups = packed.shape[0]
+        nr_chunks = min(
+            num_workers, ceil(nr_groups / _min_num_groups_per_chunk)
+        )
+        if nr_chunks <= 1:
+            unpack(packed, unpacked)
+            return
+
+        # Split the groups so that every chunk starts at a group boundary
+        # then let the workers write their own part of the output:
+        executor = _get_executor(nr_chunks)
+        step = ceil(nr_groups / nr_chunks)
+        futures = [
+            executor.submit(
+                unpack, packed[i:i + step], unpacked[i:i + step]
+            ) for i in range(0, nr_groups, step)
+        ]
+        for future in futures:
+            future.result()
+
+    def _unpack_tail(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        group = numpy.zeros((1, self._nr_packed), dtype=numpy.uint8)
+        group[0, :packed.shape[0]] = packed
+        values = numpy.empty((1, self._nr_unpacked), dtype=numpy.uint16)
+        self._unpack(group, values)
+        unpacked[:] = values[0, :unpacked.shape[0]]
+
+    def pack(
+            self, values: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        #
+        values = numpy.ascontiguousarray(values, dtype=numpy.uint16)
+        values = values.reshape(-1)
+        size = self.packed_size(values.shape[0])
+        packed = self._get_output(out, size, numpy.uint8)
+
+        # Pack the complete groups a chunk at a time so that the scratch
+        # of the kernel stays small:
+        nr_groups = values.shape[0] // self._nr_unpacked
+        unpacked_groups = values[:nr_groups * self._nr_unpacked].reshape(
+            nr_groups, self._nr_unpacked
+        )
+        packed_groups = packed[:nr_groups * self._nr_packed].reshape(
+            nr_groups, self._nr_packed
+        )
+        step = max(_nr_values_per_scratch // self._nr_unpacked, 1)
+        for i in range(0, nr_groups, step):
+            self._pack(unpacked_groups[i:i + step], packed_groups[i:i + step])
+
+        # Then pack the incomplete group at the tail if there is:
+        nr_values = nr_groups * self._nr_unpacked
+        if nr_values < values.shape[0]:
+            group = numpy.zeros((1, self._nr_unpacked), dtype=numpy.uint16)
+            group[0, :values.shape[0] - nr_values] = values[nr_values:]
+            tail = numpy.empty((1, self._nr_packed), dtype=numpy.uint8)
+            self._pack(group, tail)
+            packed[nr_groups * self._nr_packed:] = \
+                tail[0, :size - nr_groups * self._nr_packed]
+        #
+        return packed if out is None else out
+
+    def packed_size(self, nr_values: int) -> int:
+        nr_groups, nr_remainder = divmod(nr_values, self._nr_unpacked)
+        return nr_groups * self._nr_packed + \
+            ceil(nr_remainder * self._unit_depth_in_bit / 8)
+
+    def _pack(self, unpacked: numpy.ndarray, packed: numpy.ndarray) -> None:
+        """
+        Packs the given groups into the given output; the values are packed
+        from the LSB of the first byte as the PFNC 'p' formats define. A
+        sub-class reimplements it if it packs differently.
+
+        :param unpacked: A (N, nr_unpacked) uint16 array of the values.
+        :param packed: A (N, nr_packed) uint8 array to write the groups.
+        :return: None.
+        """
+        nr_bits = self._unit_depth_in_bit
+        mask = (1 << nr_bits) - 1
+        # A group fits in a 64-bit word so that every value is put to its
+        # place by a shift then the word is split to bytes:
+        word = numpy.zeros(unpacked.shape[0], dtype='<u8')
+        shifted = numpy.empty(unpacked.shape[0], dtype='<u8')
+        for i, value in enumerate(unpacked.T):
+            numpy.bitwise_and(value, mask, out=shifted)
+            numpy.left_shift(shifted, i * nr_bits, out=shifted)
+            numpy.bitwise_or(word, shifted, out=word)
+        packed[:] = word.view(numpy.uint8).reshape(-1, 8)[:, :self._nr_packed]
+
 
 # ----
 
 
-class _GroupPacked(_PixelFormat):
+class _GroupPacked(_Packed):
+    _nr_packed = 3
+    _nr_unpacked = 2
+
     def __init__(
             self, symbolic: str = None, nr_components: float = None,
             unit_depth_in_bit: int = None, location: _Location = None):
         #
         super().__init__(
-            alignment=_Alignment(
-                unpacked=_DataSize.UINT16, packed=_DataSize.UINT8
-            ),
             symbolic=symbolic,
             nr_components=nr_components,
             unit_depth_in_bit=unit_depth_in_bit,
             location=location
         )
 
+    def _pack(self, unpacked: numpy.ndarray, packed: numpy.ndarray) -> None:
+        up1st, up2nd = unpacked.T
+        p1st, p2nd, p3rd = packed.T
+        # The MSBs take the 1st and the 3rd bytes and the LSBs share the
+        # 2nd byte:
+        nr_lsbs = self._unit_depth_in_bit - 8
+        mask = (1 << nr_lsbs) - 1
+        numpy.right_shift(up1st, nr_lsbs, out=p1st, casting='unsafe')
+        numpy.right_shift(up2nd, nr_lsbs, out=p3rd, casting='unsafe')
+        numpy.bitwise_or(
+            up1st & mask, (up2nd & mask) << 4, out=p2nd, casting='unsafe'
+        )
+
 
 # ----
 
@@ -1286,28 +2173,16 @@ class _GroupPacked_10(_GroupPacked):
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        nr_packed = 3
-        nr_unpacked = 2
-        #
-        p1st, p2nd, p3rd = numpy.reshape(
-            array, (array.shape[0] // nr_packed, nr_packed)
-        ).astype(numpy.uint16).T
+    def _unpack(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        p1st, p2nd, p3rd = packed.T
+        up1st, up2nd = unpacked.T
         #
         mask = 0x3
-        up1st = numpy.bitwise_or(
-            p1st << 2, numpy.bitwise_and(mask, p2nd)
-        )
-        up2nd = numpy.bitwise_or(
-            p3rd << 2, numpy.bitwise_and(mask, p2nd >> 4)
-        )
-        #
-        return numpy.reshape(
-            numpy.concatenate(
-                (up1st[:, None], up2nd[:, None]), axis=1
-            ),
-            nr_unpacked * up1st.shape[0]
-        )
+        numpy.left_shift(p1st, 2, out=up1st, dtype=numpy.uint16)
+        numpy.bitwise_or(up1st, p2nd & mask, out=up1st)
+        numpy.left_shift(p3rd, 2, out=up2nd, dtype=numpy.uint16)
+        numpy.bitwise_or(up2nd, (p2nd >> 4) & mask, out=up2nd)
 
 
 class _GroupPacked_12(_GroupPacked):
@@ -1322,168 +2197,571 @@ class _GroupPacked_12(_GroupPacked):
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        nr_packed = 3
-        nr_unpacked = 2
-        #
-        p1st, p2nd, p3rd = numpy.reshape(
-            array, (array.shape[0] // nr_packed, nr_packed)
-        ).astype(numpy.uint16).T
+    def _unpack(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        p1st, p2nd, p3rd = packed.T
+        up1st, up2nd = unpacked.T
         #
         mask = 0xf
-        up1st = numpy.bitwise_or(
-            p1st << 4, numpy.bitwise_and(mask, p2nd)
-        )
-        up2nd = numpy.bitwise_or(
-            p3rd << 4, numpy.bitwise_and(mask, p2nd >> 4)
-        )
-        #
-        return numpy.reshape(
-            numpy.concatenate(
-                (up1st[:, None], up2nd[:, None]), axis=1
-            ),
-            nr_unpacked * up1st.shape[0]
-        )
+        numpy.left_shift(p1st, 4, out=up1st, dtype=numpy.uint16)
+        numpy.bitwise_or(up1st, p2nd & mask, out=up1st)
+        # = ((p3rd << 8) | p2nd) >> 4
+        numpy.left_shift(p3rd, 8, out=up2nd, dtype=numpy.uint16)
+        numpy.bitwise_or(up2nd, p2nd, out=up2nd)
+        numpy.right_shift(up2nd, 4, out=up2nd)
 
 
 # ----
 
 
-class _10p(_PixelFormat):
+def _join(upper: numpy.ndarray, lower: numpy.ndarray,
+          out: numpy.ndarray) -> numpy.ndarray:
+    """
+    Writes (upper << 8) | lower to out without allocating a temporary.
+    """
+    numpy.left_shift(upper, 8, out=out, dtype=numpy.uint16)
+    numpy.bitwise_or(out, lower, out=out)
+    return out
+
+
+class _10p(_Packed):
+    _nr_packed = 5
+    _nr_unpacked = 4
+
     def __init__(
             self, symbolic: str = None, nr_components: float = None,
             location: _Location = None):
         #
         super().__init__(
             symbolic=symbolic,
-            alignment=_Alignment(
-                unpacked=_DataSize.UINT16, packed=_DataSize.UINT8
-            ),
             nr_components=nr_components,
             unit_depth_in_bit=10,
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        nr_packed = 4
-        nr_unpacked = 3
+    def _unpack(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        p1st, p2nd, p3rd, p4th, p5th = packed.T
+        up1st, up2nd, up3rd, up4th = unpacked.T
         #
-        p1st, p2nd, p3rd, p4th = numpy.reshape(
-            array, (array.shape[0] // nr_packed, nr_packed)
-        ).astype(numpy.uint16).T
+        mask = 0x3ff
+        numpy.bitwise_and(_join(p2nd, p1st, up1st), mask, out=up1st)
+        numpy.right_shift(_join(p3rd, p2nd, up2nd), 2, out=up2nd)
+        numpy.bitwise_and(up2nd, mask, out=up2nd)
+        numpy.right_shift(_join(p4th, p3rd, up3rd), 4, out=up3rd)
+        numpy.bitwise_and(up3rd, mask, out=up3rd)
+        numpy.right_shift(_join(p5th, p4th, up4th), 6, out=up4th)
+
+
+class _12p(_Packed):
+    _nr_packed = 3
+    _nr_unpacked = 2
+
+    def __init__(
+            self, symbolic: str = None, nr_components: float = None,
+            location: _Location = None):
         #
-        up1st = numpy.bitwise_or(
-            p1st, numpy.bitwise_and(0x300, p2nd << 8)
-        )
-        up2nd = numpy.bitwise_or(
-            numpy.bitwise_and(0x3f, p2nd >> 2),
-            numpy.bitwise_and(0x3e0, p3rd << 6)
-        )
-        up3rd = numpy.bitwise_or(
-            numpy.bitwise_and(0x7, p3rd >> 5),
-            numpy.bitwise_and(0x7f8, p4th << 3)
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=nr_components,
+            unit_depth_in_bit=12,
+            location=location
         )
+
+    def _unpack(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        p1st, p2nd, p3rd = packed.T
+        up1st, up2nd = unpacked.T
         #
-        return numpy.reshape(
-            numpy.concatenate(
-                (up1st[:, None], up2nd[:, None], up3rd[:, None]), axis=1
-            ),
-            nr_unpacked * up1st.shape[0]
-        )
+        numpy.bitwise_and(_join(p2nd, p1st, up1st), 0xfff, out=up1st)
+        numpy.right_shift(_join(p3rd, p2nd, up2nd), 4, out=up2nd)
+
 
+class _14p(_Packed):
+    _nr_packed = 7
+    _nr_unpacked = 4
 
-class _12p(_PixelFormat):
     def __init__(
             self, symbolic: str = None, nr_components: float = None,
             location: _Location = None):
         #
         super().__init__(
             symbolic=symbolic,
-            alignment=_Alignment(
-                unpacked=_DataSize.UINT16, packed=_DataSize.UINT8
-            ),
             nr_components=nr_components,
-            unit_depth_in_bit=12,
+            unit_depth_in_bit=14,
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        nr_packed = 3
-        nr_unpacked = 2
+    def _unpack(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        p1st, p2nd, p3rd, p4th, p5th, p6th, p7th = packed.T
+        up1st, up2nd, up3rd, up4th = unpacked.T
         #
-        p1st, p2nd, p3rd = numpy.reshape(
-            array, (array.shape[0] // nr_packed, nr_packed)
-        ).astype(numpy.uint16).T
+        mask = 0x3fff
+        numpy.bitwise_and(_join(p2nd, p1st, up1st), mask, out=up1st)
+        # The 2nd and the 3rd ones straddle three bytes:
+        numpy.left_shift(_join(p4th, p3rd, up2nd), 2, out=up2nd)
+        numpy.bitwise_and(up2nd, mask, out=up2nd)
+        numpy.bitwise_or(up2nd, p2nd >> 6, out=up2nd)
+        numpy.left_shift(_join(p6th, p5th, up3rd), 4, out=up3rd)
+        numpy.bitwise_and(up3rd, mask, out=up3rd)
+        numpy.bitwise_or(up3rd, p4th >> 4, out=up3rd)
+        numpy.right_shift(_join(p7th, p6th, up4th), 2, out=up4th)
+
+
+# ----
+
+
+class DecoderBackend:
+    """
+    Represents a way to unpack the groups of the packed pixel formats. The
+    NumPy kernel of each pixel format is the reference; a backend may
+    provide a faster kernel for some of them and every kernel is checked
+    against the reference on its first use before it takes over.
+
+    A sub-class sets :attr:`name` and reimplements :meth:`get_kernel`, then
+    it is registered by :func:`register_decoder_backend`.
+    """
+    #: The name that selects the backend.
+    name = None
+
+    def is_available(self) -> bool:
+        """
+        Returns :const:`True` if the backend can be used; e.g., it returns
+        :const:`False` if the package that it depends on is not installed.
+
+        :return: :const:`True` if the backend can be used.
+        :rtype: bool
+        """
+        return True
+
+    def get_kernel(self, pf_proxy: '_Packed') -> Optional[Callable]:
+        """
+        Returns a kernel that unpacks the groups of the given pixel format.
+        The kernel is called as kernel(packed, unpacked) where packed is a
+        (N, nr_packed) uint8 array and unpacked is a (N, nr_unpacked)
+        uint16 array; it should release the GIL so that the worker threads
+        can run it in parallel.
+
+        This method is abstract and should be reimplemented in any sub-class.
+
+        :param pf_proxy: Set the pixel format.
+
+        :return: The kernel. :const:`None` if it doesn't support the pixel format.
+        :rtype: Callable
+        """
+        raise NotImplementedError
+
+
+class _NumPyBackend(DecoderBackend):
+    name = 'numpy'
+
+    def get_kernel(self, pf_proxy: '_Packed') -> Optional[Callable]:
+        # It is the reference itself:
+        return None
+
+
+def _unpack_lsb_first(packed, unpacked, nr_bits):
+    # The values are packed from the LSB of the first byte; a group fits
+    # in a 64-bit word. The bytes are taken as int so that NumPy and Numba
+    # promote them in the same way:
+    mask = (1 << nr_bits) - 1
+    for i in range(packed.shape[0]):
+        word = 0
+        for j in range(packed.shape[1]):
+            word |= int(packed[i, j]) << (8 * j)
+        for j in range(unpacked.shape[1]):
+            unpacked[i, j] = (word >> (j * nr_bits)) & mask
+
+
+def _unpack_group_packed(packed, unpacked, nr_bits):
+    # The MSBs take the 1st and the 3rd bytes and the LSBs share the 2nd
+    # byte:
+    nr_lsbs = nr_bits - 8
+    mask = (1 << nr_lsbs) - 1
+    for i in range(packed.shape[0]):
+        lsbs = int(packed[i, 1])
+        unpacked[i, 0] = (int(packed[i, 0]) << nr_lsbs) | (lsbs & mask)
+        unpacked[i, 1] = (int(packed[i, 2]) << nr_lsbs) | ((lsbs >> 4) & mask)
+
+
+class _NumbaBackend(DecoderBackend):
+    """
+    Unpacks every group in a single loop that is compiled by Numba; it is
+    available only if Numba is installed.
+    """
+    name = 'numba'
+
+    def __init__(self):
+        super().__init__()
+        self._numba = None
+        self._compiled = {}
+
+    def is_available(self) -> bool:
+        if self._numba is None:
+            try:
+                import numba
+                self._numba = numba
+            except ImportError:
+                self._numba = False
+        return bool(self._numba)
+
+    def get_kernel(self, pf_proxy: '_Packed') -> Optional[Callable]:
+        # Every layout is inferred from the way the pixel format packs the
+        # values; the check against the reference catches any other one:
+        pack = type(pf_proxy)._pack
+        if isinstance(pf_proxy, _GroupPacked) and pack is _GroupPacked._pack:
+            function = _unpack_group_packed
+        elif pack is _Packed._pack and pf_proxy._nr_packed < 8:
+            function = _unpack_lsb_first
+        else:
+            return None
         #
-        up1st = numpy.bitwise_or(
-            p1st, numpy.bitwise_and(0xf00, p2nd << 8)
-        )
-        up2nd = numpy.bitwise_or(
-            numpy.bitwise_and(0xf, p2nd >> 4),
-            numpy.bitwise_and(0xff0, p3rd << 4)
+        if function not in self._compiled:
+            self._compiled[function] = self._numba.njit(nogil=True)(function)
+        compiled = self._compiled[function]
+        nr_bits = pf_proxy.unit_depth_in_bit
+
+        def kernel(packed, unpacked):
+            compiled(packed, unpacked, nr_bits)
+
+        return kernel
+
+
+_decoder_backends = {}
+_default_decoder_backend = 'numpy'
+# The backends that have been selected for each pixel format:
+_decoder_backends_by_symbolic = {}
+# The kernels that have passed the check; None stands for the reference:
+_kernels = {}
+_kernels_lock = Lock()
+# The number of groups that a kernel unpacks to be checked:
+_nr_groups_to_check = 1024
+
+
+def register_decoder_backend(backend: DecoderBackend) -> None:
+    """
+    Registers the given decoder backend so that it can be selected by
+    :func:`set_decoder_backend`. A backend that has the same name is
+    replaced.
+
+    :param backend: Set the backend.
+
+    :return: None.
+    """
+    if not backend.name:
+        raise ValueError('A decoder backend must have a name.')
+    #
+    with _kernels_lock:
+        _decoder_backends[backend.name] = backend
+        _kernels.clear()
+
+
+def get_decoder_backends() -> list:
+    """
+    Returns the names of the decoder backends that can be used.
+
+    :return: The names of the available backends.
+    :rtype: list
+    """
+    return [
+        name for name, backend in list(_decoder_backends.items())
+        if backend.is_available()
+    ]
+
+
+def set_decoder_backend(name: Optional[str],
+                        symbolic: Optional[str] = None) -> None:
+    """
+    Selects the decoder backend that unpacks the packed pixel formats. A
+    pixel format that the backend doesn't support, or whose kernel doesn't
+    match the reference, falls back to the NumPy reference.
+
+    :param name: Set the name of the backend. If a pixel format is given, :const:`None` lets the pixel format follow the default again.
+    :param symbolic: Set the pixel format to select the backend for. The default backend is selected if it is :const:`None`.
+
+    :return: None.
+    """
+    global _default_decoder_backend
+    #
+    if name is not None and name not in _decoder_backends:
+        raise ValueError('{0} is not a decoder backend.'.format(name))
+    #
+    with _kernels_lock:
+        if symbolic is None:
+            if name is None:
+                raise ValueError('The default backend must be given.')
+            _default_decoder_backend = name
+        elif name is None:
+            _decoder_backends_by_symbolic.pop(symbolic, None)
+        else:
+            _decoder_backends_by_symbolic[symbolic] = name
+        _kernels.clear()
+
+
+def get_decoder_backend(symbolic: Optional[str] = None) -> str:
+    """
+    Returns the name of the decoder backend that has been selected.
+
+    :param symbolic: Set the pixel format. The default backend is returned if it is :const:`None`.
+
+    :return: The name of the backend.
+    :rtype: str
+    """
+    return _decoder_backends_by_symbolic.get(
+        symbolic, _default_decoder_backend
+    )
+
+
+def _get_kernel(pf_proxy: '_Packed') -> Callable:
+    key = type(pf_proxy), pf_proxy.symbolic
+    kernel = _kernels.get(key, _kernels)
+    if kernel is _kernels:
+        with _kernels_lock:
+            kernel = _kernels.get(key, _kernels)
+            if kernel is _kernels:
+                kernel = _create_kernel(pf_proxy)
+                _kernels[key] = kernel
+    return kernel if kernel else pf_proxy._unpack
+
+
+def _create_kernel(pf_proxy: '_Packed') -> Optional[Callable]:
+    name = get_decoder_backend(pf_proxy.symbolic)
+    backend = _decoder_backends[name]
+    try:
+        if not backend.is_available():
+            _logger.warning(
+                'The {0} decoder backend is not available; the reference '
+                'is used.'.format(name)
+            )
+            return None
+        kernel = backend.get_kernel(pf_proxy)
+        if kernel is None:
+            return None
+        #
+        if not _check_kernel(pf_proxy, kernel):
+            _logger.warning(
+                'The {0} decoder backend does not match the reference for '
+                '{1}; the reference is used.'.format(
+                    name, pf_proxy.symbolic
+                )
+            )
+            return None
+    except Exception as e:
+        _logger.warning(
+            'The {0} decoder backend failed for {1}: {2}; the reference is '
+            'used.'.format(name, pf_proxy.symbolic, e)
         )
+        return None
+    #
+    _logger.debug(
+        'The {0} decoder backend unpacks {1}.'.format(name, pf_proxy.symbolic)
+    )
+    return kernel
+
+
+def _check_kernel(pf_proxy: '_Packed', kernel: Callable) -> bool:
+    rng = numpy.random.default_rng(0)
+    packed = rng.integers(
+        0, 256, (_nr_groups_to_check, pf_proxy._nr_packed), dtype=numpy.uint8
+    )
+    expected = numpy.empty(
+        (_nr_groups_to_check, pf_proxy._nr_unpacked), dtype=numpy.uint16
+    )
+    pf_proxy._unpack(packed, expected)
+    actual = numpy.zeros_like(expected)
+    kernel(packed, actual)
+    return numpy.array_equal(expected, actual)
+
+
+register_decoder_backend(_NumPyBackend())
+register_decoder_backend(_NumbaBackend())
+
+
+# ----
+
+
+class _BitPacked(_PixelFormat):
+    """
+    Represents the formats that pack several values to a byte LSB first;
+    every value is expanded to a uint8.
+    """
+    def __init__(
+            self, symbolic: str = None, nr_components: float = None,
+            unit_depth_in_bit: int = None, location: _Location = None):
         #
-        return numpy.reshape(
-            numpy.concatenate(
-                (up1st[:, None], up2nd[:, None]), axis=1
+        super().__init__(
+            alignment=_Alignment(
+                unpacked=_DataSize.UINT8, packed=_DataSize.BITS
             ),
-            nr_unpacked * up1st.shape[0]
+            symbolic=symbolic,
+            nr_components=nr_components,
+            unit_depth_in_bit=unit_depth_in_bit,
+            location=location
+        )
+        #
+        self._nr_packed = 1
+        self._nr_unpacked = 8 // unit_depth_in_bit
+        # Every byte is expanded by looking up a word that holds all of
+        # its values at once:
+        mask = (1 << unit_depth_in_bit) - 1
+        table = numpy.empty((256, self._nr_unpacked), dtype=numpy.uint8)
+        byte = numpy.arange(256, dtype=numpy.uint8)
+        for i in range(self._nr_unpacked):
+            table[:, i] = (byte >> (i * unit_depth_in_bit)) & mask
+        self._word_dtype = numpy.dtype('u{0}'.format(self._nr_unpacked))
+        self._table = table.view(self._word_dtype).reshape(256)
+
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Expands the given packed data to a uint8 array.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param out: Set a C contiguous uint8 array of the expanded size to write the expanded data. A newly allocated one is used if it is :const:`None`.
+
+        :return: The expanded data; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        #
+        unpacked = self._get_output(
+            out, self.expanded_size(array.shape[0]), numpy.uint8
+        )
+        numpy.take(
+            self._table, array, out=unpacked.view(self._word_dtype),
+            mode='clip'
+        )
+        return unpacked if out is None else out
+
+    def expanded_size(self, nr_bytes: int) -> int:
+        return nr_bytes * self._nr_unpacked
+
+    def pack(
+            self, values: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        #
+        values = numpy.ascontiguousarray(values, dtype=numpy.uint8)
+        values = values.reshape(-1)
+        size = self.packed_size(values.shape[0])
+        packed = self._get_output(out, size, numpy.uint8)
+        if values.shape[0] < size * self._nr_unpacked:
+            # Fill the last byte up with zeros:
+            values = numpy.append(
+                values, numpy.zeros(size * self._nr_unpacked -
+                                    values.shape[0], dtype=numpy.uint8)
+            )
+
+        #
+        nr_bits = self._unit_depth_in_bit
+        mask = (1 << nr_bits) - 1
+        groups = values.reshape(size, self._nr_unpacked)
+        numpy.bitwise_and(groups[:, 0], mask, out=packed)
+        for i in range(1, self._nr_unpacked):
+            numpy.bitwise_or(
+                packed, (groups[:, i] & mask) << (i * nr_bits), out=packed
+            )
+        return packed if out is None else out
+
+    def packed_size(self, nr_values: int) -> int:
+        return ceil(nr_values / self._nr_unpacked)
+
+    def get_packed_lines(
+            self, array: numpy.ndarray, width: int,
+            height: int) -> numpy.ndarray:
+        """
+        Returns a view of the given packed data that has a row per line so
+        that the data can be stored as it is. Every row is compatible with
+        :func:`numpy.unpackbits` of the little bit order if the unit depth
+        is 1.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param width: Set the width of the image.
+        :param height: Set the height of the image.
+
+        :return: A (height, bytes per line) uint8 array; nothing is copied.
+        :rtype: numpy.ndarray
+        """
+        #
+        nr_bits = width * self.unit_depth_in_bit
+        if nr_bits % 8:
+            raise ValueError(
+                'The lines of {0} pixels do not end at a byte '
+                'boundary.'.format(width)
+            )
+        return array[:height * nr_bits // 8].reshape(height, nr_bits // 8)
+
+
+class _1p(_BitPacked):
+    def __init__(
+            self, symbolic: str = None, nr_components: float = None,
+            location: _Location = None):
+        #
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=nr_components,
+            unit_depth_in_bit=1,
+            location=location
         )
 
 
-class _14p(_PixelFormat):
+class _2p(_BitPacked):
     def __init__(
             self, symbolic: str = None, nr_components: float = None,
             location: _Location = None):
         #
         super().__init__(
             symbolic=symbolic,
-            alignment=_Alignment(
-                unpacked=_DataSize.UINT16, packed=_DataSize.UINT8
-            ),
             nr_components=nr_components,
-            unit_depth_in_bit=14,
+            unit_depth_in_bit=2,
             location=location
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        nr_packed = 7
-        nr_unpacked = 4
-        #
-        p1st, p2nd, p3rd, p4th, p5th, p6th, p7th = numpy.reshape(
-            array, (array.shape[0] // nr_packed, nr_packed)
-        ).astype(numpy.uint16).T
+
+class _4p(_BitPacked):
+    def __init__(
+            self, symbolic: str = None, nr_components: float = None,
+            location: _Location = None):
         #
-        up1st = numpy.bitwise_or(
-            p1st, numpy.bitwise_and(0x3f00, p2nd << 8)
-        )
-        up2nd = numpy.bitwise_or(
-            numpy.bitwise_and(0x3, p2nd >> 6),
-            numpy.bitwise_and(0x3fc, p3rd << 2),
-            numpy.bitwise_and(0x3c00, p4th << 10),
-        )
-        up3rd = numpy.bitwise_or(
-            numpy.bitwise_and(0xf, p4th >> 4),
-            numpy.bitwise_and(0xff0, p5th << 4),
-            numpy.bitwise_and(0x3000, p6th << 12)
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=nr_components,
+            unit_depth_in_bit=4,
+            location=location
         )
-        up4th = numpy.bitwise_or(
-            numpy.bitwise_and(0x3f, p6th >> 2),
-            numpy.bitwise_and(0x3fc0, p7th << 6)
+
+
+# ----
+
+
+class _Mono_1p(_1p):
+    def __init__(self, symbolic: str = None):
+        #
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=1.,
+            location=_Location.MONO
         )
+
+
+class _Mono_2p(_2p):
+    def __init__(self, symbolic: str = None):
         #
-        return numpy.reshape(
-            numpy.concatenate(
-                (
-                    up1st[:, None], up2nd[:, None], up3rd[:, None],
-                    up4th[:, None]
-                ), axis=1
-            ),
-            nr_unpacked * up1st.shape[0]
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=1.,
+            location=_Location.MONO
         )
 
 
-# ----
+class _Mono_4p(_4p):
+    def __init__(self, symbolic: str = None):
+        #
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=1.,
+            location=_Location.MONO
+        )
 
 
 class _Mono_10p(_10p):
@@ -1608,9 +2886,22 @@ class Coord3D_C12p(_Mono_12p):
         super().__init__(symbolic='Coord3D_C12p')
 
 
-# 'Mono1p',
-# 'Mono2p',
-# 'Mono4p',
+class Mono1p(_Mono_1p):
+    def __init__(self):
+        #
+        super().__init__(symbolic='Mono1p')
+
+
+class Mono2p(_Mono_2p):
+    def __init__(self):
+        #
+        super().__init__(symbolic='Mono2p')
+
+
+class Mono4p(_Mono_4p):
+    def __init__(self):
+        #
+        super().__init__(symbolic='Mono4p')
 
 
 # ----
@@ -1739,6 +3030,30 @@ class RGB16(_LMN444_Unpacked_Uint16_16):
         super().__init__(symbolic='RGB16')
 
 
+class RGB8_Planar(_LMN444_Unpacked_Uint8_8):
+    def __init__(self):
+        #
+        super().__init__(symbolic='RGB8_Planar')
+
+
+class RGB10_Planar(_LMN444_Unpacked_Uint16_10):
+    def __init__(self):
+        #
+        super().__init__(symbolic='RGB10_Planar')
+
+
+class RGB12_Planar(_LMN444_Unpacked_Uint16_12):
+    def __init__(self):
+        #
+        super().__init__(symbolic='RGB12_Planar')
+
+
+class RGB16_Planar(_LMN444_Unpacked_Uint16_16):
+    def __init__(self):
+        #
+        super().__init__(symbolic='RGB16_Planar')
+
+
 # ----
 
 
@@ -1817,7 +3132,12 @@ class Coord3D_ABC32f_Planar(_LMN444_Unpacked_Float32_32):
         super().__init__(symbolic='Coord3D_ABC32f_Planar')
 
 
-# 'RGB8Packed',  # TODO
+class RGB8Packed(_LMN444_Unpacked_Uint8_8):
+    # The GigE Vision 1.x name of RGB8; it shares the value of RGB8 so
+    # it is only looked up by its name:
+    def __init__(self):
+        #
+        super().__init__(symbolic='RGB8Packed')
 
 
 # ----
@@ -1843,6 +3163,65 @@ class _LMN444_12p(_12p):
         )
 
 
+class _LMN444_GroupPacked_12(_GroupPacked_12):
+    def __init__(self, symbolic: str = None):
+        #
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=3.,
+            location=_Location.LMN444
+        )
+
+
+class _LMN444_V1Packed_10(_Packed):
+    # A pixel is packed to 32 bits; the 1st byte carries the 2 LSBs of
+    # B, G, and R from bit 0 and the following bytes carry the 8 MSBs of
+    # B, G, and R in this order:
+    _nr_packed = 4
+    _nr_unpacked = 3
+
+    def __init__(self, symbolic: str = None):
+        #
+        super().__init__(
+            symbolic=symbolic,
+            nr_components=3.,
+            unit_depth_in_bit=10,
+            location=_Location.LMN444
+        )
+
+    @property
+    def depth_in_bit(self):
+        # A pixel occupies 32 bits though it carries 30 bits:
+        return self._nr_packed * 8
+
+    def expanded_size(self, nr_bytes: int) -> int:
+        return (nr_bytes // self._nr_packed) * self._nr_unpacked
+
+    def _unpack(
+            self, packed: numpy.ndarray, unpacked: numpy.ndarray) -> None:
+        lsbs, b, g, r = packed.T
+        #
+        scratch = numpy.empty(packed.shape[0], dtype=numpy.uint8)
+        for i, (msbs, component) in enumerate(zip((r, g, b), unpacked.T)):
+            # Move the LSBs to the top of the lower byte so that they
+            # follow the MSBs; the rest of the byte is shifted out:
+            numpy.left_shift(lsbs, 2 + 2 * i, out=scratch)
+            numpy.right_shift(_join(msbs, scratch, component), 6,
+                              out=component)
+
+    def _pack(self, unpacked: numpy.ndarray, packed: numpy.ndarray) -> None:
+        r, g, b = unpacked.T
+        lsbs = packed[:, 0]
+        #
+        lsbs[:] = 0
+        for i, (component, msbs) in enumerate(zip((b, g, r), packed.T[1:])):
+            numpy.right_shift(component, 2, out=msbs, casting='unsafe')
+            numpy.bitwise_or(
+                lsbs, (component & 0x3) << (2 * i), out=lsbs,
+                casting='unsafe'
+            )
+
+
 # ----
 
 
@@ -1870,6 +3249,19 @@ class Coord3D_ABC12p_Planar(_LMN444_12p):
         super().__init__(symbolic='Coord3D_ABC12p_Planar')
 
 
+class RGB10V1Packed(_LMN444_V1Packed_10):
+    def __init__(self):
+        #
+        super().__init__(symbolic='RGB10V1Packed')
+
+
+class RGB12V1Packed(_LMN444_GroupPacked_12):
+    # The components are packed in pairs as Mono12Packed does:
+    def __init__(self):
+        #
+        super().__init__(symbolic='RGB12V1Packed')
+
+
 # ----
 
 
@@ -1927,8 +3319,10 @@ class _LMN422_Unpacked_Uint8(_LMN422):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array, out)
 
 
 class _LMN422_Unpacked_Uint16(_LMN422):
@@ -1940,8 +3334,10 @@ class _LMN422_Unpacked_Uint16(_LMN422):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.uint16)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.uint16), out)
 
 
 class _LMN411_Unpacked_Uint8(_LMN411):
@@ -1953,8 +3349,10 @@ class _LMN411_Unpacked_Uint8(_LMN411):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array, out)
 
 
 class _LMNO4444_Unpacked_Uint8(_LMNO4444):
@@ -1966,8 +3364,10 @@ class _LMNO4444_Unpacked_Uint8(_LMNO4444):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array, out)
 
 
 # ----
@@ -2379,8 +3779,10 @@ class _LMNO4444_Unpacked_Uint16(_LMNO4444):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.uint16)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.uint16), out)
 
 
 class _LMNO4444_10p(_10p):
@@ -2543,8 +3945,10 @@ class _LM44_Unpacked_Float32(_LM44):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.float32)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.float32), out)
 
 
 class _LM44_GroupPacked_10(_GroupPacked_10):
@@ -2566,6 +3970,8 @@ class _LM44_GroupPacked_12(_GroupPacked_12):
 
 
 class _LM44_10p(_10p):
+    # The components are packed in the order of A, C, A, C, ... so they
+    # are unpacked as a single stream:
     def __init__(self, symbolic: str = None):
         #
         super().__init__(
@@ -2574,11 +3980,10 @@ class _LM44_10p(_10p):
             location=_Location.LM44
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        raise NotImplementedError
-
 
 class _LM44_12p(_12p):
+    # The components are packed in the order of A, C, A, C, ... so they
+    # are unpacked as a single stream:
     def __init__(self, symbolic: str = None):
         #
         super().__init__(
@@ -2587,9 +3992,6 @@ class _LM44_12p(_12p):
             location=_Location.LM44
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        raise NotImplementedError
-
 
 class _LM44_Unpacked_Uint8(_LM44):
     def __init__(self, symbolic: str = None, unit_depth_in_bit: int = None):
@@ -2600,8 +4002,10 @@ class _LM44_Unpacked_Uint8(_LM44):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array, out)
 
 
 class _LM44_Unpacked_Uint16(_LM44):
@@ -2613,8 +4017,10 @@ class _LM44_Unpacked_Uint16(_LM44):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.uint16)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.uint16), out)
 
 
 # ----
@@ -2739,8 +4145,10 @@ class _Bayer_Unpacked_Uint8(_Bayer):
             unit_depth_in_bit=8
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array, out)
 
 
 class _Bayer_Unpacked_Uint16(_Bayer):
@@ -2752,8 +4160,10 @@ class _Bayer_Unpacked_Uint16(_Bayer):
             unit_depth_in_bit=unit_depth_in_bit
         )
 
-    def expand(self, array: numpy.ndarray) -> numpy.ndarray:
-        return array.view(numpy.uint16)
+    def expand(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        return self._fill(array.view(numpy.uint16), out)
 
 
 # ----
@@ -3027,6 +4437,684 @@ class BayerRG12p(_Bayer_12p):
         super().__init__(symbolic='BayerRG12p')
 
 
+# ----
+
+
+_demosaicing_methods = ('bilinear', 'nearest', 'superpixel')
+_cross_offsets = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_diagonal_offsets = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _get_bayer_offsets(pattern: str):
+    # Returns the positions of R and B in the 2x2 unit cell; the pattern
+    # names the first two pixels of the first row, e.g., 'RG':
+    if pattern not in ('RG', 'GR', 'GB', 'BG'):
+        raise ValueError('Unknown Bayer pattern: {0}'.format(pattern))
+    #
+    if 'R' in pattern:
+        ry, rx = 0, pattern.index('R')
+    else:
+        ry, rx = 1, 1 - pattern.index('B')
+    return (ry, rx), (1 - ry, 1 - rx)
+
+
+def _average(terms, shift: int, out: numpy.ndarray) -> None:
+    # Writes the rounded average of 2 ** shift terms to out:
+    acc = numpy.add(terms[0], terms[1], dtype=numpy.uint32)
+    for term in terms[2:]:
+        numpy.add(acc, term, out=acc)
+    numpy.add(acc, 1 << (shift - 1), out=acc)
+    numpy.right_shift(acc, shift, out=out, casting='unsafe')
+
+
+def demosaic(
+        array: numpy.ndarray, pattern: str, method: str = 'bilinear',
+        out: Optional[numpy.ndarray] = None,
+        order: str = 'RGB') -> numpy.ndarray:
+    """
+    Interpolates the missing color components of a Bayer mosaic.
+
+    :param array: Set a 2D array of the mosaic; its width and height must be even.
+    :param pattern: Set the Bayer pattern, i.e., the first two pixels of the first row: 'RG', 'GR', 'GB' or 'BG'.
+    :param method: Set 'bilinear', 'nearest', or 'superpixel'. 'nearest' replicates the samples of every 2x2 unit cell and 'superpixel' turns every unit cell into a single pixel so the output has the half width and height.
+    :param out: Set a C contiguous array to write the output. It must have the data type of the mosaic. A newly allocated one is used if it is :const:`None`.
+    :param order: Set 'RGB' or 'BGR'; it is the order of the components in the output.
+
+    :return: The color image of (height, width, 3) or, in the superpixel mode, (height / 2, width / 2, 3); it is :data:`out` if it is given.
+    :rtype: numpy.ndarray
+    """
+    #
+    if method not in _demosaicing_methods:
+        raise ValueError('Unknown method: {0}'.format(method))
+    if order not in ('RGB', 'BGR'):
+        raise ValueError('Unknown order: {0}'.format(order))
+    if array.ndim != 2 or array.shape[0] % 2 or array.shape[1] % 2:
+        raise ValueError('The mosaic must be 2D and its sides must be even.')
+
+    #
+    (ry, rx), (by, bx) = _get_bayer_offsets(pattern)
+    ir, ig, ib = (0, 1, 2) if order == 'RGB' else (2, 1, 0)
+    height, width = array.shape
+
+    #
+    if method == 'superpixel':
+        height //= 2
+        width //= 2
+    shape = (height, width, 3)
+    if out is None:
+        out = numpy.empty(shape, dtype=array.dtype)
+    elif out.shape != shape or out.dtype != array.dtype or \
+            not out.flags.c_contiguous:
+        raise ValueError(
+            'The output must be a C contiguous {0} array of {1}.'.format(
+                array.dtype.name, shape
+            )
+        )
+
+    # The samples of each unit cell; G1 shares the row with R:
+    r = array[ry::2, rx::2]
+    b = array[by::2, bx::2]
+    g1 = array[ry::2, 1 - rx::2]
+    g2 = array[by::2, 1 - bx::2]
+
+    if method == 'superpixel':
+        out[..., ir] = r
+        out[..., ib] = b
+        _average((g1, g2), 1, out[..., ig])
+    elif method == 'nearest':
+        for dy in (0, 1):
+            for dx in (0, 1):
+                out[dy::2, dx::2, ir] = r
+                out[dy::2, dx::2, ib] = b
+        out[ry::2, rx::2, ig] = g1
+        out[ry::2, 1 - rx::2, ig] = g1
+        out[by::2, bx::2, ig] = g2
+        out[by::2, 1 - bx::2, ig] = g2
+    else:
+        # Mirroring the border keeps the parity of the pattern:
+        padded = numpy.pad(array, 1, mode='reflect')
+
+        def neighbor(y, x, oy, ox):
+            # The neighbors at (oy, ox) of the sites that start at (y, x):
+            top = 1 + y + oy
+            left = 1 + x + ox
+            return padded[top:top + height:2, left:left + width:2]
+
+        for (y, x), (ic, io) in (((ry, rx), (ir, ib)), ((by, bx), (ib, ir))):
+            # R or B site: the 4 neighbors are G and the diagonal ones
+            # are the other one:
+            out[y::2, x::2, ic] = array[y::2, x::2]
+            _average(
+                [neighbor(y, x, *o) for o in _cross_offsets],
+                2, out[y::2, x::2, ig]
+            )
+            _average(
+                [neighbor(y, x, *o) for o in _diagonal_offsets],
+                2, out[y::2, x::2, io]
+            )
+            # G site in the same row: the horizontal neighbors are of the
+            # row and the vertical ones are the other one:
+            x = 1 - x
+            out[y::2, x::2, ig] = array[y::2, x::2]
+            _average(
+                [neighbor(y, x, 0, -1), neighbor(y, x, 0, 1)],
+                1, out[y::2, x::2, ic]
+            )
+            _average(
+                [neighbor(y, x, -1, 0), neighbor(y, x, 1, 0)],
+                1, out[y::2, x::2, io]
+            )
+    #
+    return out
+
+
+def expand_and_demosaic(
+        pf_proxy: _PixelFormat, array: numpy.ndarray, width: int,
+        height: int, method: str = 'bilinear',
+        out: Optional[numpy.ndarray] = None, order: str = 'RGB',
+        pool: Optional[ArrayPool] = None,
+        x_padding: int = 0) -> numpy.ndarray:
+    """
+    Expands the given Bayer data and demosaics it. A packed mosaic is
+    expanded to a scratch array that is taken from the given pool and it
+    is given back to the pool once the output has been produced.
+
+    :param pf_proxy: Set the proxy of a Bayer pixel format.
+    :param array: Set a 1D uint8 array that holds the data.
+    :param width: Set the width of the image.
+    :param height: Set the height of the image.
+    :param method: See :func:`demosaic`.
+    :param out: See :func:`demosaic`.
+    :param order: See :func:`demosaic`.
+    :param pool: Set an :class:`ArrayPool` object to take the scratch array from.
+    :param x_padding: Set the number of bytes that pad every line.
+
+    :return: The color image; it is :data:`out` if it is given.
+    :rtype: numpy.ndarray
+    """
+    #
+    pattern = pf_proxy.bayer_pattern
+    if pattern is None:
+        raise ValueError(
+            '{0} is not a Bayer format.'.format(pf_proxy.symbolic)
+        )
+
+    #
+    scratch = None
+    is_pooled = pf_proxy.alignment.is_packed() and pool
+    dtype = pf_proxy.alignment.unpacked_dtype
+    if x_padding:
+        # Every line is followed by the padding:
+        if is_pooled:
+            scratch = pool.acquire(width * height, dtype)
+        mosaic = pf_proxy.expand_roi(
+            array, width, height, 0, 0, width, height, x_padding=x_padding,
+            out=scratch
+        ).reshape(height, width)
+    else:
+        # Drop the bytes that follow the image such as the Y padding:
+        array = array[:get_nr_bytes(pf_proxy, width, height)]
+        if is_pooled:
+            scratch = pool.acquire(
+                pf_proxy.expanded_size(array.shape[0]), dtype
+            )
+        expanded = pf_proxy.expand(array, out=scratch)
+        mosaic = expanded[:width * height].reshape(height, width)
+    try:
+        return demosaic(mosaic, pattern, method=method, out=out, order=order)
+    finally:
+        if scratch is not None:
+            pool.release(scratch)
+
+
+# ----
+
+
+# The luma coefficients (Kr, Kb) of the standards:
+_luma_coefficients = {
+    '601': (0.299, 0.114),
+    '709': (0.2126, 0.0722),
+    '2020': (0.2627, 0.0593),
+}
+# The number of fractional bits of the fixed-point coefficients:
+_yuv_shift = 14
+
+
+class _YUVLayout:
+    def __init__(
+            self, y_indices=None, cb_index: int = None,
+            cr_index: int = None, standard: str = None,
+            is_full_range: bool = None):
+        #
+        super().__init__()
+        #
+        self.y_indices = y_indices
+        self.cb_index = cb_index
+        self.cr_index = cr_index
+        self.standard = standard
+        self.is_full_range = is_full_range
+
+    @property
+    def group_size(self):
+        return len(self.y_indices) + 2
+
+
+def _get_yuv_layout(symbolic: str) -> _YUVLayout:
+    #
+    info = get_pixel_format_info(symbolic)
+    if info is None or \
+            info.location not in (_Location.LMN422, _Location.LMN411):
+        raise ValueError('{0} is not a YUV format.'.format(symbolic))
+
+    # YUV and YCbCr without any standard use BT.601 in the full range:
+    standard = '601'
+    is_full_range = True
+    for name in _luma_coefficients.keys():
+        if symbolic.startswith('YCbCr' + name):
+            standard = name
+            is_full_range = False
+
+    #
+    if info.location == _Location.LMN411:
+        if symbolic.endswith(('_UYYVYY', '_CbYYCrYY')):
+            y_indices, cb_index, cr_index = (1, 2, 4, 5), 0, 3
+        else:
+            y_indices, cb_index, cr_index = (0, 1, 3, 4), 2, 5
+    else:
+        if symbolic.endswith(('_UYVY', '_CbYCrY')):
+            y_indices, cb_index, cr_index = (1, 3), 0, 2
+        else:
+            y_indices, cb_index, cr_index = (0, 2), 1, 3
+
+    #
+    return _YUVLayout(
+        y_indices=y_indices, cb_index=cb_index, cr_index=cr_index,
+        standard=standard, is_full_range=is_full_range
+    )
+
+
+def _get_yuv_groups(pf_proxy: _PixelFormat, array: numpy.ndarray,
+                    width: int, height: int):
+    #
+    layout = _get_yuv_layout(pf_proxy.symbolic)
+    values = pf_proxy.expand(array)
+    nr_groups = width * height // len(layout.y_indices)
+    groups = values[:nr_groups * layout.group_size].reshape(
+        nr_groups, layout.group_size
+    )
+    return layout, groups
+
+
+def yuv_to_rgb(
+        pf_proxy: _PixelFormat, array: numpy.ndarray, width: int,
+        height: int, order: str = 'RGB',
+        out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Converts the given YUV or YCbCr data to an RGB or BGR image. The
+    conversion uses fixed-point integer arithmetic with the matrix of the
+    standard that the pixel format declares; the formats without any
+    standard follow BT.601 in the full range.
+
+    :param pf_proxy: Set the proxy of a YUV or YCbCr 4:2:2 or 4:1:1 format.
+    :param array: Set a 1D uint8 array that holds the data.
+    :param width: Set the width of the image.
+    :param height: Set the height of the image.
+    :param order: Set 'RGB' or 'BGR'.
+    :param out: Set a C contiguous array of (height, width, 3) to write the image. It must be uint8 for an 8-bit format, otherwise uint16. A newly allocated one is used if it is :const:`None`.
+
+    :return: The image; it is :data:`out` if it is given.
+    :rtype: numpy.ndarray
+    """
+    #
+    if order not in ('RGB', 'BGR'):
+        raise ValueError('Unknown order: {0}'.format(order))
+    layout, groups = _get_yuv_groups(pf_proxy, array, width, height)
+
+    #
+    nr_bits = pf_proxy.unit_depth_in_bit
+    dtype = numpy.uint8 if nr_bits == 8 else numpy.uint16
+    shape = (height, width, 3)
+    if out is None:
+        out = numpy.empty(shape, dtype=dtype)
+    elif out.shape != shape or out.dtype != dtype or \
+            not out.flags.c_contiguous:
+        raise ValueError(
+            'The output must be a C contiguous {0} array of {1}.'.format(
+                numpy.dtype(dtype).name, shape
+            )
+        )
+
+    # Build the fixed-point matrix:
+    kr, kb = _luma_coefficients[layout.standard]
+    kg = 1. - kr - kb
+    scale = 1 << (nr_bits - 8)
+    if layout.is_full_range:
+        y_offset, y_gain, c_gain = 0, 1., 1.
+    else:
+        y_offset, y_gain, c_gain = 16 * scale, 255. / 219., 255. / 224.
+    c_offset = 128 * scale
+
+    def fixed(value):
+        return int(round(value * (1 << _yuv_shift)))
+
+    k_y = fixed(y_gain)
+    k_r_cr = fixed(c_gain * 2. * (1. - kr))
+    k_g_cb = fixed(c_gain * 2. * kb * (1. - kb) / kg)
+    k_g_cr = fixed(c_gain * 2. * kr * (1. - kr) / kg)
+    k_b_cb = fixed(c_gain * 2. * (1. - kb))
+
+    # The chroma terms are shared by the pixels of a group:
+    cb = numpy.subtract(
+        groups[:, layout.cb_index], c_offset, dtype=numpy.int32
+    )
+    cr = numpy.subtract(
+        groups[:, layout.cr_index], c_offset, dtype=numpy.int32
+    )
+    terms = [None] * 3
+    terms[0] = cr * k_r_cr
+    terms[1] = cb * -k_g_cb
+    terms[1] -= cr * k_g_cr
+    terms[2] = cb * k_b_cb
+    if order == 'BGR':
+        terms.reverse()
+
+    # Then add the luma term of each pixel of the group:
+    nr_ys = len(layout.y_indices)
+    pixels = out.reshape(-1, nr_ys, 3)
+    max_value = (1 << nr_bits) - 1
+    y = numpy.empty(groups.shape[0], dtype=numpy.int32)
+    value = numpy.empty_like(y)
+    for i, index in enumerate(layout.y_indices):
+        numpy.subtract(groups[:, index], y_offset, out=y, dtype=numpy.int32)
+        numpy.multiply(y, k_y, out=y)
+        numpy.add(y, 1 << (_yuv_shift - 1), out=y)
+        for c, term in enumerate(terms):
+            numpy.add(y, term, out=value)
+            numpy.right_shift(value, _yuv_shift, out=value)
+            numpy.clip(value, 0, max_value, out=value)
+            numpy.copyto(pixels[:, i, c], value, casting='unsafe')
+    #
+    return out
+
+
+def yuv_to_planar(
+        pf_proxy: _PixelFormat, array: numpy.ndarray, width: int,
+        height: int, out=None):
+    """
+    Splits the given YUV or YCbCr data into the Y, U (Cb), and V (Cr)
+    planes. The chroma planes keep the horizontal subsampling of the
+    format, i.e., their width is the half or the quarter of the image.
+
+    :param pf_proxy: Set the proxy of a YUV or YCbCr 4:2:2 or 4:1:1 format.
+    :param array: Set a 1D uint8 array that holds the data.
+    :param width: Set the width of the image.
+    :param height: Set the height of the image.
+    :param out: Set a tuple of three C contiguous arrays to write the planes. A newly allocated ones are used if it is :const:`None`.
+
+    :return: The tuple of the Y, U, and V planes; it is :data:`out` if it is given.
+    :rtype: tuple
+    """
+    #
+    layout, groups = _get_yuv_groups(pf_proxy, array, width, height)
+    nr_ys = len(layout.y_indices)
+    shapes = ((height, width), (height, width // nr_ys),
+              (height, width // nr_ys))
+    if out is None:
+        out = tuple(numpy.empty(s, dtype=groups.dtype) for s in shapes)
+    else:
+        for plane, shape in zip(out, shapes):
+            if plane.shape != shape or plane.dtype != groups.dtype or \
+                    not plane.flags.c_contiguous:
+                raise ValueError(
+                    'The planes must be C contiguous {0} arrays of '
+                    '{1}.'.format(groups.dtype.name, shapes)
+                )
+
+    #
+    y_plane, u_plane, v_plane = out
+    pixels = y_plane.reshape(-1, nr_ys)
+    for i, index in enumerate(layout.y_indices):
+        pixels[:, i] = groups[:, index]
+    u_plane.reshape(-1)[:] = groups[:, layout.cb_index]
+    v_plane.reshape(-1)[:] = groups[:, layout.cr_index]
+    #
+    return out
+
+
+# ----
+
+
+def get_nr_bytes(pf_proxy: _PixelFormat, width: int, height: int) -> int:
+    """
+    Returns the number of bytes that an image of the given pixel format and
+    size occupies; it does not include any padding.
+
+    :param pf_proxy: Set the pixel format.
+    :param width: Set the width of the image.
+    :param height: Set the height of the image.
+
+    :return: The number of bytes.
+    :rtype: int
+    """
+    #
+    nr_bytes = height * width
+    #
+    if pf_proxy.alignment.is_packed() and pf_proxy.is_planar:
+        # Every plane starts at a byte boundary:
+        nr_bytes *= pf_proxy.unit_depth_in_bit / 8
+        nr_bytes = ceil(nr_bytes) * pf_proxy.nr_components
+    elif pf_proxy.alignment.is_packed():
+        # Take the size from the packing itself; the average depth does not
+        # hold for a format such as Mono10Packed that takes 3 bytes for 2
+        # pixels, and also not for a trailing incomplete group:
+        nr_values = nr_bytes * pf_proxy.nr_components
+        if nr_values == int(nr_values):
+            nr_bytes = pf_proxy.packed_size(int(nr_values))
+        else:
+            nr_bytes = ceil(nr_bytes * pf_proxy.depth_in_byte)
+    else:
+        nr_bytes *= pf_proxy.alignment.unpacked_size
+        nr_bytes *= pf_proxy.nr_components
+    #
+    return int(nr_bytes)
+
+
+class DecodePlan:
+    """
+    Holds what is needed to decode the images of a pixel format and a
+    geometry; it is computed once and is shared by the following images of
+    the same geometry. See :func:`get_decode_plan`.
+    """
+    def __init__(
+            self, pf_proxy: _PixelFormat, width: int, height: int,
+            x_padding: int = 0, y_padding: int = 0):
+        """
+        :param pf_proxy: Set the pixel format.
+        :param width: Set the width of the image.
+        :param height: Set the height of the image.
+        :param x_padding: Set the number of bytes that pad every line.
+        :param y_padding: Set the number of bytes that pad the image.
+        """
+        #
+        super().__init__()
+        #
+        self._proxy = pf_proxy
+        self._width = width
+        self._height = height
+        self._x_padding = x_padding
+        self._y_padding = y_padding
+        #
+        self._nr_bytes = get_nr_bytes(pf_proxy, width, height) + y_padding
+        self._shape = pf_proxy.get_image_shape(width, height)
+        self._dtype = numpy.dtype(pf_proxy.alignment.unpacked_dtype)
+        self._pool = ArrayPool()
+
+    def decode(
+            self, array: numpy.ndarray,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Expands the given data to a 1D array. If the data is packed and
+        :data:`out` is :const:`None`, the output is taken from the pool of
+        the plan; give it back calling :meth:`release` once you have done
+        with it.
+
+        :param array: Set a 1D uint8 array that holds the data.
+        :param out: Set an array to write the expanded data.
+
+        :return: The expanded data; it is :data:`out` if it is given.
+        :rtype: numpy.ndarray
+        """
+        if out is None and self._proxy.alignment.is_packed():
+            if self._proxy.is_planar:
+                nr_values = int(self._proxy.nr_components) * \
+                    self._width * self._height
+            else:
+                nr_values = self._proxy.expanded_size(array.shape[0])
+            out = self._pool.acquire(nr_values, self._dtype)
+
+        #
+        if self._proxy.is_planar:
+            planes = self._proxy.expand_planar(
+                array, self._width, self._height, out=out
+            )
+            return planes.reshape(-1) if out is None else out
+        return self._proxy.expand(array, out=out)
+
+    def release(self, array: numpy.ndarray) -> None:
+        """
+        Gives back an array that :meth:`decode` has taken from the pool; an
+        array that is a view of the given data is ignored. You must not
+        touch the array once it has been released.
+
+        :param array: Set the array to give back.
+
+        :return: None.
+        """
+        if array.base is None:
+            self._pool.release(array)
+
+    @property
+    def proxy(self) -> _PixelFormat:
+        return self._proxy
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def x_padding(self) -> int:
+        return self._x_padding
+
+    @property
+    def y_padding(self) -> int:
+        return self._y_padding
+
+    @property
+    def nr_bytes(self) -> int:
+        """
+        The number of bytes that an image occupies including the Y padding.
+
+        :getter: Returns itself.
+        :type: int
+        """
+        return self._nr_bytes
+
+    @property
+    def shape(self) -> tuple:
+        """
+        The shape of an image that :meth:`_PixelFormat.expand_image`
+        returns.
+
+        :getter: Returns itself.
+        :type: tuple
+        """
+        return self._shape
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self._dtype
+
+    @property
+    def pool(self) -> ArrayPool:
+        """
+        The pool of the arrays of the expanded images; :meth:`decode` takes
+        its output from it and it can be given to the methods that take a
+        pool.
+
+        :getter: Returns itself.
+        :type: ArrayPool
+        """
+        return self._pool
+
+
+# The plans are looked up by the pixel format and the geometry; the oldest
+# one is dropped when there are too many of them:
+_max_num_decode_plans = 16
+_decode_plans = {}
+_decode_plans_lock = Lock()
+
+
+def get_decode_plan(
+        pf_proxy: _PixelFormat, width: int, height: int,
+        x_padding: int = 0, y_padding: int = 0) -> DecodePlan:
+    """
+    Returns the decode plan of the given pixel format and geometry; it is
+    created at the first time it is requested.
+
+    :param pf_proxy: Set the pixel format.
+    :param width: Set the width of the image.
+    :param height: Set the height of the image.
+    :param x_padding: Set the number of bytes that pad every line.
+    :param y_padding: Set the number of bytes that pad the image.
+
+    :return: The decode plan.
+    :rtype: DecodePlan
+    """
+    key = (pf_proxy, width, height, x_padding, y_padding)
+    plan = _decode_plans.get(key)
+    if plan is not None:
+        return plan
+
+    #
+    plan = DecodePlan(pf_proxy, width, height, x_padding, y_padding)
+    with _decode_plans_lock:
+        if len(_decode_plans) >= _max_num_decode_plans:
+            del _decode_plans[next(iter(_decode_plans))]
+        return _decode_plans.setdefault(key, plan)
+
+
+def clear_decode_plans() -> None:
+    """
+    Drops all decode plans; the plans are created again on demand.
+
+    :return: None.
+    """
+    with _decode_plans_lock:
+        _decode_plans.clear()
+
+
+def expand_batch(
+        pf_proxy: _PixelFormat, arrays, width: int, height: int,
+        out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Expands the given images of the same pixel format and size to a single
+    array that stacks them, so that there is no need to stack them later.
+    The images are unpacked by a single call if every image consists of
+    whole packed groups.
+
+    :param pf_proxy: Set the pixel format.
+    :param arrays: Set a list of 1D uint8 arrays, or a (N, bytes) uint8 array, that hold the images.
+    :param width: Set the width of the images.
+    :param height: Set the height of the images.
+    :param out: Set a C contiguous array of the unpacked data type to write the images; it is shaped as (N, height, width, components), or (N, components, height, width) if it is a planar format, and the components axis is dropped if there is only one.
+
+    :return: The images; it is :data:`out` if it is given.
+    :rtype: numpy.ndarray
+    """
+    #
+    plan = get_decode_plan(pf_proxy, width, height)
+    nr_images, nr_bytes = len(arrays), get_nr_bytes(pf_proxy, width, height)
+    shape = (nr_images,) + plan.shape
+    size = nr_images * int(numpy.prod(plan.shape))
+    images = pf_proxy._get_output(out, size, plan.dtype).reshape(shape)
+    for array in arrays:
+        if array.shape[0] < nr_bytes:
+            raise ValueError('The data is shorter than the image.')
+
+    # Unpacked images are copied to the output as they are; an image of a
+    # fractional number of components per pixel may not fill the last byte:
+    if not pf_proxy.alignment.is_packed():
+        rows = images.reshape(nr_images, -1).view(numpy.uint8)
+        for row, array in zip(rows, arrays):
+            row[:] = array[:row.shape[0]]
+        return images if out is None else out
+
+    #
+    if pf_proxy.is_planar or nr_bytes % pf_proxy._nr_packed or \
+            pf_proxy.expanded_size(nr_bytes) * nr_images != size:
+        # The images can not be joined because a group would straddle
+        # two images:
+        for image, array in zip(images, arrays):
+            pf_proxy.expand_image(array[:nr_bytes], width, height, out=image)
+        return images if out is None else out
+
+    #
+    if isinstance(arrays, numpy.ndarray) and arrays.ndim == 2 and \
+            arrays.shape[1] == nr_bytes and arrays.flags.c_contiguous:
+        packed = arrays.reshape(-1)
+    else:
+        packed = numpy.empty((nr_images, nr_bytes), dtype=numpy.uint8)
+        for row, array in zip(packed, arrays):
+            row[:] = array[:nr_bytes]
+        packed = packed.reshape(-1)
+    pf_proxy.expand(packed, out=images.reshape(-1))
+    return images if out is None else out
+
+
 class Dictionary:
     _pixel_formats = [
         Mono8(),
@@ -3060,9 +5148,9 @@ class Dictionary:
         Confidence8(),
         Confidence16(),
         Confidence32f(),
-        # Mono1p(),
-        # Mono2p(),
-        # Mono4p(),
+        Mono1p(),
+        Mono2p(),
+        Mono4p(),
         Mono10Packed(),
         Mono10p(),
         Mono12Packed(),
@@ -3079,6 +5167,10 @@ class Dictionary:
         RGB12(),
         RGB14(),
         RGB16(),
+        RGB8_Planar(),
+        RGB10_Planar(),
+        RGB12_Planar(),
+        RGB16_Planar(),
         BGR8(),
         BGR10(),
         BGR12(),
@@ -3090,11 +5182,13 @@ class Dictionary:
         Coord3D_ABC16_Planar(),
         Coord3D_ABC32f(),
         Coord3D_ABC32f_Planar(),
-        # RGB8Packed(),
+        RGB8Packed(),
         Coord3D_ABC10p(),
         Coord3D_ABC10p_Planar(),
         Coord3D_ABC12p(),
         Coord3D_ABC12p_Planar(),
+        RGB10V1Packed(),
+        RGB12V1Packed(),
         YUV422_8_UYVY(),
         YUV422_8(),
         YCbCr422_8(),
@@ -3201,6 +5295,14 @@ class Dictionary:
         BayerRG12p(),
     ]
 
+    # Index the proxies so that a per-frame look-up does not have to walk
+    # through the whole list:
+    _proxies_by_symbolic = {pf.symbolic: pf for pf in _pixel_formats}
+    _proxies_by_value = {
+        dict_by_names[pf.symbolic]: pf for pf in _pixel_formats
+        if pf.symbolic in dict_by_names
+    }
+
     def __init__(self):
         #
         super().__init__()
@@ -3210,14 +5312,209 @@ class Dictionary:
         pass
 
     @classmethod
-    def get_proxy(cls, symbolic: str):
+    def get_proxy(cls, symbolic: str) -> Optional[_PixelFormat]:
+        """
+        Returns the pixel format proxy that corresponds to the given
+        symbolic name.
+
+        :param symbolic: Set the PFNC symbolic name, e.g., 'Mono8'.
+
+        :return: The proxy object. :const:`None` if it is not registered.
+        :rtype: _PixelFormat
+        """
+        return cls._proxies_by_symbolic.get(symbolic)
+
+    @classmethod
+    def get_proxy_by_value(cls, value: int) -> Optional[_PixelFormat]:
+        """
+        Returns the pixel format proxy that corresponds to the given
+        PFNC integer value.
+
+        :param value: Set the PFNC integer value, e.g., 0x01080001.
+
+        :return: The proxy object. :const:`None` if it is not registered.
+        :rtype: _PixelFormat
+        """
+        return cls._proxies_by_value.get(value)
+
+    @classmethod
+    def register(
+            cls, pixel_format: _PixelFormat,
+            value: Optional[int] = None, is_2d: bool = True) -> None:
+        """
+        Registers a pixel format proxy so that it can be looked up by its
+        symbolic name and, if it is known, by its integer value. It is
+        typically used to support a custom or vendor specific pixel format;
+        registering a proxy that has the same symbolic name as a registered
+        one replaces the registered one.
+
+        :param pixel_format: Set the proxy object to register.
+        :param value: Set the integer value that represents the pixel format. It is mandatory for a pixel format that is not defined by PFNC.
+        :param is_2d: Set :const:`True` if it is a 2D image format.
+
+        :return: None.
+        """
+        #
+        symbolic = pixel_format.symbolic
+        registered_value = dict_by_names.get(symbolic)
+        if value is None:
+            value = registered_value
+
+        #
+        if value is not None:
+            _symbolic = dict_by_ints.get(value)
+            if _symbolic is not None and _symbolic != symbolic:
+                raise ValueError(
+                    '{0:#010x} has been already assigned to {1}.'.format(
+                        value, _symbolic
+                    )
+                )
+            # The value that the name used to have must not be mapped
+            # anymore:
+            if registered_value is not None and registered_value != value:
+                cls._remove_value(registered_value)
+            dict_by_ints[value] = symbolic
+            dict_by_names[symbolic] = value
+            cls._proxies_by_value[value] = pixel_format
+
+        #
+        registered = cls._proxies_by_symbolic.get(symbolic)
+        if registered is not None:
+            cls._pixel_formats.remove(registered)
+        cls._pixel_formats.append(pixel_format)
+        cls._proxies_by_symbolic[symbolic] = pixel_format
+
+        #
+        if is_2d:
+            if symbolic not in component_2d_formats:
+                component_2d_formats.append(symbolic)
+        elif symbolic in component_2d_formats:
+            component_2d_formats.remove(symbolic)
+        _add_pixel_format_info(symbolic, value)
+
+    @classmethod
+    def unregister(cls, symbolic: str) -> None:
+        """
+        Unregisters a pixel format so that it can't be looked up anymore;
+        it is the counterpart of :meth:`register`.
+
+        :param symbolic: Set the symbolic name of the pixel format.
+
+        :return: None.
+        """
+        #
+        value = dict_by_names.pop(symbolic, None)
+        if value is not None:
+            cls._remove_value(value)
+
         #
-        _pf = None
-        for pf in cls._pixel_formats:
-            if symbolic == pf.symbolic:
-                _pf = pf
-                break
+        registered = cls._proxies_by_symbolic.pop(symbolic, None)
+        if registered is not None:
+            cls._pixel_formats.remove(registered)
+
         #
-        return _pf
+        if symbolic in component_2d_formats:
+            component_2d_formats.remove(symbolic)
+        _pixel_format_infos.pop(symbolic, None)
+
+    @classmethod
+    def _remove_value(cls, value: int) -> None:
+        dict_by_ints.pop(value, None)
+        cls._proxies_by_value.pop(value, None)
+        _pixel_format_infos.pop(value, None)
+
+
+# ----
+
+
+class PixelFormatInfo(NamedTuple):
+    """
+    Holds the metadata of a pixel format; see :func:`get_pixel_format_info`.
+    """
+    #: The PFNC symbolic name.
+    symbolic: str
+    #: The integer value; :const:`None` if it only has a name.
+    value: Optional[int]
+    #: The number of used bits per component; :const:`None` if unknown.
+    bits_per_pixel: Optional[int]
+    #: The number of bits that a pixel occupies; 0 if unknown.
+    effective_size: int
+    #: :const:`True` if the data is packed.
+    is_packed: bool
+    #: The number of components per pixel; 0 if unknown.
+    nr_components: float
+    #: The data type of the expanded data; :const:`None` if unknown.
+    dtype: Optional[numpy.dtype]
+    #: The pixel location; :const:`None` if unknown.
+    location: Optional[_Location]
+    #: :const:`True` if it is delivered as a 2D image component.
+    is_2d: bool
+
+
+# The records are looked up by the integer value and by the name; they are
+# created once and are never modified:
+_pixel_format_infos = {}
+pixel_format_infos = MappingProxyType(_pixel_format_infos)
+_bits_per_pixel_formats = (
+    (8, component_8bit_formats), (10, component_10bit_formats),
+    (12, component_12bit_formats), (14, component_14bit_formats),
+    (16, component_16bit_formats),
+)
+
+
+def _create_pixel_format_info(
+        symbolic: str, value: Optional[int]) -> PixelFormatInfo:
+    #
+    bits_per_pixel = None
+    for nr_bits, formats in _bits_per_pixel_formats:
+        if symbolic in formats:
+            bits_per_pixel = nr_bits
+            break
+
+    #
+    proxy = Dictionary.get_proxy(symbolic)
+    return PixelFormatInfo(
+        symbolic=symbolic,
+        value=value,
+        bits_per_pixel=bits_per_pixel,
+        effective_size=(
+            get_effective_pixel_size(value) if value is not None else 0
+        ),
+        is_packed=proxy.alignment.is_packed() if proxy else False,
+        nr_components=proxy.nr_components if proxy else 0,
+        dtype=(
+            numpy.dtype(proxy.alignment.unpacked_dtype) if proxy else None
+        ),
+        location=proxy.location if proxy else None,
+        is_2d=symbolic in component_2d_formats
+    )
+
+
+def _add_pixel_format_info(symbolic: str, value: Optional[int]) -> None:
+    info = _create_pixel_format_info(symbolic, value)
+    _pixel_format_infos[symbolic] = info
+    if value is not None:
+        _pixel_format_infos[value] = info
+
+
+def get_pixel_format_info(
+        data_format: Union[int, str]) -> Optional[PixelFormatInfo]:
+    """
+    Returns the metadata of the given pixel format in constant time.
+
+    :param data_format: Set the PFNC integer value or the symbolic name.
+
+    :return: The metadata. :const:`None` if the pixel format is unknown.
+    :rtype: PixelFormatInfo
+    """
+    return _pixel_format_infos.get(data_format)
+
+
+for _value, _symbolic in symbolics.items():
+    _add_pixel_format_info(_symbolic, _value)
+for _proxy in Dictionary._pixel_formats:
+    if _proxy.symbolic not in _pixel_format_infos:
+        _add_pixel_format_info(_proxy.symbolic, None)
+del _value, _symbolic, _proxy
 
 